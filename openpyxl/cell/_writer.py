@@ -23,6 +23,12 @@ def _set_attributes(cell, styled=None):
 
     value = cell._value
 
+    if cell.data_type == "s" and value:
+        wb = cell.parent.parent
+        if getattr(wb, "use_shared_strings", False):
+            attrs['t'] = "s"
+            value = wb.shared_strings.add(value)
+
     if cell.data_type == "d":
         if hasattr(value, "tzinfo") and value.tzinfo is not None:
             raise TypeError("Excel does not support timezones in datetimes. "
@@ -56,7 +62,7 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             formula.text = value[1:]
             value = None
 
-    if cell.data_type == 's':
+    if attributes.get('t') == "inlineStr":
         inline_string = SubElement(el, 'is')
         text = SubElement(inline_string, 't')
         text.text = value
@@ -86,7 +92,7 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                     xf.write(value[1:])
                     value = None
 
-        if cell.data_type == 's':
+        if attributes.get('t') == "inlineStr":
             with xf.element("is"):
                 attrs = {}
                 if value != value.strip():
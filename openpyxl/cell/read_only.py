@@ -13,11 +13,10 @@ class ReadOnlyCell(object):
 
     def __init__(self, sheet, row, column, value, data_type='n', style_id=0):
         self.parent = sheet
-        self._value = None
         self.row = row
         self.column = column
         self.data_type = data_type
-        self.value = value
+        self._value = value
         self._style_id = style_id
 
 
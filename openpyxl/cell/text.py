@@ -5,6 +5,7 @@ Richtext definition
 """
 
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.slots import get_descriptor
 from openpyxl.descriptors import (
     Alias,
     Typed,
@@ -71,20 +72,20 @@ class InlineFont(Font):
     tagname = "RPrElt"
 
     rFont = NestedString(allow_none=True)
-    charset = Font.charset
-    family = Font.family
-    b =Font.b
-    i = Font.i
-    strike = Font.strike
-    outline = Font.outline
-    shadow = Font.shadow
-    condense = Font.condense
-    extend = Font.extend
-    color = Font.color
-    sz = Font.sz
-    u = Font.u
-    vertAlign = Font.vertAlign
-    scheme = Font.scheme
+    charset = get_descriptor(Font, "charset")
+    family = get_descriptor(Font, "family")
+    b = get_descriptor(Font, "b")
+    i = get_descriptor(Font, "i")
+    strike = get_descriptor(Font, "strike")
+    outline = get_descriptor(Font, "outline")
+    shadow = get_descriptor(Font, "shadow")
+    condense = get_descriptor(Font, "condense")
+    extend = get_descriptor(Font, "extend")
+    color = get_descriptor(Font, "color")
+    sz = get_descriptor(Font, "sz")
+    u = get_descriptor(Font, "u")
+    vertAlign = get_descriptor(Font, "vertAlign")
+    scheme = get_descriptor(Font, "scheme")
 
     __elements__ = ('rFont', 'charset', 'family', 'b', 'i', 'strike',
                     'outline', 'shadow', 'condense', 'extend', 'color', 'sz', 'u',
@@ -136,6 +136,7 @@ class ExternalData(Serialisable):
 class ChartSpace(Serialisable):
 
     tagname = "chartSpace"
+    xmlns = CHART_NS
 
     date1904 = NestedBool(allow_none=True)
     lang = NestedString(allow_none=True)
@@ -187,9 +188,3 @@ class ChartSpace(Serialisable):
         self.externalData = externalData
         self.printSettings = printSettings
         self.userShapes = userShapes
-
-
-    def to_tree(self, tagname=None, idx=None, namespace=None):
-        tree = super(ChartSpace, self).to_tree()
-        tree.set("xmlns", CHART_NS)
-        return tree
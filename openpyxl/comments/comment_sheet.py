@@ -145,6 +145,7 @@ class CommentRecord(Serialisable):
 class CommentSheet(Serialisable):
 
     tagname = "comments"
+    xmlns = SHEET_MAIN_NS
 
     authors = Typed(expected_type=AuthorList)
     commentList = NestedSequence(expected_type=CommentRecord, count=0)
@@ -167,12 +168,6 @@ class CommentSheet(Serialisable):
         self.commentList = commentList
 
 
-    def to_tree(self):
-        tree = super(CommentSheet, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
-
-
     @property
     def comments(self):
         """
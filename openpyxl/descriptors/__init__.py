@@ -46,12 +46,15 @@ class MetaSerialisable(type):
             methods['__nested__'] = tuple(sorted(nested))
         if methods.get('__elements__') is None:
             methods['__elements__'] = tuple(sorted(elements))
+        # not inherited as subclasses can have other descriptors
+        methods['__parser__'] = None
+        methods['__writer__'] = None
         return MetaStrict.__new__(cls, clsname, bases, methods)
 
 
 Strict = MetaStrict('Strict', (object,), {})
 
-_Serialiasable = MetaSerialisable('_Serialisable', (object,), {})
+_Serialiasable = MetaSerialisable('_Serialisable', (object,), {'__slots__': ()})
 
 #del MetaStrict
 #del MetaSerialisable
@@ -4,23 +4,621 @@ from copy import copy
 from keyword import kwlist
 KEYWORDS = frozenset(kwlist)
 
-from . import Descriptor
 from . import _Serialiasable
+from .base import (
+    Descriptor,
+    Alias,
+    Typed,
+    Convertible,
+    Min,
+    Max,
+    Set,
+    NoneSet,
+    Bool,
+    MatchPattern,
+    Length,
+    DateTime,
+    _convert,
+)
 from .sequence import (
     Sequence,
     NestedSequence,
+    MultiSequence,
     MultiSequencePart,
+    ValueSequence,
 )
 from .namespace import namespaced
+from .nested import Nested, NestedText, EmptyTag
+from .slots import FROZEN, get_descriptor, _new as _new_slotted
 
 from openpyxl.compat import safe_string
+from openpyxl.utils.datetime import from_ISO8601
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.xml.constants import XML_NS
 from openpyxl.xml.functions import (
     Element,
     localname,
 )
+from openpyxl.xml._markup import Markup
 
 seq_types = (list, tuple)
 
+
+# conversions done by descriptors for values read from files, without the
+# checks apart from missing values and sets of values. Each is called with
+# the descriptor and the value.
+
+def _check_required(desc, value):
+    if value is None and not desc.allow_none:
+        raise TypeError('expected ' + str(desc.expected_type))
+    return value
+
+
+def _check_set(desc, value):
+    if value not in desc.values:
+        raise ValueError(desc.__doc__)
+    return value
+
+
+def _convert_type(desc, value):
+    if value is None and desc.allow_none:
+        return value
+    return _convert(desc.expected_type, value)
+
+
+def _convert_none(desc, value):
+    if value == 'none':
+        value = None
+    return value
+
+
+def _convert_bool(desc, value):
+    if isinstance(value, str) and value in ('false', 'f', '0'):
+        value = False
+    return value
+
+
+def _convert_datetime(desc, value):
+    if isinstance(value, str):
+        value = from_ISO8601(value)
+    return value
+
+
+def _convert_nested(desc, value):
+    if hasattr(value, "tag"):
+        value = desc.from_tree(value)
+    return value
+
+
+def _convert_sequence(desc, seq):
+    seq = [_convert(desc.expected_type, value) for value in seq]
+    if desc.unique:
+        seq = IndexedList(seq)
+    return seq
+
+
+def _convert_list(desc, seq):
+    return list(seq)
+
+
+# __set__ methods with the conversion they do, if any, and whether they
+# assign the value rather than pass it on to the next class
+_CONVERSIONS = {
+    Descriptor.__set__: (None, True),
+    Typed.__set__: (_check_required, False),
+    Convertible.__set__: (_convert_type, False),
+    Min.__set__: (_convert_type, False),
+    Max.__set__: (_convert_type, False),
+    Set.__set__: (_check_set, False),
+    NoneSet.__set__: (_convert_none, False),
+    Bool.__set__: (_convert_bool, False),
+    MatchPattern.__set__: (None, False),
+    Length.__set__: (None, False),
+    DateTime.__set__: (_convert_datetime, False),
+    Nested.__set__: (_convert_nested, False),
+    Sequence.__set__: (_convert_sequence, False),
+    MultiSequence.__set__: (_convert_list, True),
+}
+
+
+def _conversions(desc):
+    """
+    Conversions done when a value is assigned to a descriptor, in order.
+    None if the descriptor does something else.
+    """
+    steps = []
+    for klass in type(desc).__mro__:
+        method = vars(klass).get("__set__")
+        if method is None:
+            continue
+        if method not in _CONVERSIONS:
+            return None
+        step, final = _CONVERSIONS[method]
+        if step is _check_required and desc.allow_none:
+            step = None
+        if step is not None and step not in steps:
+            steps.append(step)
+        if final:
+            return tuple(steps)
+    return None
+
+
+class _Trusted:
+    """
+    Assignment with the conversions of a descriptor but without its checks
+    """
+
+    __slots__ = ("name", "desc", "steps", "none")
+
+    def __init__(self, name, desc, steps):
+        self.name = name
+        self.desc = desc
+        self.steps = steps
+        # whether None is assigned as it is
+        self.none = (_convert_sequence not in steps
+                     and _convert_list not in steps
+                     and _check_required not in steps
+                     and _check_set not in steps
+                     and (_convert_type not in steps or desc.allow_none))
+
+
+    def __set__(self, instance, value):
+        if value is not None or not self.none:
+            desc = self.desc
+            for step in self.steps:
+                value = step(desc, value)
+        instance.__dict__[self.name] = value
+
+
+    def convert(self, value):
+        if value is not None or not self.none:
+            desc = self.desc
+            for step in self.steps:
+                value = step(desc, value)
+        return value
+
+
+def _trusted(name, desc):
+    """
+    What assigns values read from a file to a descriptor: None if they are
+    assigned as they are, the descriptor itself if it does more than convert
+    them
+    """
+    steps = _conversions(desc)
+    if steps is None:
+        return desc
+    elif steps:
+        return _Trusted(name, desc, steps)
+    return None
+
+
+def _trusted_class(cls):
+    """
+    Subclass for calling __init__ with values read from a file. Descriptors
+    that only convert values are replaced by ones that do not check them,
+    or by nothing if there is nothing to convert.
+    """
+    if cls.__new__ is not object.__new__ and cls.__new__ is not _new_slotted:
+        return None
+    shadow = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            shadow.pop(name, None)
+            if not isinstance(value, Descriptor) or isinstance(value, Alias):
+                continue
+            trusted = _trusted(name, value)
+            if trusted is not value:
+                shadow[name] = trusted
+    setters = getattr(cls, "__setters__", None)
+    if setters is not None:
+        # values kept in slots are converted by __setattr__
+        shadow["__setters__"] = setters = dict(setters)
+        for name, desc in cls.__descriptors__.items():
+            trusted = _trusted(name, desc)
+            if trusted is not desc:
+                setters[name] = trusted
+    shadow["__slots__"] = ()
+    return type.__new__(type(cls), cls.__name__, (cls,), shadow)
+
+
+class _TreeParser:
+    """
+    How the attributes and child elements of a class are read from XML,
+    worked out once per class and for each name as it is first seen
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.namespaced = {ns:key for key, ns in cls.__namespaced__}
+        self.text = "attr_text" in cls.__attrs__
+        self.keys = {}
+        self.children = {}
+        self.trusted = _trusted_class(cls)
+
+
+    def _key(self, key):
+        """
+        Argument for an attribute, None if it is to be ignored
+        """
+        if key.startswith('{'):
+            # namespaced attributes are added after the others
+            return None
+        elif key in KEYWORDS:
+            return "_" + key
+        elif "-" in key:
+            return key.replace("-", "_")
+        return key
+
+
+    def _child(self, el):
+        """
+        Argument for a child element, whether it is part of a list, and how
+        it is converted. None if it is to be ignored
+        """
+        tag = localname(el)
+        if tag in KEYWORDS:
+            tag = "_" + tag
+        desc = get_descriptor(self.cls, tag)
+        if desc is None or isinstance(desc, property):
+            return None
+
+        if hasattr(desc, 'from_tree'):
+            #descriptor manages conversion
+            convert = desc.from_tree
+        elif hasattr(desc.expected_type, "from_tree"):
+            #complex type
+            convert = desc.expected_type.from_tree
+        else:
+            #primitive
+            convert = _text
+
+        if isinstance(desc, NestedSequence):
+            return tag, False, convert
+        elif isinstance(desc, Sequence):
+            return tag, True, convert
+        elif isinstance(desc, MultiSequencePart):
+            return desc.store, True, convert
+        return tag, False, convert
+
+
+    def parse(self, node):
+        """
+        Arguments for the class from an element
+        """
+        keys = self.keys
+        attrib = {}
+        for key, value in node.attrib.items():
+            try:
+                name = keys[key]
+            except KeyError:
+                name = keys[key] = self._key(key)
+            if name is not None:
+                attrib[name] = value
+        if self.namespaced:
+            for ns, key in self.namespaced.items():
+                value = node.get(ns)
+                if value is not None:
+                    attrib[key] = value
+
+        if self.text and node.text:
+            attrib["attr_text"] = node.text
+
+        children = self.children
+        for el in node:
+            try:
+                child = children[el.tag]
+            except KeyError:
+                child = children[el.tag] = self._child(el)
+            if child is None:
+                continue
+            name, many, convert = child
+            obj = convert(el)
+            if many:
+                if name in attrib:
+                    attrib[name].append(obj)
+                else:
+                    attrib[name] = [obj]
+            else:
+                attrib[name] = obj
+        return attrib
+
+
+    def create(self, attrib):
+        """
+        Create an object from arguments read from XML. Values are converted
+        but not checked unless that fails.
+        """
+        trusted = self.trusted
+        if trusted is None:
+            return self.cls(**attrib)
+        obj = trusted.__new__(trusted)
+        try:
+            obj.__init__(**attrib)
+        except Exception:
+            return self.cls(**attrib)
+        obj.__class__ = self.cls
+        return obj
+
+
+def _text(node):
+    return node.text
+
+
+def _write(out, obj, tagname, namespace, args=(), kw=None):
+    """
+    Write an object as XML. Objects that are not written by
+    Serialisable.to_tree are written from the tree they return, so args and
+    kw are those that to_tree would have been called with.
+    """
+    cls = obj.__class__
+    writer = getattr(cls, "__writer__", False)
+    if writer is None:
+        writer = cls.__writer__ = _TreeWriter(cls)
+    if writer and writer.direct:
+        writer.write(obj, out, tagname, namespace)
+    else:
+        node = obj.to_tree(*args, **(kw or {}))
+        if node is not None:
+            out.element(node)
+
+
+# equivalents of the to_tree methods of descriptors
+
+def _write_nested(desc, out, tagname, value, namespace):
+    namespace = getattr(desc, "namespace", namespace)
+    if value is not None:
+        if namespace is not None:
+            tagname = "{%s}%s" % (namespace, tagname)
+        out.end(out.start(tagname, {desc.attribute: safe_string(value)}))
+
+
+def _write_nested_text(desc, out, tagname, value, namespace):
+    namespace = getattr(desc, "namespace", namespace)
+    if value is not None:
+        if namespace is not None:
+            tagname = "{%s}%s" % (namespace, tagname)
+        value = safe_string(value)
+        attrs = {}
+        if value != value.strip():
+            attrs["{%s}space" % XML_NS] = "preserve"
+        name = out.start(tagname, attrs)
+        out.text(value)
+        out.end(name)
+
+
+def _write_empty_tag(desc, out, tagname, value, namespace):
+    if value:
+        namespace = getattr(desc, "namespace", namespace)
+        if namespace is not None:
+            tagname = "{%s}%s" % (namespace, tagname)
+        out.end(out.start(tagname, {}))
+
+
+def _write_sequence(desc, out, tagname, seq, namespace):
+    for idx, v in enumerate(seq, desc.idx_base):
+        if hasattr(v, "to_tree"):
+            _write(out, v, tagname, None, (tagname, idx))
+        else:
+            tagname = namespaced(seq, tagname, namespace)
+            name = out.start(tagname, {})
+            out.text(safe_string(v))
+            out.end(name)
+
+
+def _write_value_sequence(desc, out, tagname, seq, namespace):
+    tagname = namespaced(desc, tagname, namespace)
+    for v in seq:
+        out.end(out.start(tagname, {desc.attribute:safe_string(v)}))
+
+
+def _write_nested_sequence(desc, out, tagname, seq, namespace):
+    tagname = namespaced(desc, tagname, namespace)
+    attrs = {}
+    if desc.count:
+        attrs['count'] = str(len(seq))
+    name = out.start(tagname, attrs)
+    for v in seq:
+        _write(out, v, None, None)
+    out.end(name)
+
+
+def _write_multi_sequence(desc, out, tagname, seq, namespace):
+    for v in seq:
+        _write(out, v, None, namespace, kw={"namespace": namespace})
+
+
+def _write_node(desc, out, tagname, value, namespace):
+    node = desc.to_tree(tagname, value, namespace)
+    if node is not None:
+        out.element(node)
+
+
+def _write_nodes(desc, out, tagname, value, namespace):
+    for node in desc.to_tree(tagname, value, namespace):
+        out.element(node)
+
+
+_WRITERS = {
+    Nested.to_tree: _write_nested,
+    NestedText.to_tree: _write_nested_text,
+    EmptyTag.to_tree: _write_empty_tag,
+    Sequence.to_tree: _write_sequence,
+    ValueSequence.to_tree: _write_value_sequence,
+    NestedSequence.to_tree: _write_nested_sequence,
+    MultiSequence.to_tree: _write_multi_sequence,
+}
+
+_NONE_SAFE = (Nested.to_tree, NestedText.to_tree, EmptyTag.to_tree)
+
+
+class _TreeWriter:
+    """
+    How the attributes and child elements of a class are written to XML,
+    worked out once per class
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        namespaced = dict(cls.__namespaced__)
+        # whether the class can be written without building a tree
+        self.direct = cls.to_tree is Serialisable.to_tree
+
+        # attributes are written as dict(obj) if __iter__ is overridden
+        self.custom = cls.__iter__ is not Serialisable.__iter__
+        self.namespaced = cls.__namespaced__
+        self.declared = cls.__attrs__
+        self.plain = []
+        moved = {}
+        for attr in cls.__attrs__:
+            if attr == "attr_text":
+                continue
+            name = attr
+            if attr.startswith("_"):
+                name = attr[1:]
+            elif "_" in attr:
+                desc = get_descriptor(cls, attr)
+                if getattr(desc, "hyphenated", False):
+                    name = attr.replace("_", "-")
+            if name in namespaced:
+                moved[name] = (attr, namespaced[name])
+            else:
+                self.plain.append((attr, name))
+        # namespaced attributes come last
+        self.moved = [moved[key] for key, ns in cls.__namespaced__ if key in moved]
+
+        self.elements = cls.__elements__
+        self.default = self._plan(self.elements)
+        self._children = {}
+
+
+    def _plan(self, elements):
+        cls = self.cls
+        children = []
+        for child_tag in elements:
+            desc = get_descriptor(cls, child_tag)
+            if isinstance(desc, NestedSequence):
+                kind = NestedSequence
+            elif isinstance(desc, Sequence):
+                kind = Sequence
+            else:
+                kind = None
+            nested = child_tag in cls.__nested__
+            # whether None is written as nothing
+            to_tree = getattr(getattr(desc, "to_tree", None), "__func__", None)
+            skip_none = not nested or to_tree in _NONE_SAFE
+            write = _WRITERS.get(to_tree)
+            if write is None:
+                write = _write_nodes if kind is Sequence else _write_node
+            children.append((child_tag, desc, kind, nested,
+                             hasattr(desc, "namespace"), skip_none, write))
+        return children
+
+
+    def children(self, obj):
+        """
+        Child elements of an object, which can have its own __elements__
+        """
+        elements = obj.__elements__
+        if elements is self.elements:
+            return self.default
+        key = tuple(elements)
+        children = self._children.get(key)
+        if children is None:
+            children = self._children[key] = self._plan(elements)
+        return children
+
+
+    def attrs(self, obj):
+        """
+        Attributes of an object as strings
+        """
+        if self.custom or obj.__attrs__ is not self.declared:
+            attrs = dict(obj)
+            for key, ns in self.namespaced:
+                if key in attrs:
+                    attrs[ns] = attrs[key]
+                    del attrs[key]
+            return attrs
+
+        attrs = {}
+        for attr, name in self.plain:
+            value = getattr(obj, attr)
+            if value is not None:
+                attrs[name] = value if value.__class__ is str else safe_string(value)
+        for attr, name in self.moved:
+            value = getattr(obj, attr)
+            if value is not None:
+                attrs[name] = value if value.__class__ is str else safe_string(value)
+        return attrs
+
+
+    def write(self, obj, out, tagname=None, namespace=None):
+        """
+        Write an object as Serialisable.to_tree would build it
+        """
+        if tagname is None:
+            tagname = obj.tagname
+
+        # keywords have to be masked
+        if tagname.startswith("_"):
+            tagname = tagname[1:]
+
+        tagname = namespaced(obj, tagname, namespace)
+        namespace = getattr(obj, "namespace", namespace)
+
+        attrs = self.attrs(obj)
+        if obj.xmlns is not None:
+            attrs["xmlns"] = obj.xmlns
+        name = out.start(tagname, attrs)
+        if "attr_text" in obj.__attrs__:
+            out.text(safe_string(getattr(obj, "attr_text")))
+
+        for child_tag, desc, kind, nested, set_namespace, skip_none, write in self.children(obj):
+            value = getattr(obj, child_tag)
+            if value is None and skip_none:
+                continue
+            if set_namespace and hasattr(value, 'namespace'):
+                value.namespace = desc.namespace
+
+            if isinstance(value, seq_types):
+                if kind is NestedSequence:
+                    if value:
+                        write(desc, out, child_tag, value, namespace)
+                elif kind is Sequence:
+                    desc.idx_base = obj.idx_base
+                    write(desc, out, child_tag, value, namespace)
+                else:
+                    for v in value:
+                        _write(out, v, child_tag, None, (child_tag, namespace))
+            elif nested:
+                write(desc, out, child_tag, value, namespace)
+            elif value is not None:
+                _write(out, value, child_tag, None, (child_tag,))
+        out.end(name)
+
+
+class _Frozen(dict):
+    """
+    Values of an object that can no longer be changed
+    """
+
+    __slots__ = ()
+
+    def __setitem__(self, key, value):
+        raise AttributeError(FROZEN)
+
+
+    def __delitem__(self, key):
+        raise AttributeError(FROZEN)
+
+
+    def __reduce__(self):
+        # copies can be changed
+        values = dict(self)
+        del values["_hash"]
+        return dict, (values,)
+
+
 class Serialisable(_Serialiasable):
     """
     Objects can serialise to XML their attributes and child objects.
@@ -28,82 +626,46 @@ class Serialisable(_Serialiasable):
     __attrs__ = attributes
     __nested__ = single-valued child treated as an attribute
     __elements__ = child elements
+    __parser__ = how to read the class from XML, created when first used
+    __writer__ = how to write the class as XML, created when first used
     """
 
+    __slots__ = ()
+
     __attrs__ = None
     __nested__ = None
     __elements__ = None
     __namespaced__ = None
+    __parser__ = None
+    __writer__ = None
 
     idx_base = 0
+    # remembered once the object is frozen
+    _hash = None
 
     @property
     def tagname(self):
         raise(NotImplementedError)
 
     namespace = None
+    # default namespace declared by the element
+    xmlns = None
 
     @classmethod
     def from_tree(cls, node):
         """
         Create object from XML
         """
-        # strip known namespaces from attributes
-        attrib = dict(node.attrib)
-        for key, ns in cls.__namespaced__:
-            if ns in attrib:
-                attrib[key] = attrib[ns]
-                del attrib[ns]
-
-        # strip attributes with unknown namespaces
-        for key in list(attrib):
-            if key.startswith('{'):
-                del attrib[key]
-            elif key in KEYWORDS:
-                attrib["_" + key] = attrib[key]
-                del attrib[key]
-            elif "-" in key:
-                n = key.replace("-", "_")
-                attrib[n] = attrib[key]
-                del attrib[key]
-
-        if node.text and "attr_text" in cls.__attrs__:
-            attrib["attr_text"] = node.text
-
-        for el in node:
-            tag = localname(el)
-            if tag in KEYWORDS:
-                tag = "_" + tag
-            desc = getattr(cls, tag, None)
-            if desc is None or isinstance(desc, property):
-                continue
-
-            if hasattr(desc, 'from_tree'):
-                #descriptor manages conversion
-                obj = desc.from_tree(el)
-            else:
-                if hasattr(desc.expected_type, "from_tree"):
-                    #complex type
-                    obj = desc.expected_type.from_tree(el)
-                else:
-                    #primitive
-                    obj = el.text
-
-            if isinstance(desc, NestedSequence):
-                attrib[tag] = obj
-            elif isinstance(desc, Sequence):
-                attrib.setdefault(tag, [])
-                attrib[tag].append(obj)
-            elif isinstance(desc, MultiSequencePart):
-                attrib.setdefault(desc.store, [])
-                attrib[desc.store].append(obj)
-            else:
-                attrib[tag] = obj
-
-        return cls(**attrib)
+        parser = cls.__parser__
+        if parser is None:
+            parser = cls.__parser__ = _TreeParser(cls)
+        return parser.create(parser.parse(node))
 
 
     def to_tree(self, tagname=None, idx=None, namespace=None):
+        writer = self.__writer__
+        if writer is None:
+            writer = self.__class__.__writer__ = _TreeWriter(self.__class__)
 
         if tagname is None:
             tagname = self.tagname
@@ -115,29 +677,26 @@ class Serialisable(_Serialiasable):
         tagname = namespaced(self, tagname, namespace)
         namespace = getattr(self, "namespace", namespace)
 
-        attrs = dict(self)
-        for key, ns in self.__namespaced__:
-            if key in attrs:
-                attrs[ns] = attrs[key]
-                del attrs[key]
-
-        el = Element(tagname, attrs)
+        el = Element(tagname, writer.attrs(self))
+        if self.xmlns is not None:
+            el.set("xmlns", self.xmlns)
         if "attr_text" in self.__attrs__:
             el.text = safe_string(getattr(self, "attr_text"))
 
-        for child_tag in self.__elements__:
-            desc = getattr(self.__class__, child_tag, None)
+        for child_tag, desc, kind, nested, set_namespace, skip_none, _ in writer.children(self):
             obj = getattr(self, child_tag)
-            if hasattr(desc, "namespace") and hasattr(obj, 'namespace'):
+            if obj is None and skip_none:
+                continue
+            if set_namespace and hasattr(obj, 'namespace'):
                 obj.namespace = desc.namespace
 
             if isinstance(obj, seq_types):
-                if isinstance(desc, NestedSequence):
+                if kind is NestedSequence:
                     # wrap sequence in container
                     if not obj:
                         continue
                     nodes = [desc.to_tree(child_tag, obj, namespace)]
-                elif isinstance(desc, Sequence):
+                elif kind is Sequence:
                     # sequence
                     desc.idx_base = self.idx_base
                     nodes = (desc.to_tree(child_tag, obj, namespace))
@@ -146,7 +705,7 @@ class Serialisable(_Serialiasable):
                 for node in nodes:
                     el.append(node)
             else:
-                if child_tag in self.__nested__:
+                if nested:
                     node = desc.to_tree(child_tag, obj, namespace)
                 elif obj is None:
                     continue
@@ -157,13 +716,25 @@ class Serialisable(_Serialiasable):
         return el
 
 
+    def to_xml(self, tagname=None, idx=None, namespace=None):
+        """
+        Serialise to XML as bytes without building a tree first
+        """
+        out = Markup()
+        args = (tagname, idx, namespace)
+        while args and args[-1] is None:
+            args = args[:-1]
+        _write(out, self, tagname, namespace, args)
+        return out.getvalue()
+
+
     def __iter__(self):
         for attr in self.__attrs__:
             value = getattr(self, attr)
             if attr.startswith("_"):
                 attr = attr[1:]
             elif attr != "attr_text" and "_" in attr:
-                desc = getattr(self.__class__, attr)
+                desc = get_descriptor(self.__class__, attr)
                 if getattr(desc, "hyphenated", False):
                     attr = attr.replace("_", "-")
             if attr != "attr_text" and value is not None:
@@ -171,8 +742,13 @@ class Serialisable(_Serialiasable):
 
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not self.__class__ == other.__class__:
             return False
+        elif (self._hash is not None and other._hash is not None
+              and self._hash != other._hash):
+            return False
         elif not dict(self) == dict(other):
             return False
         for el in self.__elements__:
@@ -202,6 +778,8 @@ class Serialisable(_Serialiasable):
 
 
     def __hash__(self):
+        if self._hash is not None:
+            return self._hash
         fields = []
         for attr in self.__attrs__ + self.__elements__:
             val = getattr(self, attr)
@@ -228,13 +806,40 @@ class Serialisable(_Serialiasable):
         return self.__class__(**vals)
 
 
+    def _freeze(self):
+        """
+        Prevent the values of the object and its children from being changed
+        and remember its hash, for objects that are used as keys
+        """
+        if self._hash is not None:
+            return
+        for name in self.__elements__:
+            value = getattr(self, name)
+            if not isinstance(value, seq_types):
+                value = [value]
+            for child in value:
+                if isinstance(child, Serialisable):
+                    child._freeze()
+        values = getattr(self, "__dict__", None)
+        if values is None:
+            # values kept in slots
+            object.__setattr__(self, "_hash", hash(self))
+        else:
+            values = _Frozen(values)
+            dict.__setitem__(values, "_hash", hash(self))
+            self.__dict__ = values
+
+
     def __copy__(self):
         # serialise to xml and back to avoid shallow copies
         xml = self.to_tree(tagname="dummy")
         cp = self.__class__.from_tree(xml)
         # copy any non-persisted attributed
-        for k in self.__dict__:
-            if k not in self.__attrs__ + self.__elements__:
+        names = list(getattr(self, "__dict__", ()))
+        names.extend(getattr(self, "__slotnames__", ()))
+        for k in names:
+            if (k not in self.__attrs__ + self.__elements__ and k != "_hash"
+                and hasattr(self, k)):
                 v = copy(getattr(self, k))
                 setattr(cp, k, v)
         return cp
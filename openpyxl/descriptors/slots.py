@@ -1,3 +1,148 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Serialisable classes with values kept in slots
+"""
+
+import os
+from functools import partial
+
+from .base import Descriptor, Alias
+
+
+def compact_env_set():
+    return os.environ.get("OPENPYXL_COMPACT_STYLES", "False") == "True"
+
+
+COMPACT = compact_env_set()
+
+FROZEN = "Style objects are immutable and cannot be changed. Reassign the style with a copy"
+
+
+class _Value:
+    """
+    Receives the value assigned by a descriptor once it has been checked
+    """
+
+
+class _Checked:
+    """
+    Values checked and converted by a descriptor
+    """
+
+    __slots__ = ("name", "desc")
+
+    def __init__(self, name, desc):
+        self.name = name
+        self.desc = desc
+
+
+    def convert(self, value):
+        box = _Value()
+        self.desc.__set__(box, value)
+        return box.__dict__[self.name]
+
+
+def _setattr(self, name, value):
+    if self._hash is not None:
+        raise AttributeError(FROZEN)
+    setter = self.__setters__.get(name)
+    if setter is not None:
+        value = setter.convert(value)
+    object.__setattr__(self, name, value)
+
+
+def _getstate(self):
+    state = {}
+    for name in self.__slotnames__:
+        if name == "_hash":
+            # copies can be changed
+            continue
+        try:
+            state[name] = object.__getattribute__(self, name)
+        except AttributeError:
+            # not set
+            pass
+    return state
+
+
+def _setstate(self, state):
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+def _new(cls, *args, **kw):
+    self = object.__new__(cls)
+    # like other classes, the descriptor for values that have not been set
+    for slot, desc in cls.__unset__:
+        slot.__set__(self, desc)
+    return self
+
+
+def slotted(cls, extra=()):
+    """
+    Copy of a Serialisable class that keeps its values in slots instead of a
+    dictionary per object.
+
+    The slots take the place of the descriptors as class attributes, so the
+    descriptors are kept in `__descriptors__` and values are checked by
+    `__setattr__` before being stored. `__setters__` has what converts
+    the values of each attribute. Other attributes of the objects must
+    be listed in `extra`, apart from `_hash` which is set when the object is
+    frozen. Base classes with descriptors must be slotted as
+    well.
+    """
+    namespace = dict(vars(cls))
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    descriptors = dict(getattr(cls, "__descriptors__", {}))
+    slots = list(extra)
+    if "_hash" not in getattr(cls, "__slotnames__", ()):
+        # remembered once the object is frozen
+        slots.append("_hash")
+    for name, value in vars(cls).items():
+        if isinstance(value, Descriptor) and not isinstance(value, Alias):
+            descriptors[name] = namespace.pop(name)
+            slots.append(name)
+    namespace["__slots__"] = tuple(slots)
+    namespace["__slotnames__"] = tuple(getattr(cls, "__slotnames__", ())) + tuple(slots)
+    namespace["__descriptors__"] = descriptors
+    namespace["__setters__"] = {name:_Checked(name, desc)
+                                for name, desc in descriptors.items()}
+    namespace["__setattr__"] = _setattr
+    namespace["__new__"] = _new
+    namespace["__getstate__"] = _getstate
+    namespace["__setstate__"] = _setstate
+    new = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new.__namespaced__ = cls.__namespaced__
+    unset = [(getattr(new, name), desc) for name, desc in descriptors.items()]
+    unset.append((getattr(new, "_hash"), None))
+    new.__unset__ = tuple(unset)
+    return new
+
+
+def get_descriptor(cls, name):
+    """
+    Descriptor for an attribute of a class, None if there is none
+    """
+    descriptors = getattr(cls, "__descriptors__", None)
+    if descriptors is not None and name in descriptors:
+        return descriptors[name]
+    return getattr(cls, name, None)
+
+
+def compact(cls=None, extra=()):
+    """
+    Class decorator: keep values in slots if compact storage is enabled with
+    the OPENPYXL_COMPACT_STYLES environment variable
+    """
+    if cls is None:
+        return partial(compact, extra=extra)
+    if COMPACT:
+        return slotted(cls, extra)
+    return cls
+
+
 # Metaclass for mixing slots and descriptors
 # From "Programming in Python 3" by Mark Summerfield Ch.8 p. 383
 
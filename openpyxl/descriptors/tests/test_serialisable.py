@@ -1,5 +1,7 @@
 # Copyright (c) 2010-2022 openpyxl
 
+from copy import copy, deepcopy
+
 import pytest
 
 from openpyxl.xml.functions import fromstring, tostring
@@ -248,3 +250,288 @@ class TestHyphenatedAttribute:
         dummy = HyphenatedAttribute.from_tree(el)
         assert dummy.z_order is True
         assert dummy.a_order is True
+
+
+@pytest.fixture
+def Parent(Serialisable, Node):
+    from ..base import Typed
+    from ..sequence import Sequence
+
+    class Parent(Serialisable):
+
+        tagname = "parent"
+        child = Typed(expected_type=Node, allow_none=True)
+        item = Sequence(expected_type=Node)
+
+        def __init__(self, child=None, item=()):
+            self.child = child
+            self.item = item
+
+    return Parent
+
+
+class TestTreeParser:
+
+
+    def test_cached(self, Parent):
+        src = """<parent><child val="1" /><item val="0" /><item val="1" /><unknown /></parent>"""
+        for _ in range(2):
+            obj = Parent.from_tree(fromstring(src))
+            assert obj.child.val is True
+            assert [i.val for i in obj.item] == [False, True]
+        parser = Parent.__parser__
+        assert len(parser.children) == 3
+        assert None in parser.children.values()
+
+
+    def test_subclass(self, Parent):
+        from ..base import Bool
+
+        class Child(Parent):
+
+            extra = Bool(allow_none=True)
+
+            def __init__(self, extra=None, **kw):
+                super().__init__(**kw)
+                self.extra = extra
+
+        Parent.from_tree(fromstring("<parent />"))
+        assert Child.__parser__ is None
+        obj = Child.from_tree(fromstring("""<parent extra="1"><item val="1" /></parent>"""))
+        assert obj.extra is True
+        assert len(obj.item) == 1
+        assert Child.__parser__ is not Parent.__parser__
+
+
+    def test_unknown_namespace(self, Relation):
+        src = """
+        <dummy xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+          xmlns:x="http://example.com" x:rId="other" r:rId="rId1"/>
+        """
+        obj = Relation.from_tree(fromstring(src))
+        assert obj.rId == "rId1"
+
+
+class TestTreeWriter:
+
+
+    def test_to_xml(self, Parent, Node):
+        obj = Parent(child=Node(True), item=[Node(False), Node(True)])
+        xml = obj.to_xml()
+        expected = """<parent><child val="1" /><item val="0" /><item val="1" /></parent>"""
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert compare_xml(xml, tostring(obj.to_tree())) is None
+
+
+    def test_namespaced(self, Relation):
+        xml = Relation("rId1").to_xml()
+        expected = """
+        <dummy xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" r:rId="rId1"/>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
+    def test_xmlns(self, Serialisable):
+        from ..base import Bool
+
+        class Root(Serialisable):
+
+            tagname = "from"
+            xmlns = "http://example.com"
+            val = Bool()
+
+            def __init__(self, val):
+                self.val = val
+
+        for xml in (Root(True).to_xml(), tostring(Root(True).to_tree())):
+            diff = compare_xml(xml, """<from xmlns="http://example.com" val="1" />""")
+            assert diff is None, diff
+
+
+    def test_custom_to_tree(self, Serialisable):
+        from ..base import Bool, Typed
+        from ..sequence import Sequence
+
+        class Custom(Serialisable):
+
+            tagname = "from"
+            val = Bool()
+
+            def __init__(self, val):
+                self.val = val
+
+            def to_tree(self, tagname=None, idx=None, namespace=None):
+                tree = super().to_tree(tagname, idx, namespace)
+                tree.set("custom", "1")
+                return tree
+
+        class Parent(Serialisable):
+
+            tagname = "parent"
+            child = Typed(expected_type=Custom)
+            item = Sequence(expected_type=Custom)
+
+            def __init__(self, child, item=()):
+                self.child = child
+                self.item = item
+
+        obj = Parent(child=Custom(True), item=[Custom(False)])
+        xml = obj.to_xml()
+        expected = """<parent><child custom="1" val="1" /><item custom="1" val="0" /></parent>"""
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
+    def test_instance_elements(self, Parent, Node):
+        obj = Parent(child=Node(True), item=[Node(False)])
+        obj.__elements__ = ("item",)
+        xml = obj.to_xml()
+        expected = """<parent><item val="0" /></parent>"""
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert compare_xml(xml, tostring(obj.to_tree())) is None
+
+
+@pytest.fixture
+def Checked(Serialisable):
+    from ..base import Integer, MinMax, NoneSet, Bool
+    from ..sequence import Sequence
+
+    class Checked(Serialisable):
+
+        tagname = "checked"
+        size = Integer()
+        ratio = MinMax(min=0, max=1, allow_none=True)
+        kind = NoneSet(values=["one", "two"])
+        flag = Bool(allow_none=True)
+        values = Sequence(expected_type=int)
+
+        def __init__(self, size=0, ratio=None, kind=None, flag=None, values=()):
+            self.size = size
+            self.ratio = ratio
+            self.kind = kind
+            self.flag = flag
+            self.values = values
+
+    return Checked
+
+
+class TestTrusted:
+
+
+    def test_converted(self, Checked):
+        obj = Checked.from_tree(fromstring("""<checked size="3" kind="none" flag="0" />"""))
+        assert type(obj) is Checked
+        assert obj.size == 3
+        assert obj.kind is None
+        assert obj.flag is False
+        assert obj.values == []
+
+
+    def test_not_checked(self, Checked):
+        obj = Checked.from_tree(fromstring("""<checked ratio="2" />"""))
+        assert obj.ratio == 2.0
+
+
+    def test_set_checked(self, Checked):
+        with pytest.raises(ValueError):
+            Checked.from_tree(fromstring("""<checked kind="three" />"""))
+
+
+    def test_assignment_checked(self, Checked):
+        obj = Checked.from_tree(fromstring("""<checked size="3" />"""))
+        with pytest.raises(ValueError):
+            obj.ratio = 2
+
+
+    def test_invalid(self, Checked):
+        with pytest.raises(TypeError):
+            Checked.from_tree(fromstring("""<checked size="big" />"""))
+
+
+    def test_other_descriptors(self, Serialisable):
+        from ..base import String
+
+        class Upper(String):
+
+            def __set__(self, instance, value):
+                super().__set__(instance, value.upper())
+
+        class Named(Serialisable):
+
+            tagname = "named"
+            name = Upper()
+
+            def __init__(self, name=""):
+                self.name = name
+
+        obj = Named.from_tree(fromstring("""<named name="abc" />"""))
+        assert obj.name == "ABC"
+
+
+class TestFrozen:
+
+
+    def test_assignment(self, Checked):
+        obj = Checked(size=1)
+        obj._freeze()
+        with pytest.raises(AttributeError):
+            obj.size = 2
+        assert obj.size == 1
+
+
+    def test_hash(self, Checked):
+        obj = Checked(size=1, values=[1, 2])
+        expected = hash(obj)
+        obj._freeze()
+        assert obj._hash == expected
+        assert hash(obj) == expected
+
+
+    def test_eq(self, Checked):
+        obj = Checked(size=1)
+        obj._freeze()
+        other = Checked(size=2)
+        other._freeze()
+        assert obj == obj
+        assert obj == Checked(size=1)
+        assert Checked(size=1) == obj
+        assert obj != other
+
+
+    def test_eq_hash_collision(self, Checked):
+        obj = Checked(size=-1)
+        obj._freeze()
+        other = Checked(size=-2)
+        other._freeze()
+        assert hash(obj) == hash(other)
+        assert obj != other
+
+
+    def test_children(self, Serialisable, Checked):
+        from ..base import Typed
+
+        class Parent(Serialisable):
+
+            tagname = "parent"
+            child = Typed(expected_type=Checked)
+
+            def __init__(self, child=None):
+                self.child = child
+
+        obj = Parent(Checked(size=1))
+        obj._freeze()
+        with pytest.raises(AttributeError):
+            obj.child.size = 2
+
+
+    @pytest.mark.parametrize("duplicate", [copy, deepcopy])
+    def test_copy(self, Checked, duplicate):
+        obj = Checked(size=1)
+        obj._freeze()
+        cp = duplicate(obj)
+        assert cp._hash is None
+        cp.size = 2
+        assert obj.size == 1
@@ -0,0 +1,191 @@
+# Copyright (c) 2010-2022 openpyxl
+
+from copy import copy, deepcopy
+import pickle
+
+import pytest
+
+from openpyxl.xml.functions import fromstring, tostring
+from openpyxl.tests.helper import compare_xml
+
+from ..base import Integer, NoneSet, Alias
+from ..nested import NestedText
+from ..serialisable import Serialisable
+from ..slots import slotted
+
+
+class Point(Serialisable):
+
+    tagname = "point"
+
+    x = Integer()
+    y = Integer(allow_none=True)
+    kind = NoneSet(values=["one", "two"])
+    label = NestedText(expected_type=str, allow_none=True)
+    across = Alias("x")
+
+    def __init__(self, x=0, y=None, kind=None, label=None):
+        self.x = x
+        self.y = y
+        self.kind = kind
+        self.label = label
+        self.note = "plain"
+
+
+Unslotted = Point
+# pickled objects need the class to be found by name
+Point = slotted(Point, ("note",))
+
+
+@pytest.fixture
+def Slotted():
+    return Point
+
+
+class TestSlotted:
+
+
+    def test_ctor(self, Slotted):
+        obj = Slotted(x="3", kind="one", label="a")
+        assert not hasattr(obj, "__dict__")
+        assert obj.x == 3
+        assert obj.y is None
+        assert obj.kind == "one"
+        assert obj.label == "a"
+        assert obj.note == "plain"
+
+
+    def test_class(self, Slotted):
+        assert Slotted.__attrs__ == Unslotted.__attrs__
+        assert Slotted.__elements__ == Unslotted.__elements__
+        assert Slotted.__descriptors__["x"] is Unslotted.x
+
+
+    def test_checked(self, Slotted):
+        obj = Slotted()
+        with pytest.raises(TypeError):
+            obj.x = "big"
+        with pytest.raises(ValueError):
+            obj.kind = "three"
+        assert obj.x == 0
+
+
+    def test_alias(self, Slotted):
+        obj = Slotted()
+        obj.across = "5"
+        assert obj.x == 5
+        assert obj.across == 5
+
+
+    def test_unset(self, Slotted):
+        obj = Slotted.__new__(Slotted)
+        assert obj.y is Unslotted.y
+
+
+    def test_unknown(self, Slotted):
+        obj = Slotted()
+        with pytest.raises(AttributeError):
+            obj.other = 1
+
+
+    def test_from_tree(self, Slotted):
+        src = """<point x="2" kind="none"><label>text</label></point>"""
+        obj = Slotted.from_tree(fromstring(src))
+        assert type(obj) is Slotted
+        assert obj.x == 2
+        assert obj.kind is None
+        assert obj.label == "text"
+
+
+    def test_from_tree_invalid(self, Slotted):
+        with pytest.raises(ValueError):
+            Slotted.from_tree(fromstring("""<point kind="three" />"""))
+
+
+    def test_to_tree(self, Slotted):
+        obj = Slotted(x=1, y=2, label="text")
+        expected = """<point x="1" y="2"><label>text</label></point>"""
+        diff = compare_xml(tostring(obj.to_tree()), expected)
+        assert diff is None, diff
+        diff = compare_xml(obj.to_xml(), expected)
+        assert diff is None, diff
+
+
+    def test_eq(self, Slotted):
+        obj = Slotted(x=1, label="text")
+        assert obj == Slotted(x=1, label="text")
+        assert hash(obj) == hash(Slotted(x=1, label="text"))
+        assert obj != Slotted(x=2, label="text")
+
+
+    @pytest.mark.parametrize("duplicate",
+                             [
+                                 copy,
+                                 deepcopy,
+                                 lambda obj: pickle.loads(pickle.dumps(obj)),
+                             ]
+                             )
+    def test_copy(self, Slotted, duplicate):
+        obj = Slotted(x=1, kind="two", label="text")
+        obj.note = "changed"
+        cp = duplicate(obj)
+        assert cp is not obj
+        assert cp == obj
+        assert cp.note == "changed"
+
+
+    def test_frozen(self, Slotted):
+        obj = Slotted(x=1)
+        expected = hash(obj)
+        obj._freeze()
+        assert hash(obj) == expected
+        with pytest.raises(AttributeError):
+            obj.x = 2
+        cp = pickle.loads(pickle.dumps(obj))
+        assert cp == obj
+        cp.x = 2
+
+
+def test_subclass():
+
+    class Base(Serialisable):
+
+        x = Integer()
+
+    Base = slotted(Base)
+
+    class Child(Base):
+
+        tagname = "child"
+        y = Integer()
+
+        def __init__(self, x=0, y=0):
+            self.x = x
+            self.y = y
+
+    Child = slotted(Child)
+    obj = Child(1, "2")
+    assert not hasattr(obj, "__dict__")
+    assert (obj.x, obj.y) == (1, 2)
+    with pytest.raises(TypeError):
+        obj.x = "big"
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_compact(monkeypatch, enabled):
+    from .. import slots
+    monkeypatch.setattr(slots, "COMPACT", enabled)
+
+    @slots.compact
+    class Compact(Serialisable):
+
+        value = Integer()
+
+    assert ("__descriptors__" in vars(Compact)) is enabled
+
+
+def test_get_descriptor(Slotted):
+    from ..slots import get_descriptor
+    assert get_descriptor(Slotted, "x") is Unslotted.x
+    assert get_descriptor(Unslotted, "x") is Unslotted.x
+    assert get_descriptor(Slotted, "missing") is None
@@ -2,6 +2,8 @@
 
 from io import BytesIO
 
+from openpyxl.packaging.archive import inflate
+
 try:
     from PIL import Image as PILImage
 except ImportError:
@@ -24,6 +26,8 @@ class Image(object):
     _id = 1
     _path = "/xl/media/image{0}.{1}"
     anchor = "A1"
+    _ref = None
+    _source = None # RawEntry of an image read from a file
 
     def __init__(self, img):
 
@@ -60,6 +64,37 @@ class Image(object):
         return data
 
 
+    @property
+    def ref(self):
+        if self._ref is None and self._source is not None:
+            return BytesIO(inflate(self._source))
+        return self._ref
+
+
+    @ref.setter
+    def ref(self, value):
+        self._ref = value
+        self._source = None
+
+
+    def _keep_source(self, entry):
+        """
+        Keep only the compressed entry an image was read from, the image is
+        decompressed again when it is needed
+        """
+        self._ref = None
+        self._source = entry
+
+
+    def _raw(self):
+        """
+        Return the compressed entry the image was read from if it can be
+        copied unchanged
+        """
+        if self._source is not None and self.format in ['gif', 'jpeg', 'png']:
+            return self._source
+
+
     @property
     def path(self):
         return self._path.format(self._id, self.format)
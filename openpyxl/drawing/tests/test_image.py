@@ -58,3 +58,34 @@ class TestImage:
         datadir.chdir()
         img = Image("plain.tif")
         assert img._data()[:10] == b'\x89PNG\r\n\x1a\n\x00\x00'
+
+
+    @pytest.mark.pil_required
+    def test_raw(self, Image, datadir):
+        datadir.chdir()
+        img = Image("plain.png")
+        assert img._raw() is None
+        img._keep_source("entry")
+        assert img._raw() == "entry"
+        img.ref = "plain.tif"
+        assert img._raw() is None
+
+
+    @pytest.mark.pil_required
+    def test_ref_from_source(self, Image, datadir):
+        from zipfile import ZipFile, ZIP_DEFLATED
+        from io import BytesIO
+        from openpyxl.packaging.archive import read_raw
+        datadir.chdir()
+        src = BytesIO()
+        with ZipFile(src, "w", ZIP_DEFLATED) as archive:
+            archive.write("plain.png")
+        with ZipFile(src) as archive:
+            entry = read_raw(archive, "plain.png")
+
+        img = Image("plain.png")
+        img._keep_source(entry)
+        assert img._ref is None
+        with open("plain.png", "rb") as f:
+            assert img.ref.read() == f.read()
+        assert img._data()[:8] == b'\x89PNG\r\n\x1a\n'
@@ -0,0 +1,130 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Copy compressed entries between zip archives
+
+zipfile only reads and writes uncompressed data. Entries that are copied
+unchanged from one archive to another can be copied as they are stored,
+without being inflated and deflated again.
+"""
+
+from collections import namedtuple
+import struct
+import time
+from zipfile import (
+    BadZipFile,
+    ZipInfo,
+    ZIP64_LIMIT,
+    sizeFileHeader,
+    _get_decompressor,
+)
+from zlib import crc32
+
+RawEntry = namedtuple("RawEntry", "compress_type file_size CRC data")
+
+_FLAG_ENCRYPTED = 0x1
+CHUNK_SIZE = 1024 * 1024
+
+
+def _seek_data(archive, info):
+    """
+    Move to the start of the stored data of an entry
+    """
+    if info.flag_bits & _FLAG_ENCRYPTED:
+        raise ValueError("{0} is encrypted".format(info.filename))
+    fp = archive.fp
+    fp.seek(info.header_offset)
+    header = fp.read(sizeFileHeader)
+    name_size, extra_size = struct.unpack("<HH", header[26:30])
+    fp.seek(name_size + extra_size, 1)
+    return fp
+
+
+def _start_entry(archive, zinfo):
+    """
+    Write the header of an entry whose sizes and CRC are known
+    """
+    if archive._writing:
+        raise ValueError("Can't write to the ZIP file while there is "
+                         "another write handle open on it.")
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > ZIP64_LIMIT
+    if archive._seekable:
+        archive.fp.seek(archive.start_dir)
+    zinfo.header_offset = archive.fp.tell()
+    archive._writecheck(zinfo)
+    archive._didModify = True
+    archive.fp.write(zinfo.FileHeader(zip64))
+
+
+def _end_entry(archive, zinfo):
+    archive.start_dir = archive.fp.tell()
+    archive.filelist.append(zinfo)
+    archive.NameToInfo[zinfo.filename] = zinfo
+
+
+def read_raw(archive, name):
+    """
+    Return an entry of an archive open for reading as it is stored
+    """
+    info = archive.getinfo(name)
+    with archive._lock:
+        data = _seek_data(archive, info).read(info.compress_size)
+    return RawEntry(info.compress_type, info.file_size, info.CRC, data)
+
+
+def inflate(entry):
+    """
+    Return the uncompressed data of an entry read with read_raw()
+    """
+    decompressor = _get_decompressor(entry.compress_type)
+    data = entry.data
+    if decompressor is not None:
+        data = decompressor.decompress(data)
+    if crc32(data) != entry.CRC:
+        raise BadZipFile("Bad CRC-32 for an archive entry")
+    return data
+
+
+def write_raw(archive, zinfo_or_arcname, entry):
+    """
+    Add an entry that is already compressed to an archive open for writing
+    """
+    zinfo = zinfo_or_arcname
+    if not isinstance(zinfo, ZipInfo):
+        zinfo = ZipInfo(zinfo_or_arcname, date_time=time.localtime(time.time())[:6])
+        zinfo.external_attr = 0o600 << 16
+    zinfo.compress_type = entry.compress_type
+    zinfo.file_size = entry.file_size
+    zinfo.compress_size = len(entry.data)
+    zinfo.CRC = entry.CRC
+
+    with archive._lock:
+        _start_entry(archive, zinfo)
+        archive.fp.write(entry.data)
+        _end_entry(archive, zinfo)
+
+
+def copy_raw(source, archive, name):
+    """
+    Copy an entry from an archive open for reading to one open for writing
+    as it is stored, a chunk at a time
+    """
+    info = source.getinfo(name)
+    zinfo = ZipInfo(name, date_time=info.date_time)
+    zinfo.external_attr = info.external_attr
+    zinfo.compress_type = info.compress_type
+    zinfo.file_size = info.file_size
+    zinfo.compress_size = info.compress_size
+    zinfo.CRC = info.CRC
+
+    with source._lock, archive._lock:
+        src = _seek_data(source, info)
+        _start_entry(archive, zinfo)
+        remaining = info.compress_size
+        while remaining:
+            chunk = src.read(min(remaining, CHUNK_SIZE))
+            if not chunk:
+                raise EOFError("{0} is truncated".format(name))
+            archive.fp.write(chunk)
+            remaining -= len(chunk)
+        _end_entry(archive, zinfo)
@@ -43,6 +43,7 @@ class ExtendedProperties(Serialisable):
     """
 
     tagname = "Properties"
+    xmlns = XPROPS_NS
 
     Template = NestedText(expected_type=str, allow_none=True)
     Manager = NestedText(expected_type=str, allow_none=True)
@@ -133,9 +134,3 @@ class ExtendedProperties(Serialisable):
             AppVersion = get_version()
         self.AppVersion = AppVersion
         self.DocSecurity = DocSecurity
-
-
-    def to_tree(self):
-        tree = super(ExtendedProperties, self).to_tree()
-        tree.set("xmlns", XPROPS_NS)
-        return tree
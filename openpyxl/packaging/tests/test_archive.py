@@ -0,0 +1,69 @@
+# Copyright (c) 2010-2022 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+from ..archive import read_raw, write_raw, inflate
+
+
+@pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+def test_copy(compression):
+    data = b"<xml>" * 1000
+    src = BytesIO()
+    with ZipFile(src, "w", compression) as archive:
+        archive.writestr("a.xml", b"first")
+        archive.writestr("b.xml", data)
+
+    with ZipFile(src) as archive:
+        entry = read_raw(archive, "b.xml")
+    assert entry.compress_type == compression
+    assert entry.file_size == len(data)
+
+    out = BytesIO()
+    with ZipFile(out, "w", ZIP_DEFLATED) as archive:
+        archive.writestr("c.xml", b"before")
+        write_raw(archive, "copy.xml", entry)
+        archive.writestr("d.xml", b"after")
+
+    with ZipFile(out) as archive:
+        assert archive.testzip() is None
+        assert archive.read("copy.xml") == data
+        assert archive.read("d.xml") == b"after"
+        assert archive.getinfo("copy.xml").compress_type == compression
+
+
+@pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+def test_inflate(compression):
+    from zipfile import BadZipFile
+    data = b"<xml>" * 1000
+    src = BytesIO()
+    with ZipFile(src, "w", compression) as archive:
+        archive.writestr("a.xml", data)
+
+    with ZipFile(src) as archive:
+        entry = read_raw(archive, "a.xml")
+    assert inflate(entry) == data
+    with pytest.raises(BadZipFile):
+        inflate(entry._replace(CRC=entry.CRC + 1))
+
+
+def test_copy_raw(monkeypatch):
+    from .. import archive as module
+    from ..archive import copy_raw
+    monkeypatch.setattr(module, "CHUNK_SIZE", 10)
+
+    data = b"<xml>" * 1000
+    src = BytesIO()
+    with ZipFile(src, "w", ZIP_DEFLATED) as archive:
+        archive.writestr("a.xml", data)
+
+    out = BytesIO()
+    with ZipFile(src) as source, ZipFile(out, "w") as archive:
+        copy_raw(source, archive, "a.xml")
+        assert archive.getinfo("a.xml").date_time == source.getinfo("a.xml").date_time
+
+    with ZipFile(out) as archive:
+        assert archive.testzip() is None
+        assert archive.read("a.xml") == data
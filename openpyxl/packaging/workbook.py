@@ -97,6 +97,7 @@ class WorkbookPackage(Serialisable):
     """
 
     tagname = "workbook"
+    xmlns = SHEET_MAIN_NS
 
     conformance = NoneSet(values=['strict', 'transitional'])
     fileVersion = Typed(expected_type=FileVersion, allow_none=True)
@@ -173,12 +174,6 @@ class WorkbookPackage(Serialisable):
         self.webPublishObjects = webPublishObjects
 
 
-    def to_tree(self):
-        tree = super(WorkbookPackage, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
-
-
     @property
     def active(self):
         for view in self.bookViews:
@@ -981,6 +981,7 @@ class CacheDefinition(Serialisable):
     records = None
 
     tagname = "pivotCacheDefinition"
+    xmlns = SHEET_MAIN_NS
 
     invalid = Bool(allow_none=True)
     saveData = Bool(allow_none=True)
@@ -1079,12 +1080,6 @@ class CacheDefinition(Serialisable):
         self.id = id
 
 
-    def to_tree(self):
-        node = super(CacheDefinition, self).to_tree()
-        node.set("xmlns", SHEET_MAIN_NS)
-        return node
-
-
     @property
     def path(self):
         return self._path.format(self._id)
@@ -1095,8 +1090,7 @@ class CacheDefinition(Serialisable):
         Add to zipfile and update manifest
         """
         self._write_rels(archive, manifest)
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        archive.writestr(self.path[1:], self.to_xml())
         manifest.append(self)
 
 
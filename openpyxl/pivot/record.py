@@ -17,7 +17,6 @@ from openpyxl.descriptors.nested import (
 )
 
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
 
 from .fields import (
     Boolean,
@@ -66,6 +65,7 @@ class RecordList(Serialisable):
     _path = "/xl/pivotCache/pivotCacheRecords{0}.xml"
 
     tagname ="pivotCacheRecords"
+    xmlns = SHEET_MAIN_NS
 
     r = Sequence(expected_type=Record, allow_none=True)
     extLst = Typed(expected_type=ExtensionList, allow_none=True)
@@ -87,12 +87,6 @@ class RecordList(Serialisable):
         return len(self.r)
 
 
-    def to_tree(self):
-        tree = super(RecordList, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
-
-
     @property
     def path(self):
         return self._path.format(self._id)
@@ -102,8 +96,7 @@ class RecordList(Serialisable):
         """
         Write to zipfile and update manifest
         """
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        archive.writestr(self.path[1:], self.to_xml())
         manifest.append(self)
 
 
@@ -867,6 +867,7 @@ class TableDefinition(Serialisable):
     _path = "/xl/pivotTables/pivotTable{0}.xml"
 
     tagname = "pivotTableDefinition"
+    xmlns = SHEET_MAIN_NS
     cache = None
 
     name = String()
@@ -1138,12 +1139,6 @@ class TableDefinition(Serialisable):
         self.id = id
 
 
-    def to_tree(self):
-        tree = super(TableDefinition, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
-
-
     @property
     def path(self):
         return self._path.format(self._id)
@@ -1154,8 +1149,7 @@ class TableDefinition(Serialisable):
         Add to zipfile and update manifest
         """
         self._write_rels(archive, manifest)
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        archive.writestr(self.path[1:], self.to_xml())
         manifest.append(self)
 
 
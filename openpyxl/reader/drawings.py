@@ -7,6 +7,7 @@ from warnings import warn
 
 from openpyxl.xml.functions import fromstring
 from openpyxl.xml.constants import IMAGE_NS
+from openpyxl.packaging.archive import read_raw
 from openpyxl.packaging.relationship import get_rel, get_rels_path, get_dependents
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.drawing.image import Image, PILImage
@@ -59,5 +60,6 @@ def find_images(archive, path):
                 warn(msg)
                 continue
             image.anchor = rel.anchor
+            image._keep_source(read_raw(archive, dep.target))
             images.append(image)
     return charts, images
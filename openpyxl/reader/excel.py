@@ -4,9 +4,10 @@
 """Read an xlsx file into Python"""
 
 # Python stdlib imports
-from zipfile import ZipFile, ZIP_DEFLATED, BadZipfile
+from zipfile import ZipFile, BadZipfile
 from sys import exc_info
 from io import BytesIO
+from multiprocessing import Pool
 import os.path
 import warnings
 
@@ -38,7 +39,7 @@ from openpyxl.xml.constants import (
 from openpyxl.cell import MergedCell
 from openpyxl.comments.comment_sheet import CommentSheet
 
-from .strings import read_string_table
+from .strings import read_string_table, LazyStringTable
 from .workbook import WorkbookParser
 from openpyxl.styles.stylesheet import apply_stylesheet
 
@@ -52,7 +53,7 @@ from openpyxl.packaging.relationship import (
 )
 
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
-from openpyxl.worksheet._reader import WorksheetReader
+from openpyxl.worksheet._reader import WorksheetReader, read_worksheet
 from openpyxl.chartsheet import Chartsheet
 from openpyxl.worksheet.table import Table
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
@@ -113,6 +114,34 @@ def _find_workbook_part(package):
     raise IOError("File contains no valid workbook part")
 
 
+# state of worker processes, see _init_worker
+_worker = {}
+
+
+def _init_worker(filename, shared_strings, data_only, epoch, date_formats,
+                 timedelta_formats):
+    _worker.update(filename=filename, shared_strings=shared_strings,
+                   data_only=data_only, epoch=epoch, date_formats=date_formats,
+                   timedelta_formats=timedelta_formats)
+
+
+def _parse_worksheet(sheet_path, xml=None):
+    """
+    Parse a worksheet in a worker process. The worksheet is read from the
+    archive unless its XML is passed in. Warnings are returned so that
+    they can be issued in the main process.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        if xml is None:
+            with ZipFile(_worker['filename']) as archive:
+                xml = archive.read(sheet_path)
+        parsed = read_worksheet(BytesIO(xml), _worker['shared_strings'],
+                                _worker['data_only'], _worker['epoch'],
+                                _worker['date_formats'], _worker['timedelta_formats'])
+    return parsed, [(w.message, w.category) for w in caught]
+
+
 class ExcelReader:
 
     """
@@ -120,8 +149,12 @@ class ExcelReader:
     """
 
     def __init__(self,  fn, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True):
+                  data_only=False, keep_links=True, workers=None):
         self.archive = _validate_archive(fn)
+        self.filename = None
+        if isinstance(fn, (str, os.PathLike)):
+            self.filename = fn
+        self.workers = workers
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
         self.keep_vba = keep_vba
@@ -141,7 +174,10 @@ class ExcelReader:
         if ct is not None:
             strings_path = ct.PartName[1:]
             with self.archive.open(strings_path,) as src:
-                self.shared_strings = read_string_table(src)
+                if self.read_only:
+                    self.shared_strings = LazyStringTable(src)
+                else:
+                    self.shared_strings = read_string_table(src)
 
 
     def read_workbook(self):
@@ -155,14 +191,18 @@ class ExcelReader:
         wb.template = wb_part.ContentType in (XLTX, XLTM)
 
         # If are going to preserve the vba then attach a copy of the archive to the
-        # workbook so that is available for the save.
+        # workbook so that is available for the save. The file is copied as it
+        # is so that parts can be copied to the new file without recompressing
+        # them.
         if self.keep_vba:
-            wb.vba_archive = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
-            for name in self.valid_files:
-                wb.vba_archive.writestr(name, self.archive.read(name))
+            fp = self.archive.fp
+            fp.seek(0)
+            wb.vba_archive = ZipFile(BytesIO(fp.read()))
 
         if self.read_only:
             wb._archive = self.archive
+            if isinstance(self.shared_strings, LazyStringTable):
+                wb._shared_strings = self.shared_strings
 
         self.wb = wb
 
@@ -200,9 +240,53 @@ class ExcelReader:
                 cs.add_chart(c)
 
 
+    def parse_worksheets(self, pool, paths):
+        """
+        Start parsing worksheets in a pool of processes. Worksheets are
+        read by the workers unless the archive is not a file.
+        """
+        results = {}
+        for path in paths:
+            xml = None
+            if self.filename is None:
+                xml = self.archive.read(path)
+            results[path] = pool.apply_async(_parse_worksheet, (path, xml))
+        return results
+
+
+    def _start_pool(self, sheets):
+        """
+        Create a pool of processes if worksheets can be parsed in parallel
+        """
+        if self.read_only or not self.workers or self.workers < 2:
+            return None, {}
+
+        paths = [rel.target for sheet, rel in sheets
+                 if rel.target in self.valid_files and "chartsheet" not in rel.Type]
+        if len(paths) < 2:
+            return None, {}
+
+        wb = self.wb
+        pool = Pool(min(self.workers, len(paths)), _init_worker,
+                    (self.filename, self.shared_strings, self.data_only,
+                     wb.epoch, wb._date_formats, wb._timedelta_formats))
+        return pool, self.parse_worksheets(pool, paths)
+
+
     def read_worksheets(self):
+        sheets = list(self.parser.find_sheets())
+        pool, results = self._start_pool(sheets)
+        try:
+            self._read_worksheets(sheets, results)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+
+    def _read_worksheets(self, sheets, results):
         comment_warning = """Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."""
-        for sheet, rel in self.parser.find_sheets():
+        for sheet, rel in sheets:
             if rel.target not in self.valid_files:
                 continue
 
@@ -220,6 +304,14 @@ class ExcelReader:
                 ws.sheet_state = sheet.state
                 self.wb._sheets.append(ws)
                 continue
+            elif rel.target in results:
+                parsed, caught = results[rel.target].get()
+                for message, category in caught:
+                    warnings.warn(message, category)
+                ws = self.wb.create_sheet(sheet.name)
+                ws._rels = rels
+                ws_parser = WorksheetReader(ws, None, None, self.data_only, parsed)
+                ws_parser.bind_all()
             else:
                 fh = self.archive.open(rel.target)
                 ws = self.wb.create_sheet(sheet.name)
@@ -277,7 +369,7 @@ class ExcelReader:
 
 
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True):
+                  data_only=False, keep_links=True, workers=None):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -295,6 +387,9 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param keep_links: whether links to external workbooks should be preserved. The default is True
     :type keep_links: bool
 
+    :param workers: number of processes used to parse worksheets in parallel. The default is to parse them one after another. Ignored in read-only mode
+    :type workers: int
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -304,6 +399,6 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
 
     """
     reader = ExcelReader(filename, read_only, keep_vba,
-                        data_only, keep_links)
+                        data_only, keep_links, workers)
     reader.read()
     return reader.wb
@@ -1,10 +1,41 @@
 # Copyright (c) 2010-2022 openpyxl
 
+from array import array
+from collections import OrderedDict
+import mmap
+import re
+from tempfile import TemporaryFile
+
 from openpyxl.cell.text import Text
 
-from openpyxl.xml.functions import iterparse
+from openpyxl.xml.functions import iterparse, fromstring
 from openpyxl.xml.constants import SHEET_MAIN_NS
 
+CHUNK_SIZE = 1024 * 1024
+
+SST_RE = re.compile(rb"<(?:([A-Za-z_][\w.-]*):)?sst(?=[\s/>])[^>]*>")
+
+TEXT_TAG = '{%s}t' % SHEET_MAIN_NS
+
+
+def get_text_content(node):
+    """
+    Text of a shared string item or inline string stripped of formatting.
+
+    Most strings are a single <t> element which is read directly, the
+    object model is only used for rich text.
+    """
+    if len(node) == 1:
+        child = node[0]
+        if child.tag == TEXT_TAG:
+            return child.text or ""
+    return Text.from_tree(node).content
+
+
+def _get_text(node):
+    text = get_text_content(node)
+    return text.replace('x005F_', '')
+
 
 def read_string_table(xml_source):
     """Read in all shared strings in the table"""
@@ -14,10 +45,149 @@ def read_string_table(xml_source):
 
     for _, node in iterparse(xml_source):
         if node.tag == STRING_TAG:
-            text = Text.from_tree(node).content
-            text = text.replace('x005F_', '')
+            text = _get_text(node)
             node.clear()
 
             strings.append(text)
 
     return strings
+
+
+class LazyStringTable:
+    """
+    Shared string table that is only scanned for the positions of the
+    strings when it is read. Strings are parsed when they are first used
+    and the most recently used are cached.
+
+    The XML is kept in a temporary file that is mapped into memory.
+    """
+
+    def __init__(self, xml_source=None, cache_size=4096):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._data = b""
+        self._offsets = array("Q")
+        self._header = b""
+        self._set_prefix(b"")
+        if xml_source is not None:
+            self._read(xml_source)
+
+
+    def _set_prefix(self, prefix):
+        """
+        Tags for the namespace prefix used in the table
+        """
+        self._prefix = prefix
+        self._footer = b"</" + prefix + b"sst>"
+        # plain strings without markup, entities or line ends to normalise
+        p = re.escape(prefix)
+        self._plain_re = re.compile(
+            rb"""<%ssi>\s*<%st(?: xml:space="preserve")?>([^<&\r]*)</%st>\s*</%ssi>\s*$"""
+            % (p, p, p, p))
+
+
+    def _read(self, xml_source):
+        """
+        Copy the source to a temporary file and record where each string
+        starts. A string ends where the next one or the table ends.
+        """
+        fh = TemporaryFile()
+        offsets = self._offsets
+        buf = b""
+        pos = 0 # offset of buf in the file
+        start = 0
+        si_re = None
+
+        while True:
+            chunk = xml_source.read(CHUNK_SIZE)
+            fh.write(chunk)
+            buf += chunk
+
+            if si_re is None:
+                m = SST_RE.search(buf)
+                if m is None:
+                    if not chunk:
+                        break
+                    continue
+                prefix = m.group(1) and m.group(1) + b":" or b""
+                self._header = buf[:m.end()]
+                self._set_prefix(prefix)
+                si_re = re.compile(b"<" + re.escape(prefix) + rb"si(?=[\s/>])")
+                start = m.end()
+
+            for m in si_re.finditer(buf, start):
+                offsets.append(pos + m.start())
+                start = m.end()
+
+            if not chunk:
+                break
+
+            # only keep what might be the beginning of a string
+            tail = max(buf.rfind(b"<"), start)
+            pos += tail
+            buf = buf[tail:]
+            start = 0
+
+        size = fh.tell()
+        if offsets:
+            fh.seek(max(offsets[-1], size - CHUNK_SIZE))
+            tail = fh.read()
+            offsets.append(size - len(tail) + tail.rfind(b"</"))
+            # the map keeps its own handle to the file
+            self._data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        fh.close()
+
+
+    @classmethod
+    def _from_data(cls, data, offsets, header, prefix, cache_size):
+        table = cls(cache_size=cache_size)
+        table._data = data
+        table._offsets = offsets
+        table._header = header
+        table._set_prefix(prefix)
+        return table
+
+
+    def __reduce__(self):
+        # the memory map cannot be pickled so copy its contents
+        return self._from_data, (bytes(self._data), self._offsets, self._header,
+                                 self._prefix, self.cache_size)
+
+
+    def __len__(self):
+        return max(len(self._offsets) - 1, 0)
+
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("string index out of range")
+
+        cache = self._cache
+        if idx in cache:
+            cache.move_to_end(idx)
+            return cache[idx]
+
+        xml = self._data[self._offsets[idx]:self._offsets[idx + 1]]
+        m = self._plain_re.match(xml)
+        if m is not None:
+            text = m.group(1).decode("utf-8").replace('x005F_', '')
+        else:
+            node = fromstring(self._header + xml + self._footer)
+            text = _get_text(node[0])
+        cache[idx] = text
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return text
+
+
+    def close(self):
+        """
+        Release the memory map of the temporary file
+        """
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        self._offsets = array("Q")
+        self._cache.clear()
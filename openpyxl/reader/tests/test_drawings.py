@@ -23,6 +23,7 @@ def test_read_drawing(datadir):
     from ..drawings import find_images
     images = find_images(archive, path)[1]
     assert len(images) == 3
+    assert images[0]._raw().data == archive.read("xl/media/image1.png")
 
 
 def test_unsupport_drawing(datadir):
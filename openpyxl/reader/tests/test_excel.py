@@ -117,6 +117,20 @@ def test_close_read(datadir, load_workbook, ro):
         assert wb._archive.fp is None
 
 
+def test_read_only_strings(datadir, load_workbook):
+    from ..strings import LazyStringTable
+    datadir.chdir()
+
+    wb = load_workbook("sample.xlsx", read_only=True)
+    ws = wb.active
+    strings = ws._shared_strings
+    assert isinstance(strings, LazyStringTable)
+    assert ws["A1"].value == strings[0]
+
+    wb.close()
+    assert len(strings) == 0
+
+
 @pytest.mark.parametrize("wo", [False, True])
 def test_close_write(wo):
     from openpyxl.workbook import Workbook
@@ -151,6 +165,23 @@ def test_no_external_links(datadir, load_workbook):
     assert wb._external_links == []
 
 
+@pytest.mark.parametrize("fileobj", [False, True])
+def test_load_workbook_workers(datadir, load_workbook, fileobj):
+    datadir.chdir()
+
+    filename = "hidden_sheets.xlsx"
+    if fileobj:
+        with open(filename, "rb") as src:
+            wb1 = load_workbook(src, workers=2)
+    else:
+        wb1 = load_workbook(filename, workers=2)
+    wb2 = load_workbook("hidden_sheets.xlsx")
+    assert wb1.sheetnames == wb2.sheetnames
+    for ws1, ws2 in zip(wb1, wb2):
+        assert list(ws1.values) == list(ws2.values)
+        assert ws1.sheet_state == ws2.sheet_state
+
+
 from ..excel import ExcelReader
 
 
@@ -1,5 +1,9 @@
 # Copyright (c) 2010-2022 openpyxl
 
+from io import BytesIO
+import pickle
+
+import pytest
 
 # package imports
 from openpyxl.reader.strings import read_string_table
@@ -29,3 +33,87 @@ def test_formatted_string_table(datadir):
             u'to the best shop in town',
             u"     let's play "
         ]
+
+
+@pytest.fixture
+def LazyStringTable():
+    from ..strings import LazyStringTable
+    return LazyStringTable
+
+
+@pytest.mark.parametrize("src",
+                         ['sharedStrings.xml',
+                          'sharedStrings-emptystring.xml',
+                          'shared-strings-rich.xml',
+                          'sharedStrings2.xml',
+                          ]
+                         )
+@pytest.mark.parametrize("chunk_size", [7, 1024])
+def test_lazy_string_table(datadir, LazyStringTable, monkeypatch, src, chunk_size):
+    from .. import strings
+    monkeypatch.setattr(strings, "CHUNK_SIZE", chunk_size)
+    datadir.chdir()
+    with open(src, "rb") as content:
+        expected = read_string_table(content)
+    with open(src, "rb") as content:
+        table = LazyStringTable(content)
+    assert list(table) == expected
+    table.close()
+
+
+def test_lazy_prefixed(LazyStringTable):
+    src = b"""<x:sst xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+    <x:si><x:t>a</x:t></x:si><x:si/><x:si><x:t>c</x:t></x:si></x:sst>"""
+    table = LazyStringTable(BytesIO(src))
+    assert list(table) == ["a", "", "c"]
+    assert table[-1] == "c"
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_lazy_empty(LazyStringTable):
+    table = LazyStringTable(BytesIO(b"<sst/>"))
+    assert len(table) == 0
+    table.close()
+
+
+def test_lazy_cache(LazyStringTable):
+    src = b"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+    <si><t>a</t></si><si><t>b</t></si><si><t>c</t></si></sst>"""
+    table = LazyStringTable(BytesIO(src), cache_size=2)
+    assert [table[0], table[1], table[0], table[2]] == ["a", "b", "a", "c"]
+    assert list(table._cache) == [0, 2]
+
+
+def test_lazy_pickle(LazyStringTable):
+    src = b"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+    <si><t>a</t></si><si><t>b</t></si></sst>"""
+    table = LazyStringTable(BytesIO(src))
+    copy = pickle.loads(pickle.dumps(table))
+    table.close()
+    assert list(copy) == ["a", "b"]
+
+
+@pytest.mark.parametrize("xml, expected",
+                         [
+                             ("<si><t>plain</t></si>", "plain"),
+                             ("<si><t/></si>", ""),
+                             ("<si><t xml:space='preserve'> a </t><rPh sb='0' eb='1'><t>b</t></rPh></si>", " a "),
+                             ("<si><r><t>rich </t></r><r><rPr><b/></rPr><t>text</t></r></si>", "rich text"),
+                         ]
+                         )
+def test_get_text_content(xml, expected):
+    from openpyxl.xml.functions import fromstring
+    from ..strings import get_text_content
+    xml = xml.replace("<si>", '<si xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">')
+    assert get_text_content(fromstring(xml)) == expected
+
+
+def test_lazy_plain_strings(LazyStringTable):
+    src = b"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+    <si><t>1 &amp; 2</t></si>
+    <si><t xml:space="preserve">_x005F_x000D_ </t></si>
+    <si><t>caf\xc3\xa9</t></si>
+    <si><t>a\r\nb</t></si>
+    </sst>"""
+    assert list(LazyStringTable(BytesIO(src))) == read_string_table(BytesIO(src))
@@ -4,6 +4,7 @@ from openpyxl.compat import safe_string
 
 from openpyxl.descriptors import Bool, MinMax, Min, Alias, NoneSet
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.slots import compact
 
 
 horizontal_alignments = (
@@ -13,6 +14,7 @@ vertical_aligments = (
     "top", "center", "bottom", "justify", "distributed",
 )
 
+@compact
 class Alignment(Serialisable):
     """Alignment options for use in styles."""
 
@@ -10,6 +10,7 @@ from openpyxl.descriptors import (
     Integer,
 )
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.slots import compact
 
 from .colors import ColorDescriptor
 
@@ -30,6 +31,7 @@ BORDER_THICK = 'thick'
 BORDER_THIN = 'thin'
 
 
+@compact
 class Side(Serialisable):
 
     """Border options for use in styles.
@@ -53,6 +55,7 @@ class Side(Serialisable):
         self.color = color
 
 
+@compact(extra=("diagonal_direction",))
 class Border(Serialisable):
     """Border positioning for use in styles."""
 
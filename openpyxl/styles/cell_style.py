@@ -11,7 +11,7 @@ from openpyxl.descriptors import (
     Sequence,
 )
 from openpyxl.descriptors.excel import ExtensionList
-from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.utils.indexed_list import IndexedList, FrozenList
 
 
 from .alignment import Alignment
@@ -189,8 +189,8 @@ class CellStyleList(Serialisable):
         """
         Extract protection and alignments, convert to style array
         """
-        self.prots = IndexedList([Protection()])
-        self.alignments = IndexedList([Alignment()])
+        self.prots = FrozenList([Protection()])
+        self.alignments = FrozenList([Alignment()])
         styles = [] # allow duplicates
         for xf in self.xf:
             style = xf.to_array()
@@ -11,6 +11,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.sequence import NestedSequence
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.slots import compact
 
 # Default Color Index as per 18.8.27 of ECMA Part 4
 COLOR_INDEX = (
@@ -64,6 +65,7 @@ class RGB(Typed):
         super(RGB, self).__set__(instance, value)
 
 
+@compact
 class Color(Serialisable):
     """Named colors for use in styles."""
 
@@ -134,6 +136,7 @@ class ColorDescriptor(Typed):
         super(ColorDescriptor, self).__set__(instance, value)
 
 
+@compact
 class RgbColor(Serialisable):
 
     tagname = "rgbColor"
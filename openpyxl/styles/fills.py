@@ -11,6 +11,7 @@ from openpyxl.descriptors import (
     MinMax,
 )
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.slots import compact
 from openpyxl.compat import safe_string
 
 from .colors import ColorDescriptor, Color
@@ -48,6 +49,7 @@ fills = (FILL_SOLID, FILL_PATTERN_DARKDOWN, FILL_PATTERN_DARKGRAY,
          FILL_PATTERN_MEDIUMGRAY)
 
 
+@compact
 class Fill(Serialisable):
 
     """Base class"""
@@ -65,6 +67,7 @@ class Fill(Serialisable):
         return super(Fill, GradientFill).from_tree(child)
 
 
+@compact
 class PatternFill(Fill):
     """Area fill patterns for use in styles.
     Caution: if you do not specify a fill_type, other attributes will have
@@ -81,16 +84,20 @@ class PatternFill(Fill):
     bgColor = ColorDescriptor()
     end_color = Alias("bgColor")
 
-    def __init__(self, patternType=None, fgColor=Color(), bgColor=Color(),
+    def __init__(self, patternType=None, fgColor=None, bgColor=None,
                  fill_type=None, start_color=None, end_color=None):
         if fill_type is not None:
             patternType = fill_type
         self.patternType = patternType
         if start_color is not None:
             fgColor = start_color
+        if fgColor is None:
+            fgColor = Color()
         self.fgColor = fgColor
         if end_color is not None:
             bgColor = end_color
+        if bgColor is None:
+            bgColor = Color()
         self.bgColor = bgColor
 
     @classmethod
@@ -119,6 +126,7 @@ DEFAULT_EMPTY_FILL = PatternFill()
 DEFAULT_GRAY_FILL = PatternFill(patternType='gray125')
 
 
+@compact
 class Stop(Serialisable):
 
     tagname = "stop"
@@ -168,6 +176,7 @@ class StopList(Sequence):
         super(StopList, self).__set__(obj, values)
 
 
+@compact
 class GradientFill(Fill):
     """Fill areas with gradient
 
@@ -7,6 +7,7 @@ from openpyxl.descriptors import (
     Integer
 )
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.slots import compact
 
 from openpyxl.descriptors.nested import (
     NestedValue,
@@ -29,6 +30,7 @@ def _no_value(tagname, value, namespace=None):
         return Element(tagname, val=safe_string(value))
 
 
+@compact
 class Font(Serialisable):
     """Font options used in styles."""
 
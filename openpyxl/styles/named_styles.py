@@ -50,16 +50,26 @@ class NamedStyle(Serialisable):
 
     def __init__(self,
                  name="Normal",
-                 font=Font(),
-                 fill=PatternFill(),
-                 border=Border(),
-                 alignment=Alignment(),
+                 font=None,
+                 fill=None,
+                 border=None,
+                 alignment=None,
                  number_format=None,
-                 protection=Protection(),
+                 protection=None,
                  builtinId=None,
                  hidden=False,
                  xfId=None,
                  ):
+        if font is None:
+            font = Font()
+        if fill is None:
+            fill = PatternFill()
+        if border is None:
+            border = Border()
+        if alignment is None:
+            alignment = Alignment()
+        if protection is None:
+            protection = Protection()
         self.name = name
         self.font = font
         self.fill = fill
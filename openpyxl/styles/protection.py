@@ -2,8 +2,10 @@
 
 from openpyxl.descriptors import Bool
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.slots import compact
 
 
+@compact
 class Protection(Serialisable):
     """Protection options for use in styles."""
 
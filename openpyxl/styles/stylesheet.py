@@ -8,7 +8,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.sequence import NestedSequence
 from openpyxl.descriptors.excel import ExtensionList
-from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.utils.indexed_list import IndexedList, FrozenList
 from openpyxl.xml.constants import ARC_STYLE, SHEET_MAIN_NS
 from openpyxl.xml.functions import fromstring
 
@@ -36,6 +36,7 @@ from .cell_style import CellStyle, CellStyleList
 
 class Stylesheet(Serialisable):
     tagname = "styleSheet"
+    xmlns = SHEET_MAIN_NS
 
     numFmts = Typed(expected_type=NumberFormatList)
     fonts = NestedSequence(expected_type=Font, count=True)
@@ -176,11 +177,6 @@ class Stylesheet(Serialisable):
         self.date_formats = date_formats
         self.timedelta_formats = timedelta_formats
 
-    def to_tree(self, tagname=None, idx=None, namespace=None):
-        tree = super(Stylesheet, self).to_tree(tagname, idx, namespace)
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
-
 
 def apply_stylesheet(archive, wb):
     """
@@ -196,9 +192,9 @@ def apply_stylesheet(archive, wb):
 
     if stylesheet.cell_styles:
 
-        wb._borders = IndexedList(stylesheet.borders)
-        wb._fonts = IndexedList(stylesheet.fonts)
-        wb._fills = IndexedList(stylesheet.fills)
+        wb._borders = FrozenList(stylesheet.borders)
+        wb._fonts = FrozenList(stylesheet.fonts)
+        wb._fills = FrozenList(stylesheet.fills)
         wb._differential_styles.styles = stylesheet.dxfs
         wb._number_formats = stylesheet.number_formats
         wb._protections = stylesheet.protections
@@ -226,7 +222,10 @@ def apply_stylesheet(archive, wb):
         wb._colors = stylesheet.colors.index
 
 
-def write_stylesheet(wb):
+def build_stylesheet(wb):
+    """
+    Stylesheet for the styles of a workbook
+    """
     stylesheet = Stylesheet()
     stylesheet.fonts = wb._fonts
     stylesheet.fills = wb._fills
@@ -257,4 +256,8 @@ def write_stylesheet(wb):
     stylesheet._split_named_styles(wb)
     stylesheet.tableStyles = wb._table_styles
 
-    return stylesheet.to_tree()
+    return stylesheet
+
+
+def write_stylesheet(wb):
+    return build_stylesheet(wb).to_tree()
@@ -210,6 +210,15 @@ class TestPatternFill:
         assert PatternFill.from_tree(xml) == PatternFill(**args)
 
 
+    def test_default_colors_not_shared(self, PatternFill):
+        from openpyxl import Workbook
+        Workbook() # registers and freezes the default fill
+        pf = PatternFill(patternType="solid")
+        pf.fgColor.rgb = "FFFF0000"
+        assert pf.fgColor.rgb == "FFFF0000"
+        assert PatternFill().fgColor == Color()
+
+
 def test_create_empty_fill():
     from ..fills import Fill
 
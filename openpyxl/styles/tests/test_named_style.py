@@ -51,6 +51,17 @@ class TestNamedStyle:
         assert style._wb is wb
 
 
+    def test_defaults_not_shared(self, NamedStyle):
+        wb = Workbook()
+        wb.add_named_style(NamedStyle(name="a"))
+        style = NamedStyle(name="b")
+        style.font.bold = True
+        style.border.outline = False
+        assert style.font.bold is True
+        assert style.border.outline is False
+        assert NamedStyle().font == Font()
+
+
     def test_as_tuple(self, NamedStyle):
         style = NamedStyle()
         assert style.as_tuple() == array('i', (0, 0, 0, 0, 0, 0, 0, 0, 0))
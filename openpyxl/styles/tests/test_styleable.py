@@ -27,6 +27,19 @@ def test_descriptor(Worksheet):
     assert styled.font == Font()
 
 
+def test_descriptor_frozen():
+    from openpyxl import Workbook
+    from ..fonts import Font
+
+    ws = Workbook().active
+    font = Font(b=True)
+    ws["A1"].font = font
+    ws["A2"].font = Font(b=True)
+    assert ws["A1"]._style.fontId == ws["A2"]._style.fontId
+    with pytest.raises(AttributeError):
+        font.b = False
+
+
 @pytest.fixture
 def Workbook():
 
@@ -194,12 +194,13 @@ def coordinate_to_tuple(coordinate):
     """
     Convert an Excel style coordinate to (row, colum) tuple
     """
-    for idx, c in enumerate(coordinate):
-        if c in digits:
-            break
-    col = coordinate[:idx].upper()
-    row = coordinate[idx:]
-    return int(row), _COL_STRING_CACHE[col]
+    col = coordinate.rstrip(digits)
+    row = coordinate[len(col):]
+    try:
+        column = _COL_STRING_CACHE[col]
+    except KeyError:
+        column = _COL_STRING_CACHE[col.upper()]
+    return int(row), column
 
 
 def range_to_tuple(range_string):
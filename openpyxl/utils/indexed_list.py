@@ -20,6 +20,10 @@ class IndexedList(list):
                 self._dict[val] = idx
                 list.append(self, val)
 
+    def __reduce__(self):
+        # the dictionary is rebuilt from the values when copied or unpickled
+        return self.__class__, (list(self),)
+
     def _rebuild_dict(self):
         self._dict = {}
         idx = 0
@@ -45,5 +49,30 @@ class IndexedList(list):
             list.append(self, value)
 
     def add(self, value):
-        self.append(value)
-        return self._dict[value]
+        idx = self._dict.get(value)
+        if idx is None:
+            self.append(value)
+            idx = len(self) - 1
+        return idx
+
+
+class FrozenList(IndexedList):
+    """
+    Indexed list of objects that are frozen as they are added, so that they
+    cannot change while they are used as keys and their hashes are only
+    worked out once
+    """
+
+    def __init__(self, iterable=None):
+        if iterable is not None:
+            iterable = list(iterable)
+            for value in iterable:
+                value._freeze()
+        super(FrozenList, self).__init__(iterable)
+
+
+    def append(self, value):
+        if value not in self._dict:
+            value._freeze()
+            self._dict[value] = len(self)
+            list.append(self, value)
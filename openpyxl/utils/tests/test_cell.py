@@ -92,9 +92,16 @@ def test_column_letter(value, expected):
     assert get_column_letter(value) == expected
 
 
-def test_coordinate_tuple():
+@pytest.mark.parametrize("coordinate, expected",
+                         [
+                             ("D15", (15, 4)),
+                             ("d15", (15, 4)),
+                             ("XFD1048576", (1048576, 16384)),
+                         ]
+                         )
+def test_coordinate_tuple(coordinate, expected):
     from .. import coordinate_to_tuple
-    assert coordinate_to_tuple("D15") == (15, 4)
+    assert coordinate_to_tuple(coordinate) == expected
 
 
 
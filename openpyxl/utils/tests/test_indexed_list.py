@@ -52,3 +52,34 @@ def test_table_builder(list):
             sb.append(letter)
         assert sb.index(letter) == result[letter]
     assert sb == ['a', 'b', 'c', 'd']
+
+
+def test_deepcopy(list):
+    from copy import deepcopy
+    l = list(['a', 'b'])
+    copied = deepcopy(l)
+    assert copied == ['a', 'b']
+    assert copied.index('b') == 1
+    copied.add('c')
+    assert l == ['a', 'b']
+
+
+def test_add(list):
+    l = list(['a', 'b'])
+    assert l.add('b') == 1
+    assert l.add('c') == 2
+    assert l == ['a', 'b', 'c']
+
+
+def test_frozen_list():
+    from ..indexed_list import FrozenList
+    from openpyxl.styles import Font
+
+    font = Font(b=True)
+    l = FrozenList([Font()])
+    assert l.add(font) == 1
+    assert l.add(Font(b=True)) == 1
+    assert font._hash is not None
+    assert l[0]._hash is not None
+    with pytest.raises(AttributeError):
+        font.b = False
@@ -0,0 +1,51 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Copy a workbook so that it can be saved while the original is changed
+
+The cells of worksheets are copied as compact records, see
+CellStore.snapshot(), and everything else is deep copied. References to the
+workbook and its sheets from charts, named styles and so on are redirected to
+the copies.
+"""
+
+from copy import deepcopy
+
+
+def _shared(wb):
+    """
+    Objects that are used when saving but cannot be copied
+    """
+    if wb.vba_archive is not None:
+        yield wb.vba_archive
+    for ws in wb._sheets:
+        for image in getattr(ws, "_images", []):
+            if hasattr(image._ref, "read"):
+                yield image._ref
+
+
+def snapshot_workbook(wb):
+    """
+    Return a copy of a workbook that shares nothing with it that can be
+    changed, apart from open files
+    """
+    memo = {}
+    for obj in _shared(wb):
+        memo[id(obj)] = obj
+
+    sheets = []
+    for ws in wb._sheets:
+        copied = ws.__class__.__new__(ws.__class__)
+        memo[id(ws)] = copied
+        cells = getattr(ws, "_cells", None)
+        if cells is not None:
+            memo[id(cells)] = cells.snapshot(copied)
+        sheets.append((ws, copied))
+
+    # cell styles have been added by the snapshots of the cells
+    copied_wb = wb.__class__.__new__(wb.__class__)
+    memo[id(wb)] = copied_wb
+    copied_wb.__dict__.update(deepcopy(wb.__dict__, memo))
+    for ws, copied in sheets:
+        copied.__dict__.update(deepcopy(ws.__dict__, memo))
+    return copied_wb
@@ -148,7 +148,7 @@ class WorkbookWriter:
         self.write_views()
         self.write_refs()
 
-        return tostring(self.package.to_tree())
+        return self.package.to_xml()
 
 
     def write_rels(self):
@@ -160,6 +160,10 @@ class WorkbookWriter:
         theme =  Relationship(type='theme', Target='theme/theme1.xml')
         self.rels.append(theme)
 
+        if self.wb.use_shared_strings:
+            strings = Relationship(type='sharedStrings', Target='sharedStrings.xml')
+            self.rels.append(strings)
+
         if self.wb.vba_archive:
             vba =  Relationship(type='', Target='vbaProject.bin')
             vba.Type ='http://schemas.microsoft.com/office/2006/relationships/vbaProject'
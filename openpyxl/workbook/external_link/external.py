@@ -146,6 +146,7 @@ class ExternalBook(Serialisable):
 class ExternalLink(Serialisable):
 
     tagname = "externalLink"
+    xmlns = SHEET_MAIN_NS
 
     _id = None
     _path = "/xl/externalLinks/externalLink{0}.xml"
@@ -167,12 +168,6 @@ class ExternalLink(Serialisable):
         # ignore other items for the moment.
 
 
-    def to_tree(self):
-        node = super(ExternalLink, self).to_tree()
-        node.set("xmlns", SHEET_MAIN_NS)
-        return node
-
-
     @property
     def path(self):
         return self._path.format(self._id)
@@ -0,0 +1,76 @@
+# Copyright (c) 2010-2022 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.chart import BarChart, Reference
+from openpyxl.comments import Comment
+from openpyxl.styles import Font
+
+
+@pytest.fixture
+def snapshot_workbook():
+    from .._snapshot import snapshot_workbook
+    return snapshot_workbook
+
+
+def test_independent(snapshot_workbook):
+    wb = Workbook()
+    ws = wb.active
+    ws.append([1, "a"])
+    ws["A1"].font = Font(bold=True)
+    ws.column_dimensions["B"].width = 20
+
+    copied = snapshot_workbook(wb)
+    ws["A1"] = 2
+    ws["A1"].font = Font(italic=True)
+    ws.column_dimensions["B"].width = 5
+    ws.title = "Changed"
+    wb.create_sheet("New")
+
+    assert copied.sheetnames == ["Sheet"]
+    cws = copied.active
+    assert cws.parent is copied
+    assert cws["A1"].value == 1
+    assert cws["A1"].font.b is True
+    assert cws["B1"].value == "a"
+    assert cws.column_dimensions["B"].width == 20
+    assert cws.column_dimensions.worksheet is cws
+
+
+def test_references(snapshot_workbook):
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(5):
+        ws.append([idx])
+    ws["A1"].comment = Comment("text", "author")
+    chart = BarChart()
+    chart.add_data(Reference(ws, min_col=1, min_row=1, max_row=5))
+    ws.add_chart(chart, "C1")
+
+    copied = snapshot_workbook(wb)
+    cws = copied.active
+    assert cws._charts[0] is not chart
+    assert cws["A1"].comment.parent is cws["A1"]
+    assert ws["A1"].comment.parent is ws["A1"]
+
+    out = BytesIO()
+    copied.save(out)
+    wb = load_workbook(out)
+    assert wb.active["A1"].comment.text == "text"
+    assert wb.active["A5"].value == 4
+
+
+def test_loaded(snapshot_workbook):
+    wb = Workbook()
+    wb.active.append([1, 2, 3])
+    src = BytesIO()
+    wb.save(src)
+
+    wb = load_workbook(src)
+    copied = snapshot_workbook(wb)
+    wb.active.insert_cols(1)
+    wb.active["B1"] = "changed"
+    assert [c.value for c in copied.active[1]] == [1, 2, 3]
@@ -2,6 +2,7 @@
 
 """Workbook is the top-level container for all document information."""
 from copy import copy
+from zipfile import ZIP_DEFLATED
 
 from openpyxl.compat import deprecated
 from openpyxl.worksheet.worksheet import Worksheet
@@ -10,11 +11,16 @@ from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.copier import WorksheetCopy
 
 from openpyxl.utils import quote_sheetname
-from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.utils.indexed_list import IndexedList, FrozenList
 from openpyxl.utils.datetime  import WINDOWS_EPOCH, MAC_EPOCH
 from openpyxl.utils.exceptions import ReadOnlyWorkbookException
 
-from openpyxl.writer.excel import save_workbook
+from openpyxl.writer.excel import (
+    save_workbook,
+    save_in_background,
+    stream_workbook,
+    CHUNK_SIZE,
+)
 
 from openpyxl.styles.cell_style import StyleArray
 from openpyxl.styles.named_styles import NamedStyle
@@ -78,6 +84,9 @@ class Workbook(object):
         self.epoch = WINDOWS_EPOCH
         self.encoding = "utf-8"
         self.iso_dates = iso_dates
+        self.fast_rows = False
+        self.use_shared_strings = False
+        self.buffer_size = None
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -90,15 +99,15 @@ class Workbook(object):
     def _setup_styles(self):
         """Bootstrap styles"""
 
-        self._fonts = IndexedList()
+        self._fonts = FrozenList()
         self._fonts.add(DEFAULT_FONT)
 
-        self._alignments = IndexedList([Alignment()])
+        self._alignments = FrozenList([Alignment()])
 
-        self._borders = IndexedList()
+        self._borders = FrozenList()
         self._borders.add(DEFAULT_BORDER)
 
-        self._fills = IndexedList()
+        self._fills = FrozenList()
         self._fills.add(DEFAULT_EMPTY_FILL)
         self._fills.add(DEFAULT_GRAY_FILL)
 
@@ -106,7 +115,7 @@ class Workbook(object):
         self._date_formats = {}
         self._timedelta_formats = {}
 
-        self._protections = IndexedList([Protection()])
+        self._protections = FrozenList([Protection()])
 
         self._colors = COLOR_INDEX
         self._cell_styles = IndexedList([StyleArray()])
@@ -391,20 +400,61 @@ class Workbook(object):
         return ct
 
 
-    def save(self, filename):
+    def save(self, filename, compression=ZIP_DEFLATED, compresslevel=None, workers=None):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        Parts are deflated at the default level unless `compresslevel` is
+        given. `compression=ZIP_STORED` saves without compression, and
+        `workers` sets the number of threads that compress large parts in
+        parallel.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequents attempts to
             modify or save the file will raise an :class:`openpyxl.shared.exc.WorkbookAlreadySaved` exception.
         """
+        self._prepare_save()
+        save_workbook(self, filename, compression, compresslevel, workers)
+
+
+    def _prepare_save(self):
         if self.read_only:
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
-        save_workbook(self, filename)
+
+
+    def save_stream(self, chunk_size=CHUNK_SIZE, compression=ZIP_DEFLATED,
+                    compresslevel=None, workers=None):
+        """Return an iterator of chunks of bytes of the saved workbook.
+
+        The workbook is saved in another thread and chunks are returned as
+        soon as they are written, so that they can be sent on without
+        waiting for the whole file or keeping it in memory. Do not change
+        the workbook until all chunks have been read.
+
+        Options are as for :func:`save`. Objects with a `write()` method can
+        also be passed directly to :func:`save` even if they are not
+        seekable.
+        """
+        self._prepare_save()
+        return stream_workbook(self, chunk_size, compression=compression,
+                               compresslevel=compresslevel, workers=workers)
+
+
+    def save_in_background(self, filename, compression=ZIP_DEFLATED,
+                           compresslevel=None, workers=None):
+        """Save a copy of the workbook in another thread.
+
+        The copy is taken before this returns so that the workbook can be
+        changed while it is saved. Returns a
+        :class:`concurrent.futures.Future` that is done when the file has
+        been written. Options are as for :func:`save`.
+        """
+        self._prepare_save()
+        return save_in_background(self, filename, compression=compression,
+                                  compresslevel=compresslevel, workers=workers)
 
 
     @property
@@ -441,6 +491,8 @@ class Workbook(object):
         """
         if hasattr(self, '_archive'):
             self._archive.close()
+        if hasattr(self, '_shared_strings'):
+            self._shared_strings.close()
 
 
     def _duplicate_name(self, name):
@@ -0,0 +1,452 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Storage for the cells of a worksheet
+
+Cells are kept by row. Each row is either a dictionary of Cell objects by
+column or, for rows read from a file that have not been used yet, a
+LoadedRow of compact records. Rows and the columns within rows are kept in
+order so that cells can be returned sorted without sorting all of them, and
+the bounds of the cells are updated as cells are added.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from copy import copy, deepcopy
+import datetime
+from decimal import Decimal
+
+from openpyxl.cell import Cell
+
+# values that can be shared with a snapshot
+IMMUTABLE_TYPES = frozenset([type(None), bool, int, float, Decimal, str,
+                             datetime.datetime, datetime.date, datetime.time,
+                             datetime.timedelta])
+
+
+class LoadedRow:
+    """
+    Cells of a row read from a file that have not been used yet, sorted by
+    column.
+    """
+
+    __slots__ = ("columns", "values", "data_types", "styles")
+
+    def __init__(self, cells):
+        self.columns = array("L")
+        self.values = []
+        self.data_types = []
+        self.styles = array("L")
+
+        last = 0
+        for cell in cells:
+            if cell[1] <= last:
+                # unsorted or duplicate columns, the last one wins
+                cells = sorted({c[1]:c for c in cells}.values(), key=lambda c: c[1])
+                self.__init__(cells)
+                return
+            last = cell[1]
+
+        for _, column, value, data_type, style_id in cells:
+            self.columns.append(column)
+            self.values.append(value)
+            self.data_types.append(data_type)
+            self.styles.append(style_id)
+
+
+    def __len__(self):
+        return len(self.columns)
+
+
+    def __iter__(self):
+        return iter(self.columns)
+
+
+    def __contains__(self, column):
+        idx = bisect_left(self.columns, column)
+        return idx < len(self.columns) and self.columns[idx] == column
+
+
+    def copy(self):
+        loaded = LoadedRow.__new__(LoadedRow)
+        loaded.columns = self.columns[:]
+        loaded.values = [value if value.__class__ in IMMUTABLE_TYPES else deepcopy(value)
+                         for value in self.values]
+        loaded.data_types = self.data_types[:]
+        loaded.styles = self.styles[:]
+        return loaded
+
+
+    def is_shareable(self):
+        """
+        Whether the row can be shared with a snapshot. Rows are copied before
+        they are changed so only values that can be changed stop this.
+        """
+        return IMMUTABLE_TYPES.issuperset(map(type, self.values))
+
+
+    def records(self, row):
+        """
+        The cells as tuples returned by a WorkSheetParser
+        """
+        return [(row, column, value, data_type, style)
+                for column, value, data_type, style
+                in zip(self.columns, self.values, self.data_types, self.styles)]
+
+
+    def shift(self, min_col, offset):
+        """
+        Move the cells from min_col onwards by offset columns. When moving
+        to the left the cells that are moved over are removed.
+        """
+        columns = self.columns
+        start = bisect_left(columns, min_col)
+        if offset < 0:
+            first = bisect_left(columns, min_col + offset)
+            for seq in (columns, self.values, self.data_types, self.styles):
+                del seq[first:start]
+            start = first
+        for idx in range(start, len(columns)):
+            columns[idx] += offset
+
+
+def _shift_columns(cells, min_col, offset):
+    """
+    Move the cells of a row from min_col onwards by offset columns keeping
+    the row in order.
+    """
+    if offset < 0:
+        for column in [c for c in cells if min_col + offset <= c < min_col]:
+            del cells[column]
+    moved = [(column, cells.pop(column)) for column in list(cells) if column >= min_col]
+    for column, cell in sorted(moved, key=lambda item: item[0]):
+        column += offset
+        cell.column = column
+        cells[column] = cell
+
+
+def _copy_cells(cells, worksheet):
+    """
+    Copy a row of cells to another worksheet
+    """
+    copied = {}
+    for column, cell in cells.items():
+        new = Cell(worksheet, row=cell.row, column=column, style_array=copy(cell._style))
+        value = cell._value
+        if value.__class__ not in IMMUTABLE_TYPES:
+            value = deepcopy(value)
+        new._value = value
+        new.data_type = cell.data_type
+        if cell.hyperlink is not None:
+            new._hyperlink = copy(cell.hyperlink)
+        if cell._comment is not None:
+            new.comment = copy(cell._comment)
+        copied[column] = new
+    return copied
+
+
+class CellStore(MutableMapping):
+    """
+    Cells of a worksheet keyed by (row, column).
+
+    Cells read from a file are only turned into Cell objects when a cell of
+    the row is used.
+    """
+
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+        self._rows = {}
+        self._count = 0
+        self._bounds = None
+        self._ordered = True # rows are in order
+        self._last = 0
+
+
+    def _add_row(self, row, cells):
+        if row < self._last:
+            self._ordered = False
+        else:
+            self._last = row
+        self._rows[row] = cells
+
+
+    def _extend(self, row, min_col, max_col):
+        bounds = self._bounds
+        if bounds is None:
+            if self._count:
+                return # recalculated when needed
+            self._bounds = [min_col, row, max_col, row]
+            return
+        if min_col < bounds[0]:
+            bounds[0] = min_col
+        if row < bounds[1]:
+            bounds[1] = row
+        if max_col > bounds[2]:
+            bounds[2] = max_col
+        if row > bounds[3]:
+            bounds[3] = row
+
+
+    @property
+    def bounds(self):
+        """
+        (min_col, min_row, max_col, max_row) of the cells or None if there
+        are no cells
+        """
+        if not self._count:
+            return
+        if self._bounds is None:
+            min_col = min_row = float("inf")
+            max_col = max_row = 0
+            for row, cells in self._rows.items():
+                if row < min_row:
+                    min_row = row
+                if row > max_row:
+                    max_row = row
+                if cells.__class__ is LoadedRow:
+                    first, last = cells.columns[0], cells.columns[-1]
+                else:
+                    first, last = min(cells), max(cells)
+                if first < min_col:
+                    min_col = first
+                if last > max_col:
+                    max_col = last
+            self._bounds = [min_col, min_row, max_col, max_row]
+        return tuple(self._bounds)
+
+
+    def load_row(self, row, cells):
+        """
+        Add the cells of a row read by a WorkSheetParser
+        """
+        if not cells:
+            return
+        existing = self._rows.get(row)
+        if existing is None:
+            loaded = LoadedRow(cells)
+            self._add_row(row, loaded)
+        elif existing.__class__ is LoadedRow:
+            # rows should only appear once but keep the cells of both
+            loaded = LoadedRow(existing.records(row) + list(cells))
+            self._count -= len(existing)
+            self._rows[row] = loaded
+        else:
+            loaded = LoadedRow(cells)
+            self._count -= len(existing)
+            existing.update(self._create(row, loaded))
+            self._count += len(existing) - len(loaded)
+        self._count += len(loaded)
+        self._extend(row, loaded.columns[0], loaded.columns[-1])
+
+
+    def _create(self, row, loaded):
+        """
+        Create the cells of a loaded row
+        """
+        ws = self.worksheet
+        styles = ws.parent._cell_styles
+        used = {}
+        for column, value, data_type, style_id in zip(
+            loaded.columns, loaded.values, loaded.data_types, loaded.styles):
+            try:
+                style = used[style_id]
+            except KeyError:
+                style = styles[style_id]
+                if not any(style):
+                    style = None
+                used[style_id] = style
+            cell = Cell(ws, row=row, column=column, style_array=style)
+            cell._value = value
+            cell.data_type = data_type
+            yield column, cell
+
+
+    def _materialize(self, row):
+        """
+        Replace a loaded row with its cells. Cells are usually used a row at
+        a time so this is cheaper than creating them one by one.
+        """
+        cells = dict(self._create(row, self._rows[row]))
+        self._rows[row] = cells
+        return cells
+
+
+    def __getitem__(self, key):
+        row, column = key
+        cells = self._rows.get(row)
+        if cells is None or column not in cells:
+            raise KeyError(key)
+        if cells.__class__ is LoadedRow:
+            cells = self._materialize(row)
+        return cells[column]
+
+
+    def __contains__(self, key):
+        cells = self._rows.get(key[0])
+        return cells is not None and key[1] in cells
+
+
+    def __setitem__(self, key, cell):
+        row, column = key
+        cells = self._rows.get(row)
+        if cells is None:
+            cells = {}
+            self._add_row(row, cells)
+        elif cells.__class__ is LoadedRow:
+            cells = self._materialize(row)
+        if column not in cells:
+            self._count += 1
+            self._extend(row, column, column)
+        cells[column] = cell
+
+
+    def __delitem__(self, key):
+        row, column = key
+        cells = self._rows.get(row)
+        if cells is None or column not in cells:
+            raise KeyError(key)
+        if cells.__class__ is LoadedRow:
+            cells = self._materialize(row)
+        del cells[column]
+        self._count -= 1
+        if not cells:
+            del self._rows[row]
+        bounds = self._bounds
+        if bounds is not None and (column in (bounds[0], bounds[2])
+                                   or row in (bounds[1], bounds[3])):
+            self._bounds = None
+
+
+    def _sorted_rows(self):
+        """
+        Put the rows and the columns of each row in order
+        """
+        rows = self._rows
+        if not self._ordered:
+            self._rows = rows = {row:rows[row] for row in sorted(rows)}
+            self._ordered = True
+            self._last = max(rows, default=0)
+        for row, cells in rows.items():
+            if cells.__class__ is not LoadedRow:
+                columns = sorted(cells)
+                if columns != list(cells):
+                    rows[row] = {column:cells[column] for column in columns}
+        return rows
+
+
+    def __iter__(self):
+        for row, cells in list(self._sorted_rows().items()):
+            for column in cells:
+                yield row, column
+
+
+    def __len__(self):
+        return self._count
+
+
+    def has_row(self, row):
+        return row in self._rows
+
+
+    def iter_rows(self):
+        """
+        Return (row, [cells]) for all rows in order. Cells that have not been
+        used are returned as new cells that are not kept, so changes to them
+        are lost.
+        """
+        for row, cells in list(self._sorted_rows().items()):
+            if cells.__class__ is LoadedRow:
+                yield row, [cell for column, cell in self._create(row, cells)]
+            else:
+                yield row, list(cells.values())
+
+
+    def iter_cells(self):
+        """
+        Return ((row, column), cell) for all cells in order. Cells that have
+        not been used are returned as for iter_rows.
+        """
+        for row, cells in self.iter_rows():
+            for cell in cells:
+                yield (row, cell.column), cell
+
+
+    def snapshot(self, worksheet):
+        """
+        Copy of the cells for a copy of the worksheet that shares nothing that
+        can be changed. Cells are kept as records as if they had been loaded
+        unless they have comments or hyperlinks, and rows that have not been
+        used since they were loaded are shared.
+        """
+        store = CellStore(worksheet)
+        rows = store._rows
+        plain = None
+        for row, cells in self._rows.items():
+            if cells.__class__ is LoadedRow:
+                rows[row] = cells if cells.is_shareable() else cells.copy()
+                continue
+            records = []
+            for column, cell in cells.items():
+                if cell._comment is not None or cell.hyperlink is not None:
+                    rows[row] = _copy_cells(cells, worksheet)
+                    break
+                value = cell._value
+                if value.__class__ not in IMMUTABLE_TYPES:
+                    value = deepcopy(value)
+                if cell.has_style:
+                    style_id = cell.style_id
+                else:
+                    if plain is None:
+                        plain = cell.style_id
+                    style_id = plain
+                records.append((row, column, value, cell.data_type, style_id))
+            else:
+                if records:
+                    rows[row] = LoadedRow(records)
+        store._count = self._count
+        store._ordered = self._ordered
+        store._last = self._last
+        if self._bounds is not None:
+            store._bounds = list(self._bounds)
+        return store
+
+
+    def shift_rows(self, min_row, offset):
+        """
+        Move the rows from min_row onwards by offset rows. When moving up the
+        rows that are moved over are removed.
+        """
+        rows = self._rows
+        if offset < 0:
+            for row in [r for r in rows if min_row + offset <= r < min_row]:
+                self._count -= len(rows.pop(row))
+        moved = [(row, rows.pop(row)) for row in list(rows) if row >= min_row]
+        self._last = max(rows, default=0)
+        for row, cells in sorted(moved, key=lambda item: item[0]):
+            row += offset
+            if cells.__class__ is not LoadedRow:
+                for cell in cells.values():
+                    cell.row = row
+            self._add_row(row, cells)
+        self._bounds = None
+
+
+    def shift_columns(self, min_col, offset):
+        """
+        Move the columns from min_col onwards by offset columns. When moving
+        left the columns that are moved over are removed.
+        """
+        rows = self._rows
+        for row, cells in list(rows.items()):
+            count = len(cells)
+            if cells.__class__ is LoadedRow:
+                # loaded rows may be shared with snapshots
+                rows[row] = cells = cells.copy()
+                cells.shift(min_col, offset)
+            else:
+                _shift_columns(cells, min_col, offset)
+            self._count += len(cells) - count
+            if not cells:
+                del rows[row]
+        self._bounds = None
@@ -3,11 +3,24 @@
 """ Read worksheets on-demand
 """
 
+from functools import partial
+from multiprocessing import Pool
+import os
+from zipfile import ZipFile
+
 from .worksheet import Worksheet
 from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import get_column_letter, column_index_from_string
 
 from ._reader import WorkSheetParser
+from ._row_index import (
+    RowIndex,
+    Inflater,
+    ResumedSource,
+    open_deflated,
+    scan_rows,
+    INFLATE_SPACING,
+)
 
 
 def read_dimension(source):
@@ -15,11 +28,47 @@ def read_dimension(source):
     return parser.parse_dimensions()
 
 
+# state of worker processes, see _init_worker
+_worker = {}
+
+
+def _init_worker(filename, worksheet_path, header, shared_strings, data_only,
+                 epoch, date_formats):
+    _worker.update(filename=filename, worksheet_path=worksheet_path,
+                   header=header, shared_strings=shared_strings,
+                   data_only=data_only, epoch=epoch, date_formats=date_formats)
+
+
+def _parse_partition(task):
+    """
+    Parse a range of rows in a worker process starting at a checkpoint of
+    the row index.
+    """
+    offset, formulae, min_row, max_row, columns = task
+    rows = []
+    with ZipFile(_worker['filename']) as archive:
+        src = archive.open(_worker['worksheet_path'])
+        src = ResumedSource(_worker['header'], src, offset)
+        parser = WorkSheetParser(src, _worker['shared_strings'],
+                                 data_only=_worker['data_only'], epoch=_worker['epoch'],
+                                 date_formats=_worker['date_formats'],
+                                 columns=columns)
+        parser.shared_formulae = formulae
+        for idx, cells in parser.parse():
+            if max_row is not None and idx > max_row:
+                break
+            if idx >= min_row:
+                rows.append((idx, cells))
+        src.close()
+    return rows
+
+
 class ReadOnlyWorksheet(object):
 
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
+    _row_index = None
 
     # from Standard Worksheet
     # Methods from Worksheet
@@ -55,10 +104,210 @@ class ReadOnlyWorksheet(object):
         return self.parent._archive.open(self._worksheet_path)
 
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+    def _get_raw_source(self):
+        """Compressed worksheet data if it is deflated"""
+        return open_deflated(self.parent._archive, self._worksheet_path)
+
+
+    def _get_parser(self, min_row=None, columns=None):
+        """
+        Return the source and a parser for it. If the worksheet has a row
+        index then parsing starts at the last checkpoint before min_row.
+        """
+        src = None
+        formulae = {}
+        index = self._row_index
+        if index is not None and min_row is not None:
+            idx = index.find(min_row)
+            if idx is not None:
+                src = index.open(idx, self._get_source, self._get_raw_source)
+                formulae = index.shared_formulae(idx)
+        if src is None:
+            src = self._get_source()
+
+        parser = WorkSheetParser(src, self._shared_strings,
+                                 data_only=self.parent.data_only, epoch=self.parent.epoch,
+                                 date_formats=self.parent._date_formats,
+                                 columns=columns)
+        parser.shared_formulae = formulae
+        return src, parser
+
+
+    def create_row_index(self, step=100, cache_size=64):
+        """
+        Index the worksheet so that rows and cells can be read without
+        parsing the worksheet from the beginning.
+
+        The position of every `step` rows is recorded and up to `cache_size`
+        blocks of rows between these positions are kept in memory.
+        """
+        src = self._get_raw_source()
+        if src is not None:
+            src = Inflater(src, spacing=INFLATE_SPACING)
+        else:
+            src = self._get_source()
+        result = scan_rows(src, step)
+        src.close()
+        if result is None:
+            raise ValueError("Worksheets can only be indexed if rows are numbered")
+
+        header, checkpoints, shared = result
+        formulae = None
+        if shared and not self.parent.data_only:
+            formulae = self._get_shared_formulae([row for row, offset in checkpoints])
+        self._row_index = RowIndex(header, checkpoints, cache_size, formulae,
+                                   points=getattr(src, "points", ()))
+
+
+    def _get_shared_formulae(self, rows):
+        """
+        Shared formulae are defined in the first cell that uses them, so
+        collect those known at each checkpoint.
+        """
+        formulae = []
+        rows = iter(rows)
+        checkpoint = next(rows, None)
+        src, parser = self._get_parser()
+        for idx, _ in parser.parse():
+            while checkpoint is not None and idx >= checkpoint:
+                formulae.append(dict(parser.shared_formulae))
+                checkpoint = next(rows, None)
+            if checkpoint is None:
+                break
+        src.close()
+        return formulae
+
+
+    def drop_row_index(self):
+        """
+        Remove the row index and any cached rows
+        """
+        self._row_index = None
+
+
+    def _split_index(self, n, min_row=None, max_row=None):
+        """
+        Split the checkpoints of the row index covering min_row to max_row
+        into at most n consecutive ranges as (first, end) positions.
+        """
+        if self._row_index is None:
+            self.create_row_index()
+        index = self._row_index
+
+        first = 0
+        if min_row is not None:
+            first = index.find(min_row) or 0
+        end = len(index.rows)
+        if max_row is not None:
+            idx = index.find(max_row)
+            end = 0 if idx is None else idx + 1
+
+        count = end - first
+        n = max(1, min(n, count))
+        bounds = [first + count * i // n for i in range(n + 1)]
+        return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+    def partitions(self, n):
+        """
+        Split the worksheet into at most n ranges of rows with roughly the
+        same number of rows that can be read independently, for example
+        with :func:`iter_rows` in separate processes.
+
+        Returns a list of (min_row, max_row). max_row is None for the last
+        range. A row index is created if the worksheet has none, so a
+        ValueError is raised if the rows of the worksheet are not numbered.
+        """
+        ranges = []
+        for first, end in self._split_index(n):
+            rows = self._row_index.rows
+            max_row = None
+            if end < len(rows):
+                max_row = rows[end] - 1
+            ranges.append((rows[first], max_row))
+        return ranges
+
+
+    def iter_rows_parallel(self, min_row=None, max_row=None, min_col=None,
+                           max_col=None, values_only=False, workers=None):
+        """
+        Produces cells from the worksheet, by row, like :func:`iter_rows`.
+        Ranges of rows are parsed in a pool of processes but rows are
+        returned in order.
+
+        A row index is created if the worksheet has none. Rows are parsed in
+        this process if the workbook was not loaded from a file or if the
+        rows of the worksheet are not numbered.
+
+        :param workers: number of processes, defaults to the number of CPUs
+        :type workers: int
+
+        :rtype: generator
+        """
+        min_col = min_col or 1
+        min_row = min_row or 1
+        max_col = max_col or self.max_column
+        max_row = max_row or self.max_row
+        if workers is None:
+            workers = os.cpu_count() or 1
+        return self._cells_by_row(min_col, min_row, max_col, max_row, values_only,
+                                  parse=partial(self._parse_parallel, workers=workers))
+
+
+    def _parse_rows(self, min_row=None, max_row=None, columns=None):
+        src, parser = self._get_parser(min_row, columns)
+        try:
+            yield from parser.parse()
+        finally:
+            src.close() # make sure source is always closed
+
+
+    def _parse_parallel(self, min_row=None, max_row=None, columns=None, workers=1):
+        """
+        Parse ranges of rows in a pool of processes
+        """
+        filename = self.parent._archive.filename
+        if workers < 2 or filename is None or not os.path.isfile(filename):
+            yield from self._parse_rows(min_row, max_row, columns)
+            return
+
+        if self._row_index is None:
+            try:
+                self.create_row_index()
+            except ValueError:
+                # unnumbered rows can only be counted by parsing them in order
+                yield from self._parse_rows(min_row, max_row, columns)
+                return
+
+        # smaller tasks keep the workers busy and the memory use down
+        ranges = self._split_index(workers * 4, min_row, max_row)
+        index = self._row_index
+        tasks = []
+        for first, end in ranges:
+            last = max_row
+            if end < len(index.rows):
+                last = index.rows[end] - 1
+            tasks.append((index.offsets[first], index.shared_formulae(first),
+                          min_row or 1, last, columns))
+
+        parent = self.parent
+        args = (filename, self._worksheet_path, index.header, self._shared_strings,
+                parent.data_only, parent.epoch, parent._date_formats)
+        with Pool(min(workers, len(tasks) or 1), _init_worker, args) as pool:
+            for rows in pool.imap(_parse_partition, tasks):
+                yield from rows
+
+
+    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False,
+                      columns=None, parse=None):
         """
         The source worksheet file may have columns or rows missing.
         Missing cells will be created.
+
+        If a sequence of columns is provided then only these are returned, in
+        the order given, and min_col and max_col are ignored.
+
+        Rows are parsed by `parse(min_row, max_row, columns)` if it is provided.
         """
         filler = EMPTY_CELL
         if values_only:
@@ -67,16 +316,21 @@ class ReadOnlyWorksheet(object):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
         empty_row = []
-        if max_col is not None:
+        selected = None
+        if columns is not None:
+            empty_row = (filler,) * len(columns)
+            selected = frozenset(columns)
+            positions = {col:idx for idx, col in enumerate(columns)}
+        elif max_col is not None:
             empty_row = (filler,) * (max_col + 1 - min_col)
+            selected = range(min_col, max_col + 1)
 
+        if parse is None:
+            parse = self._parse_rows
         counter = min_row
         idx = 1
-        src = self._get_source()
-        parser = WorkSheetParser(src, self._shared_strings,
-                                 data_only=self.parent.data_only, epoch=self.parent.epoch,
-                                 date_formats=self.parent._date_formats)
-        for idx, row in parser.parse():
+        rows = parse(min_row, max_row, selected)
+        for idx, row in rows:
             if max_row is not None and idx > max_row:
                 break
 
@@ -87,11 +341,14 @@ class ReadOnlyWorksheet(object):
 
             # return cells from a row
             if counter <= idx:
-                row = self._get_row(row, min_col, max_col, values_only)
+                if columns is not None:
+                    row = self._get_selected(row, positions, values_only)
+                else:
+                    row = self._get_row(row, min_col, max_col, values_only)
                 counter += 1
                 yield row
 
-        src.close() # make sure source is always closed
+        rows.close()
 
         if max_row is not None and max_row < idx:
             for _ in range(counter, max_row+1):
@@ -105,7 +362,7 @@ class ReadOnlyWorksheet(object):
         if not row and not max_col: # in case someone wants to force rows where there aren't any
             return ()
 
-        max_col = max_col or  row[-1]['column']
+        max_col = max_col or  row[-1][1]
         row_width = max_col + 1 - min_col
 
         new_row = [EMPTY_CELL] * row_width
@@ -113,24 +370,104 @@ class ReadOnlyWorksheet(object):
             new_row = [None] * row_width
 
         for cell in row:
-            counter = cell['column']
+            counter = cell[1]
             if min_col <= counter <= max_col:
                 idx = counter - min_col # position in list of cells returned
-                new_row[idx] = cell['value']
-                if not values_only:
-                    new_row[idx] = ReadOnlyCell(self, **cell)
+                if values_only:
+                    new_row[idx] = cell[2]
+                else:
+                    new_row[idx] = ReadOnlyCell(self, *cell)
 
         return tuple(new_row)
 
 
+    def _get_selected(self, row, positions, values_only=False):
+        """
+        Return the cells or values in a row for the selected columns
+        """
+        new_row = [EMPTY_CELL] * len(positions)
+        if values_only:
+            new_row = [None] * len(positions)
+
+        for cell in row:
+            idx = positions[cell[1]]
+            if values_only:
+                new_row[idx] = cell[2]
+            else:
+                new_row[idx] = ReadOnlyCell(self, *cell)
+
+        return tuple(new_row)
+
+
+    def iter_selected_columns(self, columns, min_row=None, max_row=None, values_only=False):
+        """
+        Produces cells from selected columns of the worksheet, by row.
+
+        Cells in other columns are skipped by the parser, so reading a few
+        columns of a wide worksheet is considerably faster than using
+        :func:`iter_rows` and discarding the rest.
+
+        :param columns: column indices (1-based) or letters, in the order they should be returned
+        :type columns: sequence
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :param values_only: whether only cell values should be returned
+        :type values_only: bool
+
+        :rtype: generator
+        """
+        columns = [column_index_from_string(col) if isinstance(col, str) else col
+                   for col in columns]
+        if len(set(columns)) != len(columns):
+            raise ValueError("Columns can only be selected once")
+        min_row = min_row or 1
+        return self._cells_by_row(None, min_row, None, max_row, values_only, columns=columns)
+
+
     def _get_cell(self, row, column):
         """Cells are returned by a generator which can be empty"""
+        if self._row_index is not None:
+            return self._get_indexed_cell(row, column)
         for row in self._cells_by_row(column, row, column, row):
             if row:
                 return row[0]
         return EMPTY_CELL
 
 
+    def _get_indexed_cell(self, row, column):
+        """
+        Get a cell from the cached block of rows containing it
+        """
+        index = self._row_index
+        idx = index.find(row)
+        if idx is None:
+            return EMPTY_CELL
+        block = index.get_block(idx, self._parse_block)
+        cells = block.get(row)
+        if cells:
+            return self._get_row(cells, column, column)[0]
+        return EMPTY_CELL
+
+
+    def _parse_block(self, min_row, max_row=None):
+        """
+        Return the cells in rows from min_row up to but excluding max_row
+        """
+        rows = {}
+        src, parser = self._get_parser(min_row)
+        for row_idx, cells in parser.parse():
+            if max_row is not None and row_idx >= max_row:
+                break
+            rows[row_idx] = cells
+        src.close()
+        return rows
+
+
     def calculate_dimension(self, force=False):
         if not all([self.max_column, self.max_row]):
             if force:
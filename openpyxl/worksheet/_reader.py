@@ -5,11 +5,12 @@ from copy import copy
 from warnings import warn
 
 # compatibility imports
-from openpyxl.xml.functions import iterparse
+from openpyxl import LXML
+from openpyxl.xml.functions import iterparse_tags
 
 # package imports
-from openpyxl.cell import Cell, MergedCell
-from openpyxl.cell.text import Text
+from openpyxl.cell import MergedCell
+from openpyxl.reader.strings import get_text_content
 from openpyxl.worksheet.dimensions import (
     ColumnDimension,
     RowDimension,
@@ -75,6 +76,18 @@ DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
 CUSTOM_VIEWS_TAG = '{%s}customSheetViews' % SHEET_MAIN_NS
 
 
+def _release(element):
+    """
+    Clear an element that has been processed. With lxml previous siblings are
+    also removed so that the tree does not grow with the size of the sheet.
+    """
+    element.clear()
+    if LXML:
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
+
 def _cast_number(value):
     "Convert numbers as string to an int or float"
     if "." in value or "E" in value or "e" in value:
@@ -83,11 +96,19 @@ def _cast_number(value):
 
 
 class WorkSheetParser(object):
+    """
+    Parse a worksheet
+
+    If columns is provided, usually as a range or a set of column indices,
+    only cells in those columns are returned. Other cells are skipped before
+    their values are converted.
+    """
 
     def __init__(self, src, shared_strings, data_only=False,
                  epoch=WINDOWS_EPOCH, date_formats=set(),
-                 timedelta_formats=set()):
+                 timedelta_formats=set(), columns=None):
         self.min_row = self.min_col = None
+        self.columns = columns
         self.epoch = epoch
         self.source = src
         self.shared_strings = shared_strings
@@ -139,7 +160,8 @@ class WorkSheetParser(object):
 
         }
 
-        it = iterparse(self.source) # add a finaliser to close the source when this becomes possible
+        tags = set(dispatcher) | set(properties) | {ROW_TAG}
+        it = iterparse_tags(self.source, tags) # add a finaliser to close the source when this becomes possible
 
         for _, element in it:
             tag_name = element.tag
@@ -153,7 +175,7 @@ class WorkSheetParser(object):
                 element.clear()
             elif tag_name == ROW_TAG:
                 row = self.parse_row(element)
-                element.clear()
+                _release(element)
                 yield row
 
 
@@ -161,30 +183,42 @@ class WorkSheetParser(object):
         """
         Get worksheet dimensions if they are provided.
         """
-        it = iterparse(self.source)
+        # attributes are available at the start of an element so the
+        # parser can stop as soon as the cells are reached
+        it = iterparse_tags(self.source, (DIMENSION_TAG, DATA_TAG), events=("start",))
 
         for _event, element in it:
             if element.tag == DIMENSION_TAG:
                 dim = SheetDimension.from_tree(element)
                 return dim.boundaries
 
-            elif element.tag == DATA_TAG:
-                # Dimensions missing
-                break
-            element.clear()
+            # Dimensions missing
+            break
 
 
     def parse_cell(self, element):
+        """
+        Return a tuple of (row, column, value, data_type, style_id)
+        """
         data_type = element.get('t', 'n')
         coordinate = element.get('r')
         style_id = element.get('s', 0)
         if style_id:
             style_id = int(style_id)
 
+        # a single pass over the children is faster than find() with lxml
+        value = formula = inline = None
+        for child in element:
+            tag = child.tag
+            if tag == VALUE_TAG:
+                value = child.text or None
+            elif tag == FORMULA_TAG:
+                formula = child
+            elif tag == INLINE_STRING:
+                inline = child
+
         if data_type == "inlineStr":
             value = None
-        else:
-            value = element.findtext(VALUE_TAG, None) or None
 
         if coordinate:
             row, column = coordinate_to_tuple(coordinate)
@@ -193,7 +227,7 @@ class WorkSheetParser(object):
             self.col_counter += 1
             row, column = self.row_counter, self.col_counter
 
-        if not self.data_only and element.find(FORMULA_TAG) is not None:
+        if not self.data_only and formula is not None:
             data_type = 'f'
             value = self.parse_formula(element)
 
@@ -221,13 +255,11 @@ class WorkSheetParser(object):
                 value = from_ISO8601(value)
 
         elif data_type == 'inlineStr':
-                child = element.find(INLINE_STRING)
-                if child is not None:
+                if inline is not None:
                     data_type = 's'
-                    richtext = Text.from_tree(child)
-                    value = richtext.content
+                    value = get_text_content(inline)
 
-        return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+        return row, column, value, data_type, style_id
 
 
     def parse_formula(self, element):
@@ -283,10 +315,37 @@ class WorkSheetParser(object):
             # don't create dimension objects unless they have relevant information
             self.row_dimensions[str(self.row_counter)] = attrs
 
-        cells = [self.parse_cell(el) for el in row]
+        if self.columns is None:
+            cells = [self.parse_cell(el) for el in row]
+        else:
+            cells = [self.parse_cell(el) for el in row if self.is_selected(el)]
         return self.row_counter, cells
 
 
+    def is_selected(self, element):
+        """
+        Check whether a cell is in the selected columns.
+        Cells that are not selected are only checked for shared formulae
+        which later cells may depend upon.
+        """
+        coordinate = element.get('r')
+        if coordinate:
+            column = coordinate_to_tuple(coordinate)[1]
+        else:
+            column = self.col_counter + 1
+
+        if column in self.columns:
+            return True
+
+        self.col_counter = column
+        if not self.data_only:
+            for child in element:
+                if child.tag == FORMULA_TAG:
+                    self.parse_formula(element)
+                    break
+        return False
+
+
     def parse_formatting(self, element):
         try:
             cf = ConditionalFormatting.from_tree(element)
@@ -334,27 +393,49 @@ class WorkSheetParser(object):
         self.col_breaks = ColBreak()
 
 
+def read_worksheet(xml_source, shared_strings, data_only=False, epoch=WINDOWS_EPOCH,
+                   date_formats=set(), timedelta_formats=set()):
+    """
+    Parse a whole worksheet without a workbook.
+
+    Returns the parser and the parsed rows. The parser no longer refers to
+    the source or the shared strings so both can be pickled and sent from
+    another process to a WorksheetReader.
+    """
+    parser = WorkSheetParser(xml_source, shared_strings, data_only, epoch,
+                             date_formats, timedelta_formats)
+    rows = list(parser.parse())
+    parser.source = parser.shared_strings = None
+    return parser, rows
+
+
 class WorksheetReader(object):
     """
     Create a parser and apply it to a workbook
+
+    If the worksheet has already been parsed then `parsed` is the result
+    of `read_worksheet()` and xml_source and shared_strings are ignored.
     """
 
-    def __init__(self, ws, xml_source, shared_strings, data_only):
+    def __init__(self, ws, xml_source, shared_strings, data_only, parsed=None):
         self.ws = ws
-        self.parser = WorkSheetParser(xml_source, shared_strings,
-                data_only, ws.parent.epoch, ws.parent._date_formats,
-                ws.parent._timedelta_formats)
+        if parsed is None:
+            self.parser = WorkSheetParser(xml_source, shared_strings,
+                    data_only, ws.parent.epoch, ws.parent._date_formats,
+                    ws.parent._timedelta_formats)
+            self.rows = None
+        else:
+            self.parser, self.rows = parsed
         self.tables = []
 
 
     def bind_cells(self):
-        for idx, row in self.parser.parse():
-            for cell in row:
-                style = self.ws.parent._cell_styles[cell['style_id']]
-                c = Cell(self.ws, row=cell['row'], column=cell['column'], style_array=style)
-                c._value = cell['value']
-                c.data_type = cell['data_type']
-                self.ws._cells[(cell['row'], cell['column'])] = c
+        cells = self.ws._cells
+        rows = self.rows
+        if rows is None:
+            rows = self.parser.parse()
+        for idx, row in rows:
+            cells.load_row(idx, row)
         self.ws.formula_attributes = self.parser.array_formulae
         if self.ws._cells:
             self.ws._current_row = self.ws.max_row # use cells not row dimensions
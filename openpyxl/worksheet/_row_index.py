@@ -0,0 +1,274 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Row index for read-only worksheets
+
+Worksheet XML can only be parsed from the beginning. The index records the
+position of every nth row in the decompressed XML so that parsing can be
+resumed near any row: the start of the document, up to the first row, is
+followed by the rest of the source from the checkpoint.
+
+For deflated worksheets copies of the decompressor are also kept every few
+megabytes so that decompression does not have to start at the beginning
+either.
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+import re
+import zlib
+from zipfile import ZipInfo, ZIP_DEFLATED, ZIP_STORED
+
+CHUNK_SIZE = 1024 * 1024
+INFLATE_SPACING = 4 * 1024 * 1024
+
+SHEET_DATA_RE = re.compile(rb"<(?:([A-Za-z_][\w.-]*):)?sheetData(?=[\s/>])")
+ROW_NUMBER_RE = re.compile(rb"""\sr\s*=\s*["'](\d+)["']""")
+SHARED_FORMULA_RE = re.compile(rb"""\st\s*=\s*["']shared["']""")
+
+
+def scan_rows(src, step):
+    """
+    Scan the XML source for the start of rows without parsing it.
+
+    Returns the start of the document up to the first row, a list of
+    (row number, offset) for every step rows and whether the worksheet
+    contains shared formulae. None is returned if any of the rows for the
+    checkpoints is not numbered.
+    """
+    buf = b""
+    pos = 0 # offset of buf in the source
+    start = 0
+    header = None
+    row_re = None
+    checkpoints = []
+    count = 0
+    shared = False
+
+    while True:
+        chunk = src.read(CHUNK_SIZE)
+        buf += chunk
+
+        if row_re is None:
+            m = SHEET_DATA_RE.search(buf)
+            if m is None:
+                if not chunk:
+                    return buf, checkpoints, shared
+                continue
+            prefix = m.group(1)
+            tag = b"<row"
+            if prefix:
+                tag = b"<" + prefix + b":row"
+            row_re = re.compile(re.escape(tag) + rb"(?=[\s/>])([^>]*)>")
+            start = m.end()
+
+        for m in row_re.finditer(buf, start):
+            if header is None:
+                header = buf[:m.start()]
+            if not count % step:
+                r = ROW_NUMBER_RE.search(m.group(1))
+                if r is None:
+                    return
+                checkpoints.append((int(r.group(1)), pos + m.start()))
+            count += 1
+            start = m.end()
+
+        if not shared and SHARED_FORMULA_RE.search(buf):
+            shared = True
+
+        if not chunk:
+            break
+        if header is None:
+            continue
+
+        # only keep what might be the beginning of a row
+        tail = max(buf.rfind(b"<"), start)
+        pos += tail
+        buf = buf[tail:]
+        start = 0
+
+    if header is None:
+        header = buf
+    return header, checkpoints, shared
+
+
+def _skip(src, size):
+    """
+    Read and discard size bytes from the source
+    """
+    while size:
+        data = src.read(min(size, CHUNK_SIZE))
+        if not data:
+            break
+        size -= len(data)
+
+
+def open_deflated(archive, name):
+    """
+    Return the compressed data of an archive member as a file-like object
+    or None if the member is not deflated.
+    """
+    info = archive.getinfo(name)
+    if info.compress_type != ZIP_DEFLATED or info.flag_bits & 0x1:
+        return
+    raw = ZipInfo(info.filename, info.date_time)
+    raw.compress_type = ZIP_STORED
+    raw.flag_bits = info.flag_bits
+    raw.header_offset = info.header_offset
+    raw.compress_size = raw.file_size = info.compress_size
+    return archive.open(raw)
+
+
+class Inflater:
+    """
+    File-like object that decompresses raw deflate data.
+
+    If spacing is given a copy of the decompressor is kept at least every
+    spacing bytes of output as (decompressed offset, compressed offset,
+    decompressor) so that another Inflater can resume from there.
+    """
+
+    def __init__(self, raw, decompressor=None, produced=0, spacing=None):
+        self.raw = raw
+        if decompressor is None:
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self.decompressor = decompressor
+        self.consumed = 0
+        self.produced = produced
+        self.spacing = spacing
+        self.points = []
+        self._last = produced
+        self._buf = b""
+        self._eof = False
+
+
+    def _inflate(self):
+        if self.spacing and self.produced - self._last >= self.spacing:
+            self.points.append((self.produced, self.consumed, self.decompressor.copy()))
+            self._last = self.produced
+        chunk = self.raw.read(CHUNK_SIZE // 4)
+        self.consumed += len(chunk)
+        if chunk:
+            data = self.decompressor.decompress(chunk)
+        else:
+            data = self.decompressor.flush()
+            self._eof = True
+        self.produced += len(data)
+        self._buf += data
+
+
+    def read(self, size=-1):
+        while not self._eof and (size < 0 or len(self._buf) < size):
+            self._inflate()
+        if size < 0:
+            size = len(self._buf)
+        data = self._buf[:size]
+        self._buf = self._buf[size:]
+        return data
+
+
+    def close(self):
+        self.raw.close()
+
+
+class ResumedSource:
+    """
+    File-like object that returns the header and then the source from
+    the offset onwards.
+    """
+
+    def __init__(self, header, src, offset):
+        self.header = header
+        self.src = src
+        _skip(src, offset)
+
+
+    def read(self, size=-1):
+        if self.header:
+            if size < 0:
+                size = len(self.header)
+            data = self.header[:size]
+            self.header = self.header[size:]
+            return data
+        return self.src.read(size)
+
+
+    def close(self):
+        self.src.close()
+
+
+class RowIndex:
+    """
+    Checkpoints for every step rows of a worksheet and a cache of the most
+    recently parsed blocks of rows.
+
+    For deflated worksheets points are the decompressor copies of the
+    Inflater used to scan the worksheet.
+    """
+
+    def __init__(self, header, checkpoints, cache_size=16, formulae=None, points=()):
+        self.header = header
+        self.rows = [row for row, offset in checkpoints]
+        self.offsets = [offset for row, offset in checkpoints]
+        self.formulae = formulae
+        self.points = list(points)
+        self._produced = [produced for produced, consumed, obj in self.points]
+        self.cache_size = cache_size
+        self._blocks = OrderedDict()
+
+
+    def find(self, row):
+        """
+        Return the position of the last checkpoint at or before the row
+        or None if the row comes before the first checkpoint.
+        """
+        idx = bisect_right(self.rows, row) - 1
+        if idx >= 0:
+            return idx
+
+
+    def open(self, idx, source, raw=None):
+        """
+        Return a source to parse starting at the checkpoint.
+
+        source is called to open the worksheet and raw to open its
+        compressed data.
+        """
+        offset = self.offsets[idx]
+        pos = bisect_right(self._produced, offset) - 1
+        if raw is None or pos < 0:
+            return ResumedSource(self.header, source(), offset)
+
+        produced, consumed, decompressor = self.points[pos]
+        raw = raw()
+        _skip(raw, consumed)
+        src = Inflater(raw, decompressor.copy(), produced)
+        return ResumedSource(self.header, src, offset - produced)
+
+
+    def shared_formulae(self, idx):
+        """
+        Shared formulae defined before the checkpoint
+        """
+        if self.formulae is None:
+            return {}
+        return dict(self.formulae[idx])
+
+
+    def get_block(self, idx, parse):
+        """
+        Return the rows between a checkpoint and the next one as a
+        dictionary. parse is called to read a block that is not cached.
+        """
+        if idx in self._blocks:
+            self._blocks.move_to_end(idx)
+            return self._blocks[idx]
+
+        end = None
+        if idx + 1 < len(self.rows):
+            end = self.rows[idx + 1]
+        block = parse(self.rows[idx], end)
+        self._blocks[idx] = block
+        if len(self._blocks) > self.cache_size:
+            self._blocks.popitem(last=False)
+        return block
@@ -0,0 +1,402 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Write the rows of a worksheet as bytes
+
+The XML is the same as that written by openpyxl.cell._writer, with lxml or
+with the standard library, but is put together from byte strings instead of
+being passed through an XML writer.
+"""
+
+from copy import copy
+from datetime import datetime, date, time, timedelta
+
+from openpyxl import LXML
+from openpyxl.cell.cell import Cell, WriteOnlyCell, ERROR_CODES, ILLEGAL_CHARACTERS_RE
+from openpyxl.comments.comment_sheet import CommentRecord
+from openpyxl.compat import safe_string
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel, to_ISO8601
+
+BUFFER_SIZE = 64 * 1024
+
+
+def _escape(text):
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+class RowWriter:
+    """
+    Write rows of cells to a function that takes bytes.
+
+    Output is buffered and written in blocks.
+    """
+
+    def __init__(self, ws, write, lxml=LXML):
+        self.ws = ws
+        self.write = write
+        wb = ws.parent
+        self.iso_dates = wb.iso_dates
+        self.epoch = wb.epoch
+        self.shared_strings = None
+        if getattr(wb, "use_shared_strings", False):
+            self.shared_strings = wb.shared_strings
+        self._buf = bytearray()
+        self._columns = {}
+        self._styles = {}
+        self._types = {
+            'n': self._write_number,
+            's': self._write_string,
+            'f': self._write_formula,
+            'd': self._write_date,
+        }
+
+        if lxml:
+            self._end_empty = b"></c>"
+            self._empty_value = b"<v></v>"
+            self._encoding = "ascii"
+            self._text_escapes = (("\r", "&#13;"),)
+            self._attr_escapes = (('"', "&quot;"), ("\r", "&#13;"),
+                                  ("\n", "&#10;"), ("\t", "&#9;"))
+        else:
+            self._end_empty = b" />"
+            self._empty_value = b"<v />"
+            self._encoding = "utf-8"
+            self._text_escapes = ()
+            self._attr_escapes = (('"', "&quot;"), ("\r", "&#13;"),
+                                  ("\n", "&#10;"), ("\t", "&#09;"))
+        self._lxml = lxml
+
+
+    def _text(self, text):
+        text = _escape(text)
+        for char, ref in self._text_escapes:
+            if char in text:
+                text = text.replace(char, ref)
+        return text.encode(self._encoding, "xmlcharrefreplace")
+
+
+    def _attrs(self, attrs):
+        out = []
+        for key, value in attrs:
+            value = _escape(value)
+            for char, ref in self._attr_escapes:
+                if char in value:
+                    value = value.replace(char, ref)
+            out.append(f' {key}="{value}"')
+        return "".join(out).encode(self._encoding, "xmlcharrefreplace")
+
+
+    def start(self):
+        self._buf += b"<sheetData>"
+
+
+    def end(self):
+        self._buf += b"</sheetData>"
+        self.flush()
+
+
+    def flush(self):
+        if self._buf:
+            self.write(bytes(self._buf))
+            self._buf = bytearray()
+
+
+    def _start_row(self, row_idx):
+        dims = self.ws.row_dimensions
+        if row_idx in dims:
+            attrs = {'r': f"{row_idx}"}
+            attrs.update(dims[row_idx])
+            return b"<row" + self._attrs(attrs.items()) + b">"
+        return b'<row r="%d">' % row_idx
+
+
+    def write_row(self, row, row_idx):
+        buf = self._buf
+        buf += self._start_row(row_idx)
+        self._write_cells(row, row_idx)
+        buf += b"</row>"
+        if len(buf) > BUFFER_SIZE:
+            self.flush()
+
+
+    def _write_cells(self, row, row_idx):
+        buf = self._buf
+        row_ref = b"%d\"" % row_idx
+        columns = self._columns
+        styles = self._styles
+        types = self._types
+        comments = self.ws._comments
+
+        for cell in row:
+            if cell._comment is not None:
+                comment = CommentRecord.from_cell(cell)
+                comments.append(comment)
+            styled = cell.has_style
+            if (
+                cell._value is None
+                and not styled
+                and not cell._comment
+                ):
+                continue
+
+            column = cell.column
+            try:
+                start = columns[column]
+            except KeyError:
+                start = columns[column] = f'<c r="{get_column_letter(column)}'.encode()
+            start += row_ref
+            if styled:
+                style_id = cell.style_id
+                try:
+                    start += styles[style_id]
+                except KeyError:
+                    style = styles[style_id] = b' s="%d"' % style_id
+                    start += style
+
+            if cell.hyperlink:
+                self.ws._hyperlinks.append(cell.hyperlink)
+
+            method = types.get(cell.data_type, self._write_value)
+            buf += method(start, cell)
+
+
+    def compile(self, schema):
+        """
+        Prepare a function for each column of a schema that returns the
+        markup of a value in that column.
+        """
+        return [self._compile_column(col_idx, column)
+                for col_idx, column in enumerate(schema, 1)]
+
+
+    def _compile_column(self, col_idx, column):
+        ws = self.ws
+        template = column.style_cell(ws)
+        style = template._style
+        start = b'<c r="' + get_column_letter(col_idx).encode() + b'%b"'
+        if template.has_style:
+            start += b' s="%d"' % template.style_id
+
+        def convert(value, row_ref, row_idx):
+            """
+            Values not of the declared type are written as cells
+            """
+            if isinstance(value, Cell):
+                cell = value
+            else:
+                cell = WriteOnlyCell(ws)
+                cell._style = copy(style)
+                cell.value = value
+            cell.column = col_idx
+            cell.row = row_idx
+            if cell.hyperlink is not None:
+                cell.hyperlink.ref = cell.coordinate
+            # the cell is added to the row as it is written
+            self._write_cells((cell,), row_idx)
+            return b""
+
+        data_type = column.data_type
+        trusted = column.trusted
+        if data_type is None:
+            return convert
+
+        if data_type == "n":
+            number = start + b' t="n"><v>%b</v></c>'
+            if trusted:
+                def write(value, row_ref, row_idx):
+                    return number % (row_ref, b"%.16g" % value)
+            else:
+                def write(value, row_ref, row_idx):
+                    cls = value.__class__
+                    if (cls is int or cls is float) and value - value == 0:
+                        return number % (row_ref, b"%.16g" % value)
+                    return convert(value, row_ref, row_idx)
+            return write
+
+        if data_type == "b":
+            true = start + b' t="b"><v>1</v></c>'
+            false = start + b' t="b"><v>0</v></c>'
+            if trusted:
+                def write(value, row_ref, row_idx):
+                    return (true if value else false) % row_ref
+            else:
+                def write(value, row_ref, row_idx):
+                    if value.__class__ is bool:
+                        return (true if value else false) % row_ref
+                    return convert(value, row_ref, row_idx)
+            return write
+
+        if data_type == "d":
+            return self._compile_date(start, trusted, convert)
+
+        text = self._text
+        if data_type == "f":
+            formula = start + b"><f>%b</f>" + self._empty_value + b"</c>"
+            attrs = ws.formula_attributes
+            def write(value, row_ref, row_idx):
+                if trusted or (
+                    value.__class__ is str
+                    and len(value) > 1
+                    and value[0] == "="
+                    and not attrs
+                    ):
+                    return formula % (row_ref, text(value[1:]))
+                return convert(value, row_ref, row_idx)
+            return write
+
+        # strings
+        shared_strings = self.shared_strings
+        if shared_strings is not None:
+            shared = start + b' t="s"><v>%d</v></c>'
+        else:
+            inline = start + b' t="inlineStr"><is><t>%b</t></is></c>'
+            preserve = start + b' t="inlineStr"><is><t xml:space="preserve">%b</t></is></c>'
+
+        def write(value, row_ref, row_idx):
+            if not value or not trusted and (
+                value.__class__ is not str
+                or len(value) > 32767
+                or value[0] == "=" and len(value) > 1
+                or value in ERROR_CODES
+                or ILLEGAL_CHARACTERS_RE.search(value) is not None
+                ):
+                return convert(value, row_ref, row_idx)
+            if shared_strings is not None:
+                return shared % (row_ref, shared_strings.add(value))
+            if value != value.strip():
+                return preserve % (row_ref, text(value))
+            return inline % (row_ref, text(value))
+        return write
+
+
+    def _compile_date(self, start, trusted, convert):
+        epoch = self.epoch
+        date_types = (datetime, date, time, timedelta)
+
+        if self.iso_dates:
+            # durations are still written as numbers
+            trusted = False
+            date_types = date_types[:-1]
+            value_type = b' t="d"><v>%b</v></c>'
+            def serialise(value):
+                return to_ISO8601(value).encode()
+        else:
+            value_type = b' t="n"><v>%b</v></c>'
+            def serialise(value):
+                return b"%.16g" % to_excel(value, epoch)
+        template = start + value_type
+
+        def write(value, row_ref, row_idx):
+            if trusted or (
+                isinstance(value, date_types)
+                and getattr(value, "tzinfo", None) is None
+                ):
+                return template % (row_ref, serialise(value))
+            return convert(value, row_ref, row_idx)
+        return write
+
+
+    def write_values(self, values, row_idx, columns):
+        """
+        Write a row of values with the functions returned by compile().
+        Values beyond the end of the schema are converted to cells.
+        """
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        buf = self._buf
+        buf += self._start_row(row_idx)
+        row_ref = b"%d" % row_idx
+        for write, value in zip(columns, values):
+            if value is not None:
+                buf += write(value, row_ref, row_idx)
+
+        skip = len(columns)
+        if len(values) > skip:
+            rest = [None] * skip + list(values[skip:])
+            self._write_cells(self.ws._values_to_row(rest, row_idx), row_idx)
+
+        buf += b"</row>"
+        if len(buf) > BUFFER_SIZE:
+            self.flush()
+
+
+    def _value(self, start, data_type, value):
+        """
+        Cell with <v>
+        """
+        if value is None or value == "":
+            return start + data_type + self._end_empty
+        cls = value.__class__
+        if cls is int:
+            value = b"%.16g" % value
+        elif cls is float:
+            if value - value == 0:
+                value = b"%.16g" % value
+            else:
+                value = b"" # nan and infinity
+        else:
+            value = self._text(safe_string(value))
+        if not value:
+            return start + data_type + b">" + self._empty_value + b"</c>"
+        return start + data_type + b"><v>" + value + b"</v></c>"
+
+
+    def _write_number(self, start, cell):
+        return self._value(start, b' t="n"', cell._value)
+
+
+    def _write_value(self, start, cell):
+        data_type = b' t="' + self._text(cell.data_type) + b'"'
+        return self._value(start, data_type, cell._value)
+
+
+    def _write_date(self, start, cell):
+        value = cell._value
+        if hasattr(value, "tzinfo") and value.tzinfo is not None:
+            raise TypeError("Excel does not support timezones in datetimes. "
+                    "The tzinfo in the datetime/time object must be set to None.")
+
+        if self.iso_dates and not isinstance(value, timedelta):
+            return self._value(start, b' t="d"', to_ISO8601(value))
+        return self._value(start, b' t="n"', to_excel(value, self.epoch))
+
+
+    def _write_string(self, start, cell):
+        value = cell._value
+        if value and self.shared_strings is not None:
+            idx = self.shared_strings.add(value)
+            return start + b' t="s"><v>%d</v></c>' % idx
+        start += b' t="inlineStr"'
+        if value is None or value == "":
+            return start + self._end_empty
+        if value != value.strip():
+            tag = b'<t xml:space="preserve">'
+        else:
+            tag = b"<t>"
+        return start + b"><is>" + tag + self._text(value) + b"</t></is></c>"
+
+
+    def _write_formula(self, start, cell):
+        value = cell._value
+        if value is None or value == "":
+            return start + self._end_empty
+
+        attrs = self.ws.formula_attributes.get(cell.coordinate)
+        tag = b"<f"
+        if attrs:
+            tag += self._attrs(attrs.items())
+        formula = value[1:]
+        if formula:
+            formula = tag + b">" + self._text(formula) + b"</f>"
+        elif self._lxml:
+            formula = tag + b"></f>"
+        else:
+            formula = tag + b" />"
+        return start + b">" + formula + self._empty_value + b"</c>"
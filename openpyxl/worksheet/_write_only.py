@@ -3,7 +3,9 @@
 
 """Write worksheets to xml representations in an optimized way"""
 
+from copy import copy
 from inspect import isgenerator
+from tempfile import SpooledTemporaryFile
 
 from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.workbook.child import _WorkbookChild
@@ -24,6 +26,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
     __saved = False
     _writer = None
     _rows = None
+    _schema = None
     _rel_type = Worksheet._rel_type
     _path = Worksheet._path
     mime_type = Worksheet.mime_type
@@ -54,6 +57,25 @@ class WriteOnlyWorksheet(_WorkbookChild):
         return self.__saved
 
 
+    @property
+    def schema(self):
+        """
+        Sequence of :class:`openpyxl.worksheet.schema.Column` describing the
+        values that will be appended. Rows are then written from the values
+        without creating cells.
+        """
+        return self._schema
+
+
+    @schema.setter
+    def schema(self, columns):
+        if self._writer is not None:
+            raise ValueError("The schema must be set before rows are added")
+        if columns is not None:
+            columns = tuple(columns)
+        self._schema = columns
+
+
     def _write_rows(self):
         """
         Send rows to the writer's stream
@@ -63,13 +85,15 @@ class WriteOnlyWorksheet(_WorkbookChild):
         except StopIteration:
             self._already_saved()
 
-        with xf.element("sheetData"):
+        schema = self._schema
+        with self._writer.sheet_data(xf, schema) as write_row:
             row_idx = 1
             try:
                 while True:
                     row = (yield)
-                    row = self._values_to_row(row, row_idx)
-                    self._writer.write_row(xf, row, row_idx)
+                    if schema is None:
+                        row = self._values_to_row(row, row_idx)
+                    write_row(row, row_idx)
                     row_idx += 1
             except GeneratorExit:
                 pass
@@ -79,7 +103,13 @@ class WriteOnlyWorksheet(_WorkbookChild):
 
     def _get_writer(self):
         if self._writer is None:
-            self._writer = WorksheetWriter(self)
+            out = None
+            size = getattr(self.parent, "buffer_size", None)
+            if size is not None:
+                out = SpooledTemporaryFile(max_size=size)
+            # values of a schema are written by a RowWriter
+            fast_rows = True if self._schema is not None else None
+            self._writer = WorksheetWriter(self, out=out, fast_rows=fast_rows)
             self._writer.write_top()
 
 
@@ -120,15 +150,29 @@ class WriteOnlyWorksheet(_WorkbookChild):
         self._rows.send(row)
 
 
-    def _values_to_row(self, values, row_idx):
+    def append_rows(self, rows):
+        """
+        Append each of an iterable of rows
+
+        :param rows: iterable of rows as accepted by append()
+        """
+        for row in rows:
+            self.append(row)
+
+
+    def _values_to_row(self, values, row_idx, styles=None):
         """
         Convert whatever has been appended into a form suitable for work_rows
+
+        The styles of the first cells can be given as style arrays.
         """
         cell = WriteOnlyCell(self)
 
         for col_idx, value in enumerate(values, 1):
             if value is None:
                 continue
+            if styles is not None and col_idx <= len(styles):
+                cell._style = copy(styles[col_idx - 1])
             try:
                 cell.value = value
             except ValueError:
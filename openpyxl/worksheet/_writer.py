@@ -1,12 +1,16 @@
 # Copyright (c) 2010-2022 openpyxl
 
 import atexit
-from collections import defaultdict
+from contextlib import contextmanager
+from functools import partial
+from heapq import merge
 from io import BytesIO
+from operator import itemgetter
 import os
 from tempfile import NamedTemporaryFile
 from warnings import warn
 
+from openpyxl import LXML
 from openpyxl.xml.functions import xmlfile
 from openpyxl.xml.constants import SHEET_MAIN_NS
 
@@ -18,6 +22,7 @@ from .dimensions import SheetDimension
 from .hyperlink import HyperlinkList
 from .merge import MergeCell, MergeCells
 from .related import Related
+from ._row_writer import RowWriter
 from .table import TablePartList
 
 from openpyxl.cell._writer import write_cell
@@ -41,24 +46,64 @@ def create_temporary_file(suffix=''):
     return filename
 
 
+class _Output:
+    """
+    Binary file shared by the XML writer and the row writer.
+    Text is encoded as the standard library writer would.
+    """
+
+    def __init__(self, out):
+        self._close = not hasattr(out, "write")
+        if self._close:
+            out = open(out, "wb")
+        self.out = out
+
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode("utf-8", "xmlcharrefreplace")
+        self.out.write(data)
+
+
+    def close(self):
+        if self._close:
+            self.out.close()
+
+
 class WorksheetWriter:
 
 
-    def __init__(self, ws, out=None):
+    def __init__(self, ws, out=None, fast_rows=None):
         self.ws = ws
         self.ws._hyperlinks = []
         self.ws._comments = []
         if out is None:
             out = create_temporary_file()
         self.out = out
+        if fast_rows is None:
+            fast_rows = getattr(ws.parent, "fast_rows", False)
+        self.fast_rows = fast_rows
+        self._output = None
+        self._raw = False
         self._rels = RelationshipList()
         self.xf = self.get_stream()
         next(self.xf) # start generator
 
 
+    def _send(self, obj, *args):
+        """
+        Write an element. With fast_rows it is serialised directly to the
+        output rather than as a tree.
+        """
+        if self._raw:
+            self.xf.send(obj.to_xml(*args))
+        else:
+            self.xf.send(obj.to_tree(*args))
+
+
     def write_properties(self):
         props = self.ws.sheet_properties
-        self.xf.send(props.to_tree())
+        self._send(props)
 
 
     def write_dimensions(self):
@@ -68,18 +113,18 @@ class WorksheetWriter:
         ref = getattr(self.ws, 'calculate_dimension', None)
         if ref:
             dim = SheetDimension(ref())
-            self.xf.send(dim.to_tree())
+            self._send(dim)
 
 
     def write_format(self):
         self.ws.sheet_format.outlineLevelCol = self.ws.column_dimensions.max_outline
         fmt = self.ws.sheet_format
-        self.xf.send(fmt.to_tree())
+        self._send(fmt)
 
 
     def write_views(self):
         views = self.ws.views
-        self.xf.send(views.to_tree())
+        self._send(views)
 
 
     def write_cols(self):
@@ -105,28 +150,61 @@ class WorksheetWriter:
 
     def rows(self):
         """Return all rows, and any cells that they contain"""
-        # order cells by row
-        rows = defaultdict(list)
-        for (row, col), cell in sorted(self.ws._cells.items()):
-            rows[row].append(cell)
+        cells = self.ws._cells
 
         # add empty rows if styling has been applied
-        for row in self.ws.row_dimensions.keys() - rows.keys():
-            rows[row] = []
+        empty = [(row, []) for row in sorted(self.ws.row_dimensions)
+                 if not cells.has_row(row)]
 
-        return sorted(rows.items())
+        return list(merge(cells.iter_rows(), empty, key=itemgetter(0)))
 
 
     def write_rows(self):
         xf = self.xf.send(True)
 
-        with xf.element("sheetData"):
+        with self.sheet_data(xf) as write_row:
             for row_idx, row in self.rows():
-                self.write_row(xf, row, row_idx)
+                write_row(row, row_idx)
 
         self.xf.send(None) # return control to generator
 
 
+    @contextmanager
+    def sheet_data(self, xf, schema=None):
+        """
+        Write the sheetData element. Returns a function that writes a row.
+
+        With fast_rows the rows are written directly to the output by a
+        RowWriter. With a schema the function takes a row of values rather
+        than cells.
+        """
+        if self._output is not None and (not LXML or hasattr(xf, "flush")):
+            if LXML:
+                xf.flush()
+            rows = RowWriter(self.ws, self._output.write)
+            rows.start()
+            if schema is None:
+                yield rows.write_row
+            else:
+                yield partial(rows.write_values, columns=rows.compile(schema))
+            rows.end()
+        else:
+            with xf.element("sheetData"):
+                if schema is None:
+                    yield partial(self.write_row, xf)
+                else:
+                    styles = [column.style_cell(self.ws)._style for column in schema]
+                    yield partial(self._write_values, xf, styles)
+
+
+    def _write_values(self, xf, styles, values, row_idx):
+        """
+        Write a row of values with the styles of a schema without a RowWriter
+        """
+        cells = self.ws._values_to_row(values, row_idx, styles)
+        self.write_row(xf, cells, row_idx)
+
+
     def write_row(self, xf, row, row_idx):
         attrs = {'r': f"{row_idx}"}
         dims = self.ws.row_dimensions
@@ -150,19 +228,19 @@ class WorksheetWriter:
     def write_protection(self):
         prot = self.ws.protection
         if prot:
-            self.xf.send(prot.to_tree())
+            self._send(prot)
 
 
     def write_scenarios(self):
         scenarios = self.ws.scenarios
         if scenarios:
-            self.xf.send(scenarios.to_tree())
+            self._send(scenarios)
 
 
     def write_filter(self):
         flt = self.ws.auto_filter
         if flt:
-            self.xf.send(flt.to_tree())
+            self._send(flt)
 
 
     def write_sort(self):
@@ -177,7 +255,7 @@ class WorksheetWriter:
         merged = self.ws.merged_cells
         if merged:
             cells = [MergeCell(str(ref)) for ref in self.ws.merged_cells]
-            self.xf.send(MergeCells(mergeCell=cells).to_tree())
+            self._send(MergeCells(mergeCell=cells))
 
 
     def write_formatting(self):
@@ -187,7 +265,7 @@ class WorksheetWriter:
             for rule in cf.rules:
                 if rule.dxf and rule.dxf != df:
                     rule.dxfId = wb._differential_styles.add(rule.dxf)
-            self.xf.send(cf.to_tree())
+            self._send(cf)
 
 
     def write_validations(self):
@@ -207,38 +285,38 @@ class WorksheetWriter:
             links.hyperlink.append(link)
 
         if links:
-            self.xf.send(links.to_tree())
+            self._send(links)
 
 
     def write_print(self):
         print_options = self.ws.print_options
         if print_options:
-            self.xf.send(print_options.to_tree())
+            self._send(print_options)
 
 
     def write_margins(self):
         margins = self.ws.page_margins
         if margins:
-            self.xf.send(margins.to_tree())
+            self._send(margins)
 
 
     def write_page(self):
         setup = self.ws.page_setup
         if setup:
-            self.xf.send(setup.to_tree())
+            self._send(setup)
 
 
     def write_header(self):
         hf = self.ws.HeaderFooter
         if hf:
-            self.xf.send(hf.to_tree())
+            self._send(hf)
 
 
     def write_breaks(self):
         brks = (self.ws.row_breaks, self.ws.col_breaks)
         for brk in brks:
             if brk:
-                self.xf.send(brk.to_tree())
+                self._send(brk)
 
 
     def write_drawings(self):
@@ -281,23 +359,38 @@ class WorksheetWriter:
             tables.append(Related(id=rel.Id))
 
         if tables:
-            self.xf.send(tables.to_tree())
+            self._send(tables)
 
 
     def get_stream(self):
-        with xmlfile(self.out) as xf:
-            with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
-                try:
-                    while True:
-                        el = (yield)
-                        if el is True:
-                            yield xf
-                        elif el is None: # et_xmlfile chokes
-                            continue
-                        else:
-                            xf.write(el)
-                except GeneratorExit:
-                    pass
+        out = self.out
+        options = {}
+        if self.fast_rows:
+            out = self._output = _Output(out)
+            if not LXML:
+                options['encoding'] = "unicode" # do not buffer
+        try:
+            with xmlfile(out, **options) as xf:
+                self._raw = self._output is not None and (not LXML or hasattr(xf, "flush"))
+                with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
+                    try:
+                        while True:
+                            el = (yield)
+                            if el is True:
+                                yield xf
+                            elif el is None: # et_xmlfile chokes
+                                continue
+                            elif isinstance(el, bytes):
+                                if LXML:
+                                    xf.flush()
+                                self._output.write(el)
+                            else:
+                                xf.write(el)
+                    except GeneratorExit:
+                        pass
+        finally:
+            if self._output is not None:
+                self._output.close()
 
 
     def write_tail(self):
@@ -376,6 +469,9 @@ class WorksheetWriter:
         self.close()
         if isinstance(self.out, BytesIO):
             return self.out.getvalue()
+        if hasattr(self.out, "read"):
+            self.out.seek(0)
+            return self.out.read()
         with open(self.out, "rb") as src:
             out = src.read()
 
@@ -386,5 +482,7 @@ class WorksheetWriter:
         """
         Remove tempfile
         """
+        if hasattr(self.out, "write"):
+            return
         os.remove(self.out)
         ALL_TEMP_FILES.remove(self.out)
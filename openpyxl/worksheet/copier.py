@@ -45,7 +45,7 @@ class WorksheetCopy(object):
 
 
     def _copy_cells(self):
-        for (row, col), source_cell  in self.source._cells.items():
+        for (row, col), source_cell  in self.source._cells.iter_cells():
             target_cell = self.target.cell(column=col, row=row)
 
             target_cell._value = source_cell._value
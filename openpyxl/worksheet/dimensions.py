@@ -194,6 +194,11 @@ class DimensionHolder(BoundDictionary):
         super(DimensionHolder, self).__init__(reference, default_factory)
 
 
+    def __reduce__(self):
+        return (self.__class__, (self.worksheet, self.reference, self.default_factory),
+                self.__dict__, None, iter(self.items()))
+
+
     def group(self, start, end=None, outline_level=1, hidden=False):
         """allow grouping a range of consecutive rows or columns together
 
@@ -0,0 +1,74 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Declared types and styles for the columns of write-only worksheets
+"""
+
+from openpyxl.cell import WriteOnlyCell
+
+DATA_TYPES = ('n', 's', 'd', 'b', 'f', None)
+
+DEFAULT_DATE_FORMAT = "yyyy-mm-dd h:mm:ss"
+
+
+class Column:
+    """
+    Type and style of the values in a column of a write-only worksheet.
+
+    Values of the declared type are written without creating cells. Other
+    values are converted as they would be by `append()` unless the column
+    is `trusted`, in which case every value must be of the declared type:
+
+    * 'n' int or float
+    * 's' str
+    * 'd' datetime, date, time or timedelta
+    * 'b' bool
+    * 'f' str starting with "="
+    * None the type is worked out for each value
+
+    `None` is always allowed and leaves the cell empty.
+    """
+
+    def __init__(self,
+                 data_type=None,
+                 number_format=None,
+                 style=None,
+                 font=None,
+                 fill=None,
+                 border=None,
+                 alignment=None,
+                 protection=None,
+                 trusted=False,
+                ):
+        if data_type not in DATA_TYPES:
+            raise ValueError("Unknown data type {0!r}".format(data_type))
+        if data_type == 'd' and number_format is None:
+            number_format = DEFAULT_DATE_FORMAT
+        self.data_type = data_type
+        self.number_format = number_format
+        self.style = style
+        self.font = font
+        self.fill = fill
+        self.border = border
+        self.alignment = alignment
+        self.protection = protection
+        self.trusted = trusted
+
+
+    def __repr__(self):
+        return "{0}({1!r}, trusted={2})".format(self.__class__.__name__,
+                                               self.data_type, self.trusted)
+
+
+    def style_cell(self, ws):
+        """
+        Empty cell with the style of the column
+        """
+        cell = WriteOnlyCell(ws)
+        if self.style is not None:
+            cell.style = self.style
+        for attr in ("font", "fill", "border", "alignment", "protection", "number_format"):
+            value = getattr(self, attr)
+            if value is not None:
+                setattr(cell, attr, value)
+        return cell
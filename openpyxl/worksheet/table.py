@@ -14,7 +14,6 @@ from openpyxl.descriptors import (
 from openpyxl.descriptors.excel import ExtensionList, CellRange
 from openpyxl.descriptors.sequence import NestedSequence
 from openpyxl.xml.constants import SHEET_MAIN_NS, REL_NS
-from openpyxl.xml.functions import tostring
 from openpyxl.utils import range_boundaries
 from openpyxl.utils.escape import escape, unescape
 
@@ -201,6 +200,7 @@ class Table(Serialisable):
     _rel_id = None
 
     tagname = "table"
+    xmlns = SHEET_MAIN_NS
 
     id = Integer()
     name = String(allow_none=True)
@@ -292,12 +292,6 @@ class Table(Serialisable):
         self.tableStyleInfo = tableStyleInfo
 
 
-    def to_tree(self):
-        tree = super(Table, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
-
-
     @property
     def path(self):
         """
@@ -310,8 +304,7 @@ class Table(Serialisable):
         """
         Serialise to XML and write to archive
         """
-        xml = self.to_tree()
-        archive.writestr(self.path[1:], tostring(xml))
+        archive.writestr(self.path[1:], self.to_xml())
 
 
     def _initialise_columns(self):
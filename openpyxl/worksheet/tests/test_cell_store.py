@@ -0,0 +1,266 @@
+# Copyright (c) 2010-2022 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
+
+from .._cell_store import LoadedRow, CellStore
+
+
+@pytest.fixture
+def ws():
+    wb = Workbook()
+    wb._cell_styles.add(StyleArray([1, 0, 0, 0, 0, 0, 0, 0, 0]))
+    return wb.active
+
+
+@pytest.fixture
+def store(ws):
+    store = CellStore(ws)
+    store.load_row(1, [(1, 1, "a", "s", 0), (1, 3, 3, "n", 1)])
+    store.load_row(2, [(2, 2, None, "n", 0)])
+    return store
+
+
+def is_loaded(store, row):
+    return isinstance(store._rows[row], LoadedRow)
+
+
+class TestLoadedRow:
+
+
+    def test_ctor(self):
+        row = LoadedRow([(1, 1, "a", "s", 0), (1, 4, 2, "n", 1)])
+        assert list(row.columns) == [1, 4]
+        assert row.values == ["a", 2]
+        assert row.data_types == ["s", "n"]
+        assert list(row.styles) == [0, 1]
+        assert len(row) == 2
+
+
+    def test_unsorted(self):
+        row = LoadedRow([(1, 4, 2, "n", 0), (1, 1, "a", "s", 0), (1, 4, 3, "n", 0)])
+        assert list(row.columns) == [1, 4]
+        assert row.values == ["a", 3]
+
+
+    def test_contains(self):
+        row = LoadedRow([(1, 1, "a", "s", 0), (1, 4, 2, "n", 1)])
+        assert 4 in row
+        assert 2 not in row
+
+
+    @pytest.mark.parametrize("min_col, offset, columns, values",
+                             [
+                                 (2, 2, [1, 4, 6], ["a", "b", "c"]),
+                                 (3, -1, [1, 3], ["a", "c"]),
+                                 (4, -3, [1], ["c"]),
+                             ]
+                             )
+    def test_shift(self, min_col, offset, columns, values):
+        row = LoadedRow([(1, 1, "a", "s", 0), (1, 2, "b", "s", 0), (1, 4, "c", "s", 0)])
+        row.shift(min_col, offset)
+        assert list(row.columns) == columns
+        assert row.values == values
+        assert len(row.styles) == len(columns)
+
+
+    def test_copy(self):
+        value = ["mutable"]
+        row = LoadedRow([(1, 1, "a", "s", 0), (1, 2, value, "s", 1)])
+        assert row.is_shareable() is False
+        copied = row.copy()
+        assert list(copied.columns) == [1, 2]
+        assert copied.values == ["a", ["mutable"]]
+        assert copied.values[1] is not value
+        assert list(copied.styles) == [0, 1]
+
+
+class TestCellStore:
+
+
+    def test_lazy(self, store):
+        assert is_loaded(store, 1) and is_loaded(store, 2)
+        assert len(store) == 3
+        assert (1, 3) in store
+        assert (1, 2) not in store
+        assert is_loaded(store, 1)
+
+
+    def test_getitem(self, store):
+        cell = store[(1, 3)]
+        assert cell.value == 3
+        assert cell.coordinate == "C1"
+        assert cell.has_style
+        assert store[(1, 3)] is cell
+        assert not is_loaded(store, 1)
+        assert is_loaded(store, 2)
+        assert len(store) == 3
+
+
+    @pytest.mark.parametrize("key", [(3, 1), (1, 2)])
+    def test_getitem_missing(self, store, key):
+        with pytest.raises(KeyError):
+            store[key]
+
+
+    def test_default_style(self, store):
+        cell = store[(1, 1)]
+        assert cell.value == "a"
+        assert not cell.has_style
+
+
+    def test_get(self, store):
+        assert store.get((2, 2)).value is None
+        assert store.get((2, 3)) is None
+
+
+    def test_setitem(self, store, ws):
+        cell = ws.cell(row=5, column=5)
+        store[(1, 1)] = cell
+        assert store[(1, 1)] is cell
+        assert store[(1, 3)].value == 3
+        assert len(store) == 3
+
+
+    def test_delitem(self, store):
+        del store[(2, 2)]
+        assert (2, 2) not in store
+        assert store._rows.keys() == {1}
+        assert len(store) == 2
+        with pytest.raises(KeyError):
+            del store[(2, 2)]
+
+
+    def test_iter(self, store, ws):
+        store[(1, 2)] = ws.cell(row=5, column=5)
+        store[(0, 4)] = ws.cell(row=5, column=5)
+        assert list(store) == [(0, 4), (1, 1), (1, 2), (1, 3), (2, 2)]
+
+
+    def test_iter_rows(self, store):
+        rows = [(row, [c.coordinate for c in cells]) for row, cells in store.iter_rows()]
+        assert rows == [(1, ["A1", "C1"]), (2, ["B2"])]
+        assert is_loaded(store, 1)
+
+
+    def test_iter_cells(self, store):
+        cells = list(store.iter_cells())
+        assert [key for key, cell in cells] == [(1, 1), (1, 3), (2, 2)]
+        assert cells[1][1].value == 3
+
+
+    def test_load_row_twice(self, store):
+        store.load_row(1, [(1, 2, "b", "s", 0), (1, 3, 4, "n", 0)])
+        assert list(store) == [(1, 1), (1, 2), (1, 3), (2, 2)]
+        assert store[(1, 3)].value == 4
+        assert len(store) == 4
+
+
+    def test_load_used_row(self, store):
+        store[(1, 1)]
+        store.load_row(1, [(1, 2, "b", "s", 0), (1, 3, 4, "n", 0)])
+        assert list(store) == [(1, 1), (1, 2), (1, 3), (2, 2)]
+        assert store[(1, 3)].value == 4
+        assert len(store) == 4
+
+
+    def test_bounds(self, store, ws):
+        assert store.bounds == (1, 1, 3, 2)
+        store[(7, 5)] = ws.cell(row=7, column=5)
+        assert store.bounds == (1, 1, 5, 7)
+        del store[(7, 5)]
+        assert store.bounds == (1, 1, 3, 2)
+        del store[(2, 2)]
+        del store[(1, 1)]
+        assert store.bounds == (3, 1, 3, 1)
+        del store[(1, 3)]
+        assert store.bounds is None
+
+
+    def test_shift_rows(self, store):
+        store[(2, 2)]
+        store.shift_rows(2, 3)
+        assert list(store) == [(1, 1), (1, 3), (5, 2)]
+        assert store[(5, 2)].row == 5
+        assert store.bounds == (1, 1, 3, 5)
+
+
+    def test_shift_rows_up(self, store):
+        store.shift_rows(2, -1)
+        assert list(store) == [(1, 2)]
+        assert store[(1, 2)].coordinate == "B1"
+        assert len(store) == 1
+
+
+    def test_shift_columns(self, store):
+        store[(1, 1)]
+        store.shift_columns(2, 2)
+        assert list(store) == [(1, 1), (1, 5), (2, 4)]
+        assert store[(1, 5)].column == 5
+        assert store[(2, 4)].coordinate == "D2"
+
+
+    def test_shift_columns_left(self, store):
+        store[(1, 1)]
+        store.shift_columns(3, -2)
+        assert list(store) == [(1, 1)]
+        assert store[(1, 1)].value == 3
+        assert len(store) == 1
+        assert store.bounds == (1, 1, 1, 1)
+
+
+    def test_worksheet(self, ws):
+        ws._cells.load_row(1, [(1, 2, "b", "s", 0)])
+        assert ws.max_column == 2
+        assert ws["B1"].value == "b"
+        assert [c.value for c in ws[1]] == [None, "b"]
+
+
+    def test_shift_shared_row(self, store):
+        loaded = store._rows[1]
+        store.shift_columns(2, 1)
+        assert list(loaded.columns) == [1, 3]
+        assert list(store._rows[1].columns) == [1, 4]
+
+
+class TestSnapshot:
+
+
+    def test_loaded_rows_shared(self, store, ws):
+        copied = store.snapshot(ws)
+        assert copied._rows[1] is store._rows[1]
+        assert list(copied) == list(store)
+        assert copied.bounds == store.bounds
+
+
+    def test_cells_as_records(self, store, ws):
+        from openpyxl.styles import Font
+        store[(1, 1)].font = Font(bold=True)
+        cell = Cell(ws, row=3, column=2)
+        cell._value = [1]
+        store[(3, 2)] = cell
+        copied = store.snapshot(ws)
+        assert is_loaded(copied, 1)
+        assert copied[(1, 1)].font.b is True
+        assert copied[(1, 3)].value == 3
+
+        store[(1, 1)].value = "changed"
+        store[(3, 2)].value.append(2)
+        assert copied[(1, 1)].value == "a"
+        assert copied[(3, 2)].value == [1]
+
+
+    def test_comments(self, store, ws):
+        from openpyxl.comments import Comment
+        cell = store[(1, 1)]
+        cell.comment = Comment("text", "author")
+        cell.hyperlink = "http://example.com"
+        copied = store.snapshot(ws)
+        assert not is_loaded(copied, 1)
+        assert copied[(1, 1)].comment is not cell.comment
+        assert copied[(1, 1)].comment.parent is copied[(1, 1)]
+        assert copied[(1, 1)].hyperlink.target == "http://example.com"
+        assert copied[(1, 3)].value == 3
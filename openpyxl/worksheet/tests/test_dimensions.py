@@ -2,7 +2,7 @@
 
 import pytest
 
-from copy import copy
+from copy import copy, deepcopy
 
 from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.styles.styleable import StyleArray
@@ -229,3 +229,15 @@ class TestGrouping:
         dims['A'].width = 5
         dims['D']
         assert dims.to_tree() is not None
+
+
+    def test_deepcopy(self):
+        from ..worksheet import Worksheet
+        ws = Worksheet(DummyWorkbook())
+        ws.column_dimensions['A'].width = 5
+        copied = deepcopy(ws.column_dimensions)
+        assert copied.worksheet is not ws
+        assert copied['A'].width == 5
+        assert copied.default_factory is not None
+        copied['C']
+        assert 'C' not in ws.column_dimensions
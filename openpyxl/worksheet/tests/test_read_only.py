@@ -1,7 +1,7 @@
 # Copyright (c) 2010-2022 openpyxl
 
 from io import BytesIO
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED
 
 import pytest
 
@@ -71,7 +71,7 @@ class TestReadOnlyWorksheet:
 
     def test_empty_cell(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':None, 'row':1},
+            (1, 4, None, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, max_col=4, values_only=True)
@@ -80,8 +80,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row_left(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4,},
-            {'column':8, 'value':8,},
+            (1, 4, 4, 'n', 0),
+            (1, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, max_col=4, values_only=True)
@@ -90,8 +90,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4,},
-            {'column':8, 'value':8,},
+            (1, 4, 4, 'n', 0),
+            (1, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=4, max_col=8, values_only=True)
@@ -100,8 +100,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row_right(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4},
-            {'column':8, 'value':8},
+            (1, 4, 4, 'n', 0),
+            (1, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=6, max_col=10, values_only=True)
@@ -110,8 +110,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row_cells(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4, 'row':2},
-            {'column':8, 'value':8, 'row':2},
+            (2, 4, 4, 'n', 0),
+            (2, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=6, max_col=10)
@@ -173,6 +173,136 @@ class TestReadOnlyWorksheet:
         ]
 
 
+    def test_selected_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_selected_columns(["C", 1], min_row=2, max_row=5, values_only=True)
+        assert list(rows) == [
+            (3, 1),
+            (6, 4),
+            (9, 7),
+            (None, None),
+        ]
+
+
+    def test_selected_columns_cells(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = list(ws.iter_selected_columns([2], max_row=2))
+        assert rows == [
+            (ReadOnlyCell(ws, 1, 2, "col2", 's', 0),),
+            (ReadOnlyCell(ws, 2, 2, 2, 'n', 0),),
+        ]
+
+
+    def test_select_column_twice(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        with pytest.raises(ValueError):
+            ws.iter_selected_columns(["A", 1])
+
+
+    @pytest.mark.parametrize("row, column, value",
+                             [
+                                 (1, 1, "col1"),
+                                 (3, 2, 5),
+                                 (4, 3, 9),
+                                 (5, 1, None),
+                                 (10, 1, 7),
+                                 (11, 1, None),
+                             ]
+                             )
+    def test_indexed_cell(self, ReadOnlyWorksheet, row, column, value):
+        ws = ReadOnlyWorksheet
+        ws.create_row_index(step=2, cache_size=1)
+        assert ws._row_index.rows == [1, 3, 10]
+        assert ws.cell(row, column).value == value
+
+
+    def test_indexed_rows(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        ws.create_row_index(step=2)
+        rows = ws.iter_rows(min_row=4, max_row=10, max_col=3, values_only=True)
+        assert list(rows)[::6] == [(7, 8, 9), (7, 8, 9)]
+
+
+    def test_indexed_shared_formula(self, DummyWorkbook, ReadOnlyWorksheet):
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1"><c r="A1"><f t="shared" ref="A1:A3" si="0">B1*2</f><v>2</v></c></row>
+          <row r="2"><c r="A2"><f t="shared" si="0"/><v>4</v></c></row>
+          <row r="3"><c r="A3"><f t="shared" si="0"/><v>6</v></c></row>
+        </sheetData>
+        </worksheet>
+        """
+        wb = DummyWorkbook
+        wb._archive.writestr("sheet2.xml", src, ZIP_DEFLATED)
+        ws = ReadOnlyWorksheet
+        ws._worksheet_path = "sheet2.xml"
+        ws.create_row_index(step=2)
+        assert ws._get_raw_source() is not None
+        assert ws.cell(3, 1).value == "=B3*2"
+
+
+    def test_index_unnumbered_rows(self, DummyWorkbook, ReadOnlyWorksheet):
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData><row /></sheetData>
+        </worksheet>
+        """
+        wb = DummyWorkbook
+        wb._archive.writestr("sheet2.xml", src)
+        ws = ReadOnlyWorksheet
+        ws._worksheet_path = "sheet2.xml"
+        with pytest.raises(ValueError):
+            ws.create_row_index()
+
+
+    def test_drop_row_index(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        ws.create_row_index()
+        ws.drop_row_index()
+        assert ws._row_index is None
+
+
+    def test_partitions(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        ws.create_row_index(step=2)
+        assert ws.partitions(2) == [(1, 2), (3, None)]
+        assert ws.partitions(5) == [(1, 2), (3, 9), (10, None)]
+
+
+    @pytest.mark.parametrize("on_disk", [False, True])
+    def test_iter_rows_parallel(self, DummyWorkbook, ReadOnlyWorksheet, tmpdir, on_disk):
+        ws = ReadOnlyWorksheet
+        if on_disk:
+            path = str(tmpdir.join("sheet.zip"))
+            with ZipFile(path, "w") as archive:
+                archive.write("sheet_inline_strings.xml", "sheet1.xml")
+            DummyWorkbook._archive = ZipFile(path)
+        ws.create_row_index(step=1)
+        rows = ws.iter_rows_parallel(min_row=2, max_row=11, max_col=2,
+                                     values_only=True, workers=2)
+        assert list(rows) == list(ws.iter_rows(min_row=2, max_row=11, max_col=2,
+                                               values_only=True))
+
+
+    def test_iter_rows_parallel_unnumbered(self, DummyWorkbook, ReadOnlyWorksheet, tmpdir):
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row><c t="inlineStr"><is><t>a</t></is></c></row>
+          <row><c><v>1</v></c><c><v>2</v></c></row>
+        </sheetData>
+        </worksheet>
+        """
+        path = str(tmpdir.join("sheet.zip"))
+        with ZipFile(path, "w") as archive:
+            archive.writestr("sheet1.xml", src)
+        DummyWorkbook._archive = ZipFile(path)
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows_parallel(max_col=2, values_only=True, workers=2)
+        assert list(rows) == [("a", None), (1, 2)]
+        assert ws._row_index is None
+        with pytest.raises(ValueError):
+            ws.partitions(2)
+
+
     def test_calculate_dimension(self, ReadOnlyWorksheet):
         ws = ReadOnlyWorksheet
         assert ws.calculate_dimension(True) == "A1:C10"
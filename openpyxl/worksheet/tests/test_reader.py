@@ -232,8 +232,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'f', 'row': 1,
-                        'style_id':0, 'value': '=IF(TRUE, "y", "n")'}
+        assert cell == (1, 1, '=IF(TRUE, "y", "n")', 'f', 0)
 
 
     def test_formula_data_only(self, WorkSheetParser):
@@ -249,8 +248,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'n', 'row': 1,
-                        'style_id':0, 'value': 3}
+        assert cell == (1, 1, 3, 'n', 0)
 
 
     def test_string_formula_data_only(self, WorkSheetParser):
@@ -266,8 +264,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 's', 'row': 1,
-                        'style_id':0, 'value': 'y'}
+        assert cell == (1, 1, 'y', 's', 0)
 
 
     def test_number(self, WorkSheetParser):
@@ -281,8 +278,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'n', 'row': 1,
-                        'style_id':0, 'value': 1}
+        assert cell == (1, 1, 1, 'n', 0)
 
 
 
@@ -297,8 +293,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'd', 'row': 1,
-                        'style_id':0, 'value': datetime.datetime(2011, 12, 25, 14, 23, 55)}
+        assert cell == (1, 1, datetime.datetime(2011, 12, 25, 14, 23, 55), 'd', 0)
 
 
     def test_timedelta(self, WorkSheetParser):
@@ -312,8 +307,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'd', 'row': 1,
-                        'style_id':30, 'value':datetime.timedelta(days=1, hours=6)}
+        assert cell == (1, 1, datetime.timedelta(days=1, hours=6), 'd', 30)
 
 
     def test_mac_date(self, WorkSheetParser):
@@ -328,8 +322,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'd', 'row': 1,
-                        'style_id':29, 'value':datetime.datetime(2016, 10, 3, 0, 0)}
+        assert cell == (1, 1, datetime.datetime(2016, 10, 3, 0, 0), 'd', 29)
 
     @pytest.mark.parametrize("value", [
         -693595,
@@ -361,8 +354,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 's', 'row': 1,
-                        'style_id':0, 'value':'a'}
+        assert cell == (1, 1, 'a', 's', 0)
 
 
     def test_boolean(self, WorkSheetParser):
@@ -376,8 +368,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'b', 'row': 1,
-                        'style_id':0, 'value':True}
+        assert cell == (1, 1, True, 'b', 0)
 
 
     def test_inline_string(self, WorkSheetParser):
@@ -393,8 +384,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 's', 'row': 1,
-                        'style_id':0, 'value':"ID"}
+        assert cell == (1, 1, "ID", 's', 0)
 
 
     def test_inline_richtext(self, WorkSheetParser):
@@ -414,8 +404,7 @@ class TestWorksheetParser:
 
         element = fromstring(src)
         cell = parser.parse_cell(element)
-        assert cell == {'column': 18, 'data_type': 's', 'row': 2,
-                        'style_id':4, 'value':"11 de September de 2014"}
+        assert cell == (2, 18, "11 de September de 2014", 's', 4)
 
 
     def test_sheet_views(self, WorkSheetParser):
@@ -572,9 +561,9 @@ class TestWorksheetParser:
         element = fromstring(src)
         max_row, cells = parser.parse_row(element)
         expected = [
-            {'column': 1, 'row': 1, 'data_type': 'n', 'value': 2, 'style_id': 0},
-            {'column': 2, 'row': 1, 'data_type': 'n', 'value': 4, 'style_id': 0},
-            {'column': 3, 'row': 1, 'data_type': 'n', 'value': 3, 'style_id': 0},
+            (1, 1, 2, 'n', 0),
+            (1, 2, 4, 'n', 0),
+            (1, 3, 3, 'n', 0),
         ]
         for expected_cell, cell in zip(expected, cells):
             assert expected_cell == cell
@@ -601,10 +590,10 @@ class TestWorksheetParser:
         element = fromstring(src)
         _, cells = parser.parse_row(element)
         expected = [
-            {'column': 1, 'row': 1, 'data_type': 'n', 'value': 1, 'style_id': 0},
-            {'column': 4, 'row': 1, 'data_type': 'n', 'value': 2, 'style_id': 0},
-            {'column': 5, 'row': 1, 'data_type': 'n', 'value': 3, 'style_id': 0},
-            {'column': 7, 'row': 1, 'data_type': 'n', 'value': 4, 'style_id': 0},
+            (1, 1, 1, 'n', 0),
+            (1, 4, 2, 'n', 0),
+            (1, 5, 3, 'n', 0),
+            (1, 7, 4, 'n', 0),
         ]
         assert len(cells) == len(expected)
         for expected_cell, cell in zip(expected, cells):
@@ -624,12 +613,45 @@ class TestWorksheetParser:
         parser.parse_row(element)
         max_row, cells = parser.parse_row(element)
         expected = [
-            {'column': 1, 'row': 2, 'data_type': 'n', 'value': 2, 'style_id': 0},
+            (2, 1, 2, 'n', 0),
         ]
         for expected_cell, cell in zip(expected, cells):
             assert expected_cell == cell
 
 
+    def test_selected_columns(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.columns = range(2, 4)
+        src = """
+        <row r="3" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A3"><v>1</v></c>
+          <c r="B3"><v>2</v></c>
+          <c><v>3</v></c>
+          <c r="E3"><v>4</v></c>
+        </row>
+        """
+        element = fromstring(src)
+        _, cells = parser.parse_row(element)
+        assert cells == [
+            (3, 2, 2, 'n', 0),
+            (3, 3, 3, 'n', 0),
+        ]
+
+
+    def test_skipped_shared_formula(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.columns = {2}
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1"><f t="shared" ref="A1:B1" si="0">C1*2</f><v>0</v></c>
+          <c r="B1"><f t="shared" si="0"/><v>0</v></c>
+        </row>
+        """
+        element = fromstring(src)
+        _, cells = parser.parse_row(element)
+        assert cells == [(1, 2, "=D1*2", 'f', 0)]
+
+
     def test_external_hyperlinks(self, WorkSheetParser):
         src = b"""
         <hyperlinks xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
@@ -893,6 +915,18 @@ class TestWorksheetReader:
         assert ws['E2'].value == "=C2:C11*D2:D11"
 
 
+    def test_cells_created_on_use(self, PrimedWorksheetReader):
+        reader = PrimedWorksheetReader
+        reader.bind_cells()
+        cells = reader.ws._cells
+
+        assert not any(isinstance(row, dict) for row in cells._rows.values())
+        assert (1, 3) in cells
+        cell = reader.ws['C1']
+        assert cells[(1, 3)] is cell
+        assert [row for row, c in cells._rows.items() if isinstance(c, dict)] == [1]
+
+
     def test_formatting(self, PrimedWorksheetReader):
         reader = PrimedWorksheetReader
         reader.bind_cells()
@@ -1039,3 +1073,22 @@ class TestWorksheetReader:
         reader = WorksheetReader(ws, "more_rows_than_cells.xml", None, None)
         reader.bind_cells()
         assert ws._current_row == 3
+
+
+    def test_parsed(self, Workbook, WorksheetReader, datadir):
+        from .._reader import read_worksheet
+        import pickle
+
+        wb = Workbook
+        datadir.chdir()
+        with open("complex-styles-worksheet.xml", "rb") as src:
+            parsed = read_worksheet(src, wb.shared_strings)
+        parsed = pickle.loads(pickle.dumps(parsed))
+
+        ws = wb.create_sheet("Sheet")
+        reader = WorksheetReader(ws, None, None, False, parsed)
+        reader.bind_cells()
+        reader.bind_formatting()
+        assert ws['C1'].value == 'a'
+        assert ws['E2'].value == "=C2:C11*D2:D11"
+        assert len(ws.conditional_formatting) == 3
@@ -0,0 +1,98 @@
+# Copyright (c) 2010-2022 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+import zlib
+
+import pytest
+
+from .. import _row_index
+from .._row_index import (
+    scan_rows,
+    open_deflated,
+    Inflater,
+    ResumedSource,
+    RowIndex,
+)
+
+
+SHEET = b"""<x:worksheet xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<x:sheetData><x:row r="1"/><x:row r="2" spans="1:2"/><x:row r="3"/></x:sheetData>
+</x:worksheet>"""
+
+
+@pytest.fixture
+def archive():
+    archive = ZipFile(BytesIO(), "w")
+    archive.writestr("deflated.xml", SHEET * 100, ZIP_DEFLATED)
+    archive.writestr("stored.xml", SHEET, ZIP_STORED)
+    return archive
+
+
+@pytest.mark.parametrize("chunk_size", [8, 1024])
+def test_scan_rows(chunk_size, monkeypatch):
+    monkeypatch.setattr(_row_index, "CHUNK_SIZE", chunk_size)
+    header, checkpoints, shared = scan_rows(BytesIO(SHEET), 2)
+    assert header == SHEET[:SHEET.index(b"<x:row")]
+    assert checkpoints == [
+        (1, SHEET.index(b'<x:row r="1"')),
+        (3, SHEET.index(b'<x:row r="3"')),
+    ]
+    assert shared is False
+
+
+def test_scan_unnumbered_rows():
+    assert scan_rows(BytesIO(b"<sheetData><row/></sheetData>"), 1) is None
+
+
+def test_resumed_source():
+    header, checkpoints, shared = scan_rows(BytesIO(SHEET), 2)
+    row, offset = checkpoints[1]
+    src = ResumedSource(header, BytesIO(SHEET), offset)
+    assert src.read() == header
+    assert src.read() == SHEET[offset:]
+
+
+def test_open_deflated(archive):
+    assert open_deflated(archive, "stored.xml") is None
+    raw = open_deflated(archive, "deflated.xml")
+    assert zlib.decompress(raw.read(), -zlib.MAX_WBITS) == SHEET * 100
+
+
+def test_inflater(archive):
+    src = Inflater(open_deflated(archive, "deflated.xml"), spacing=1)
+    assert src.read(10) + src.read() == SHEET * 100
+    assert src.read() == b""
+
+
+def test_resume_inflated(archive, monkeypatch):
+    monkeypatch.setattr(_row_index, "CHUNK_SIZE", 64)
+    data = SHEET * 100
+    src = Inflater(open_deflated(archive, "deflated.xml"), spacing=len(SHEET))
+    header, checkpoints, shared = scan_rows(src, 50)
+    assert len(src.points) > 1
+
+    raw = lambda: open_deflated(archive, "deflated.xml")
+    index = RowIndex(header, checkpoints, points=src.points)
+    idx = len(checkpoints) - 1
+    resumed = index.open(idx, None, raw)
+    resumed.read()
+    assert resumed.read(len(data)) == data[checkpoints[idx][1]:]
+
+
+def test_block_cache():
+    parsed = []
+
+    def parse(min_row, max_row):
+        parsed.append(min_row)
+        return {min_row: max_row}
+
+    index = RowIndex(b"", [(1, 0), (5, 10), (9, 20)], cache_size=2)
+    assert index.find(0) is None
+    assert index.find(6) == 1
+    assert index.get_block(0, parse) == {1: 5}
+    assert index.get_block(2, parse) == {9: None}
+    index.get_block(0, parse)
+    index.get_block(1, parse)
+    index.get_block(2, parse)
+    assert parsed == [1, 9, 5, 9]
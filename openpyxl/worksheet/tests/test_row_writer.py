@@ -0,0 +1,251 @@
+# Copyright (c) 2010-2022 openpyxl
+
+import datetime
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+
+from openpyxl import LXML
+from openpyxl.comments import Comment
+from openpyxl.styles import Font
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.workbook import Workbook
+
+from ..dimensions import RowDimension
+from .._writer import WorksheetWriter
+from .._row_writer import RowWriter
+
+
+@pytest.fixture
+def ws():
+    wb = Workbook()
+    return wb.active
+
+
+def write_rows(ws, fast_rows):
+    writer = WorksheetWriter(ws, out=BytesIO(), fast_rows=fast_rows)
+    writer.write_rows()
+    return writer.read()
+
+
+@pytest.mark.parametrize("value",
+                         [
+                             1,
+                             -2.5,
+                             10**20,
+                             float("nan"),
+                             float("inf"),
+                             True,
+                             Decimal("1.10"),
+                             "plain",
+                             " leading and trailing ",
+                             "a&b<c>d\"e'",
+                             "\xe9 中 \U0001F600",
+                             "line\nbreak\r\ttab",
+                             "=SUM(A1:A2)",
+                             "=",
+                             datetime.datetime(2020, 1, 2, 3, 4, 5),
+                             datetime.date(2021, 5, 6),
+                             datetime.time(12, 30),
+                             datetime.timedelta(hours=5),
+                             None,
+                         ]
+                         )
+@pytest.mark.parametrize("iso_dates", [False, True])
+def test_same_as_writer(ws, value, iso_dates):
+    ws.parent.iso_dates = iso_dates
+    ws["B2"] = value
+    ws["C2"] = value
+    ws["C2"].font = Font(bold=True)
+    assert write_rows(ws, True) == write_rows(ws, False)
+
+
+def test_error(ws):
+    ws["A1"] = "#N/A"
+    ws["A1"].data_type = "e"
+    assert write_rows(ws, True) == write_rows(ws, False)
+
+
+def test_shared_strings(ws):
+    ws.parent.use_shared_strings = True
+    ws.append(["a", "b", "", "a", 1])
+    fast = write_rows(ws, True)
+    assert ws.parent.shared_strings == ["a", "b"]
+    assert write_rows(ws, False) == fast
+    assert ws.parent.shared_strings == ["a", "b"]
+    assert b'<c r="D1" t="s"><v>0</v></c>' in fast
+
+
+def test_row_dimensions(ws):
+    ws["A1"] = 1
+    ws.row_dimensions[1] = RowDimension(ws, index=1, ht=20)
+    ws.row_dimensions[3] = RowDimension(ws, index=3, hidden=True)
+    assert write_rows(ws, True) == write_rows(ws, False)
+
+
+def test_array_formula(ws):
+    ws["A1"] = "=A2:A3*2"
+    ws.formula_attributes["A1"] = {"t": "array", "ref": "A1:A2"}
+    assert write_rows(ws, True) == write_rows(ws, False)
+
+
+def test_comment_and_hyperlink(ws):
+    ws["A1"].comment = Comment("comment", "author")
+    ws["B1"] = "link"
+    ws["B1"].hyperlink = "http://example.com/?a=1&b=2"
+    writer = WorksheetWriter(ws, out=BytesIO(), fast_rows=True)
+    writer.write_rows()
+    assert len(ws._comments) == 1
+    assert [link.ref for link in ws._hyperlinks] == ["B1"]
+
+
+def test_timezone(ws):
+    ws["A1"] = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    with pytest.raises(TypeError):
+        write_rows(ws, True)
+
+
+def test_empty(ws):
+    assert write_rows(ws, True) == write_rows(ws, False)
+
+
+def test_buffer(ws):
+    out = []
+    writer = RowWriter(ws, out.append)
+    writer.start()
+    assert out == []
+    writer.end()
+    assert out == [b"<sheetData></sheetData>"]
+
+
+@pytest.mark.parametrize("lxml, expected",
+                         [
+                             (True, b'<row r="1"><c r="A1" s="1" t="n"></c><c r="B1" t="inlineStr"><is><t>&#233;&#13;x</t></is></c></row>'),
+                             (False, b'<row r="1"><c r="A1" s="1" t="n" /><c r="B1" t="inlineStr"><is><t>\xc3\xa9\rx</t></is></c></row>'),
+                         ]
+                         )
+def test_backends(ws, lxml, expected):
+    ws["A1"].font = Font(bold=True)
+    ws["B1"] = "\xe9\rx"
+    out = []
+    writer = RowWriter(ws, out.append, lxml=lxml)
+    writer.write_row([ws["A1"], ws["B1"]], 1)
+    writer.flush()
+    assert out == [expected]
+
+
+def write_values(ws, schema, rows, lxml=LXML):
+    """
+    Write rows of values with a schema and as cells with the same styles
+    """
+    from ..schema import Column
+
+    fast, slow = [], []
+    writer = RowWriter(ws, fast.append, lxml=lxml)
+    columns = writer.compile(schema)
+    for idx, row in enumerate(rows, 1):
+        writer.write_values(row, idx, columns)
+    writer.flush()
+
+    styles = [column.style_cell(ws)._style for column in schema]
+    writer = RowWriter(ws, slow.append, lxml=lxml)
+    for idx, row in enumerate(rows, 1):
+        writer.write_row(ws._values_to_row(row, idx, styles), idx)
+    writer.flush()
+    return b"".join(fast), b"".join(slow)
+
+
+@pytest.fixture
+def write_only():
+    wb = Workbook(write_only=True)
+    return wb.create_sheet()
+
+
+VALUES = [
+    ('n', [1, -2.5, 10**20]),
+    ('s', ["plain", " space ", "a&b<c>", "\xe9 \U0001F600", "line\r\nbreak"]),
+    ('d', [datetime.datetime(2020, 1, 2, 3, 4, 5), datetime.date(2021, 5, 6),
+           datetime.time(12, 30), datetime.timedelta(hours=5)]),
+    ('b', [True, False]),
+    ('f', ["=SUM(A1:A2)", "=A1&\"<\""]),
+    (None, [1, "s", True]),
+]
+
+
+@pytest.mark.parametrize("data_type, values", VALUES)
+@pytest.mark.parametrize("trusted", [False, True])
+@pytest.mark.parametrize("iso_dates", [False, True])
+@pytest.mark.parametrize("lxml", [False, True])
+def test_values_same_as_cells(write_only, data_type, values, trusted, iso_dates, lxml):
+    from ..schema import Column
+
+    write_only.parent.iso_dates = iso_dates
+    schema = [Column(data_type, trusted=trusted),
+              Column(data_type, font=Font(bold=True), trusted=trusted)]
+    rows = [[value, value] for value in values]
+    fast, slow = write_values(write_only, schema, rows, lxml)
+    assert fast == slow
+
+
+@pytest.mark.parametrize("data_type, value",
+                         [
+                             ('n', "text"),
+                             ('n', float("nan")),
+                             ('n', Decimal("1.10")),
+                             ('n', True),
+                             ('s', 5),
+                             ('s', ""),
+                             ('s', "=A1"),
+                             ('s', "#N/A"),
+                             ('s', "x" * 40000),
+                             ('d', 5),
+                             ('b', 1),
+                             ('f', "text"),
+                         ]
+                         )
+def test_other_values(write_only, data_type, value):
+    from ..schema import Column
+
+    schema = [Column(data_type)]
+    fast, slow = write_values(write_only, schema, [[value]])
+    assert fast == slow
+
+
+def test_values_beyond_schema(write_only):
+    from ..schema import Column
+
+    fast, slow = write_values(write_only, [Column('n')], [[1, "a", None, 2]])
+    assert fast == slow
+    assert b'<c r="D1" t="n"><v>2</v></c>' in fast
+
+
+def test_values_cells_and_comments(write_only):
+    from openpyxl.cell import WriteOnlyCell
+    from ..schema import Column
+
+    cell = WriteOnlyCell(write_only, "note")
+    cell.comment = Comment("comment", "author")
+    fast, slow = write_values(write_only, [Column('s'), Column('s')], [["a", cell]])
+    assert fast == slow
+    assert [c.ref for c in write_only._comments] == ["B1", "B1"]
+
+
+def test_values_shared_strings(write_only):
+    from ..schema import Column
+
+    wb = write_only.parent
+    wb.use_shared_strings = True
+    wb.shared_strings = IndexedList()
+    fast, slow = write_values(write_only, [Column('s', trusted=True)], [["a"], ["b"], ["a"]])
+    assert fast == slow
+    assert wb.shared_strings == ["a", "b"]
+
+
+def test_values_row_dimensions(write_only):
+    from ..schema import Column
+
+    write_only.row_dimensions[1].height = 20
+    fast, slow = write_values(write_only, [Column('n')], [[1]])
+    assert fast == slow
+    assert fast.startswith(b'<row r="1" ht="20" customHeight="1">')
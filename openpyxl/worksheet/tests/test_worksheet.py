@@ -609,6 +609,17 @@ class TestEditableWorksheet:
         assert [c.value for c in ws['B']] == ['B1', 'B5', 'B6']
 
 
+    def test_delete_sparse_rows(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws['J10'] = "J10"
+
+        ws.delete_rows(3, 4)
+
+        assert ws.calculate_dimension() == "A1:J6"
+        assert ws['J6'].value == "J10"
+        assert [c.value for c in ws[3]] == [None]*10
+
+
     def test_deleta_all_rows(self, dummy_worksheet):
         ws = dummy_worksheet
 
@@ -645,22 +656,6 @@ class TestEditableWorksheet:
         assert ws['B3'].value is None
 
 
-    @pytest.mark.parametrize("idx, offset, max_val, remainder",
-                             [
-                                 (1, 3, 6, {4}),
-                                 (2, 3, 6, {4, 5}),
-                                 (3, 3, 6, {4, 5, 6}),
-                                 (4, 3, 6, {4, 5, 6}),
-                                 (5, 3, 6, {5, 6}),
-                                 (6, 3, 6, {6}),
-                                 (6, 1, 6, {6}),
-                             ]
-                             )
-    def test_remainder(self, dummy_worksheet, idx, offset, max_val, remainder):
-        from ..worksheet import _gutter
-        assert set(_gutter(idx, offset, max_val)) == remainder
-
-
     def test_delete_last_col(self, dummy_worksheet):
         ws = dummy_worksheet
         ws.delete_cols(8)
@@ -209,3 +209,103 @@ def test_hyperlink(WriteOnlyWorksheet):
     ws.append([cell])
     assert cell.hyperlink.ref == "A2"
     ws.close()
+
+
+def test_fast_rows():
+    from .._write_only import WriteOnlyWorksheet
+
+    def write(fast_rows):
+        wb = DummyWorkbook()
+        wb.fast_rows = fast_rows
+        ws = WriteOnlyWorksheet(wb, title="TestWorksheet")
+        ws.append([1, "s", None, "=A1"])
+        ws.append([datetime.date(2001, 1, 1), " x"])
+        ws.close()
+        with open(ws._writer.out, "rb") as src:
+            return src.read()
+
+    assert write(True) == write(False)
+
+
+class TestSchema:
+
+
+    def write(self, schema, rows, fast_rows=False):
+        from io import BytesIO
+        from openpyxl import Workbook, load_workbook
+
+        wb = Workbook(write_only=True)
+        wb.fast_rows = fast_rows
+        ws = wb.create_sheet()
+        ws.schema = schema
+        ws.append_rows(rows)
+        out = BytesIO()
+        wb.save(out)
+        return load_workbook(out).active
+
+
+    def test_save(self):
+        from openpyxl.styles import Font
+        from ..schema import Column
+
+        schema = [
+            Column('n', trusted=True),
+            Column('s', font=Font(bold=True)),
+            Column('d', number_format="yyyy-mm-dd"),
+        ]
+        rows = [
+            [1, "a", datetime.date(2022, 1, 1)],
+            [2.5, None, "not a date", "extra"],
+        ]
+        ws = self.write(schema, rows)
+        values = [[c.value for c in row] for row in ws.iter_rows()]
+        assert values == [
+            [1, "a", datetime.datetime(2022, 1, 1), None],
+            [2.5, None, "not a date", "extra"],
+        ]
+        assert ws["B1"].font.b is True
+        assert ws["C1"].number_format == "yyyy-mm-dd"
+        assert ws["C2"].number_format == "yyyy-mm-dd"
+
+
+    def test_column(self):
+        from ..schema import Column
+
+        col = Column('d')
+        assert col.number_format == "yyyy-mm-dd h:mm:ss"
+        assert repr(col) == "Column('d', trusted=False)"
+        with pytest.raises(ValueError):
+            Column('x')
+
+
+    def test_schema_after_append(self, WriteOnlyWorksheet):
+        from ..schema import Column
+
+        ws = WriteOnlyWorksheet
+        ws.append([1])
+        with pytest.raises(ValueError):
+            ws.schema = [Column('n')]
+        ws.close()
+
+
+    def test_xml_writer(self):
+        """
+        Values are converted to cells when rows cannot be written directly
+        """
+        from io import BytesIO
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+        from .._writer import WorksheetWriter
+        from ..schema import Column
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        schema = [Column('n'), Column('s', font=Font(italic=True))]
+        writer = WorksheetWriter(ws, out=BytesIO(), fast_rows=False)
+        xf = writer.xf.send(True)
+        with writer.sheet_data(xf, schema) as write_row:
+            write_row([1, "a"], 1)
+        writer.xf.send(None)
+        writer.close()
+        xml = writer.read()
+        assert b'<c r="B1" s="1" t="inlineStr">' in xml
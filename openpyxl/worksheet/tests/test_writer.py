@@ -586,6 +586,26 @@ class TestWorksheetWriter:
         assert diff is None, diff
 
 
+    def test_write_tail_fast_rows(self, writer):
+        from io import BytesIO
+        from .._writer import WorksheetWriter
+
+        ws = writer.ws
+        ws['A10'] = 15
+        ws['A10'].hyperlink = "http://www.example.com"
+        ws.merge_cells("A1:B2")
+        ws.auto_filter.ref = "A1:B10"
+        writer.write()
+        expected = writer.read()
+
+        fast = WorksheetWriter(ws, BytesIO(), fast_rows=True)
+        assert fast._raw is True
+        fast.write()
+        xml = fast.read()
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
     def test_cleanup(self, writer):
         assert os.path.exists(writer.out) is True
         writer.close()
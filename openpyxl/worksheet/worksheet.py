@@ -5,7 +5,6 @@
 
 # Python stdlib imports
 from itertools import chain
-from operator import itemgetter
 from inspect import isgenerator
 from warnings import warn
 
@@ -30,6 +29,7 @@ from openpyxl.workbook.defined_name import COL_RANGE_RE, ROW_RANGE_RE
 from openpyxl.formula.translate import Translator
 
 from .datavalidation import DataValidationList
+from ._cell_store import CellStore
 from .page import (
     PrintPageSetup,
     PageMargins,
@@ -104,7 +104,7 @@ class Worksheet(_WorkbookChild):
                                                  default_factory=self._add_column)
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
-        self._cells = {}
+        self._cells = CellStore(self)
         self._charts = []
         self._images = []
         self._rels = RelationshipList()
@@ -331,8 +331,7 @@ class Worksheet(_WorkbookChild):
         """
         min_row = 1
         if self._cells:
-            rows = set(c[0] for c in self._cells)
-            min_row = min(rows)
+            min_row = self._cells.bounds[1]
         return min_row
 
 
@@ -344,8 +343,7 @@ class Worksheet(_WorkbookChild):
         """
         max_row = 1
         if self._cells:
-            rows = set(c[0] for c in self._cells)
-            max_row = max(rows)
+            max_row = self._cells.bounds[3]
         return max_row
 
 
@@ -357,8 +355,7 @@ class Worksheet(_WorkbookChild):
         """
         min_col = 1
         if self._cells:
-            cols = set(c[1] for c in self._cells)
-            min_col = min(cols)
+            min_col = self._cells.bounds[0]
         return min_col
 
 
@@ -370,8 +367,7 @@ class Worksheet(_WorkbookChild):
         """
         max_col = 1
         if self._cells:
-            cols = set(c[1] for c in self._cells)
-            max_col = max(cols)
+            max_col = self._cells.bounds[2]
         return max_col
 
 
@@ -381,15 +377,7 @@ class Worksheet(_WorkbookChild):
         :rtype: string
         """
         if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
+            min_col, min_row, max_col, max_row = self._cells.bounds
         else:
             return "A1:A1"
 
@@ -680,30 +668,13 @@ class Worksheet(_WorkbookChild):
 
     def _move_cells(self, min_row=None, min_col=None, offset=0, row_or_col="row"):
         """
-        Move either rows or columns around by the offset
+        Move either rows or columns around by the offset.
+        When moving up or left the rows or columns moved over are removed.
         """
-        reverse = offset > 0 # start at the end if inserting
-        row_offset = 0
-        col_offset = 0
-
-        # need to make affected ranges contiguous
         if row_or_col == 'row':
-            cells = self.iter_rows(min_row=min_row)
-            row_offset = offset
-            key = 0
+            self._cells.shift_rows(min_row, offset)
         else:
-            cells = self.iter_cols(min_col=min_col)
-            col_offset = offset
-            key = 1
-        cells = list(cells)
-
-        for row, column in sorted(self._cells, key=itemgetter(key), reverse=reverse):
-            if min_row and row < min_row:
-                continue
-            elif min_col and column < min_col:
-                continue
-
-            self._move_cell(row, column, row_offset, col_offset)
+            self._cells.shift_columns(min_col, offset)
 
 
     def insert_rows(self, idx, amount=1):
@@ -725,18 +696,7 @@ class Worksheet(_WorkbookChild):
         """
         Delete row or rows from row==idx
         """
-
-        remainder = _gutter(idx, amount, self.max_row)
-
         self._move_cells(min_row=idx+amount, offset=-amount, row_or_col="row")
-
-        # calculating min and max col is an expensive operation, do it only once
-        min_col = self.min_column
-        max_col = self.max_column + 1
-        for row in remainder:
-            for col in range(min_col, max_col):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
         self._current_row = self.max_row
         if not self._cells:
             self._current_row = 0
@@ -746,19 +706,8 @@ class Worksheet(_WorkbookChild):
         """
         Delete column or columns from col==idx
         """
-
-        remainder = _gutter(idx, amount, self.max_column)
-
         self._move_cells(min_col=idx+amount, offset=-amount, row_or_col="column")
 
-        # calculating min and max row is an expensive operation, do it only once
-        min_row = self.min_row
-        max_row = self.max_row + 1
-        for col in remainder:
-            for row in range(min_row, max_row):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
-
 
     def move_range(self, cell_range, rows=0, cols=0, translate=False):
         """
@@ -889,13 +838,3 @@ class Worksheet(_WorkbookChild):
             value = [value]
 
         self._print_area = [absolute_coordinate(v) for v in value]
-
-
-def _gutter(idx, offset, max_val):
-    """
-    When deleting rows and columns are deleted we rely on overwriting.
-    This may not be the case for a large offset on small set of cells:
-    range(cells_to_delete) > range(cell_to_be_moved)
-    """
-    gutter = range(max(max_val+1-offset, idx), min(idx+offset, max_val)+1)
-    return gutter
@@ -0,0 +1,110 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Zip archive that compresses entries in parallel
+
+zlib releases the GIL while compressing so large entries are compressed in
+a pool of threads while the rest of the workbook is serialised. Compressed
+entries are then added to the archive with their sizes and checksums
+already known.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import time
+import zlib
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
+
+from openpyxl.packaging.archive import RawEntry, write_raw
+
+# smaller entries are not worth handing to a thread
+MIN_SIZE = 64 * 1024
+
+
+def _compress(data, level):
+    if level is None:
+        level = zlib.Z_DEFAULT_COMPRESSION
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data)
+
+
+class _EntryBuffer(BytesIO):
+    """
+    Collect an entry opened for writing and add it to the archive on close
+    """
+
+    def __init__(self, archive, name):
+        super().__init__()
+        self._archive = archive
+        self._name = name
+
+
+    def close(self):
+        if not self.closed:
+            self._archive.writestr(self._name, self.getvalue())
+        super().close()
+
+
+class ParallelZipFile(ZipFile):
+    """
+    Write-only ZipFile that deflates large entries in a pool of threads.
+
+    Entries opened for writing by name are kept in memory until they are
+    closed.
+    """
+
+    def __init__(self, file, compresslevel=None, workers=2):
+        super().__init__(file, "w", ZIP_DEFLATED, allowZip64=True)
+        self.compresslevel = compresslevel
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(workers)
+        self._pending = deque()
+
+
+    def open(self, name, mode="r", pwd=None, *, force_zip64=False):
+        # writestr() and write() pass a ZipInfo and are written as normal
+        if mode == "w" and isinstance(name, str):
+            return _EntryBuffer(self, name)
+        return super().open(name, mode, pwd, force_zip64=force_zip64)
+
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if (isinstance(zinfo_or_arcname, ZipInfo)
+            or compress_type is not None
+            or compresslevel is not None
+            or len(data) < MIN_SIZE):
+            super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+            return
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        zinfo = ZipInfo(zinfo_or_arcname, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+        future = self._executor.submit(_compress, data, self.compresslevel)
+        self._pending.append((zinfo, len(data), future))
+        # limit the number of entries held in memory
+        self._write_pending(2 * self.workers)
+
+
+    def _write_pending(self, limit):
+        """
+        Add compressed entries to the archive in order, waiting until at most
+        limit are left
+        """
+        pending = self._pending
+        while pending and (len(pending) > limit or pending[0][2].done()):
+            zinfo, size, future = pending.popleft()
+            data, crc = future.result()
+            write_raw(self, zinfo, RawEntry(ZIP_DEFLATED, size, crc, data))
+
+
+    def close(self):
+        if self.fp is None:
+            return
+        try:
+            self._write_pending(0)
+        finally:
+            self._executor.shutdown()
+            super().close()
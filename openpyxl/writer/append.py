@@ -0,0 +1,364 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Append rows to a worksheet in an existing file without loading the workbook
+
+The XML of the worksheet is copied as it is and the new rows are added to the
+end of its sheetData. Other parts of the package are copied without being
+inflated, apart from the stylesheet if new styles are used.
+"""
+
+import os
+import re
+from shutil import copymode
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP64_LIMIT
+
+from openpyxl.packaging.archive import copy_raw
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.styles.stylesheet import apply_stylesheet, build_stylesheet
+from openpyxl.utils.cell import get_column_letter, range_boundaries
+from openpyxl.worksheet._row_writer import RowWriter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.xml.constants import ARC_STYLE, SHEET_MAIN_NS
+
+CHUNK_SIZE = 1024 * 1024
+
+_PREFIX = rb"(?:([A-Za-z_][\w.-]*):)?"
+_DIMENSION = re.compile(rb"<" + _PREFIX + rb"""dimension\s[^>]*?ref\s*=\s*["']([^"']*)["']""")
+_ROW = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?row[\s/>][^>]*")
+_ROW_IDX = re.compile(rb"""\sr\s*=\s*["'](\d+)["']""")
+_SHEET_DATA_END = re.compile(rb"</" + _PREFIX + rb"sheetData\s*>|<" + _PREFIX + rb"sheetData\s*/>")
+
+
+def _chunks(src, size=CHUNK_SIZE):
+    """
+    Read XML in chunks that stop before the start of a tag so that no tag
+    is split between chunks
+    """
+    tail = b""
+    while True:
+        data = src.read(size)
+        if not data:
+            if tail:
+                yield tail
+            return
+        data = tail + data
+        idx = data.rfind(b"<")
+        if idx > 0:
+            yield data[:idx]
+            tail = data[idx:]
+        else:
+            tail = data
+
+
+def _search(pattern, chunk, name):
+    """
+    Search for a tag, starting from the first mention of its name
+    """
+    idx = chunk.find(name)
+    if idx == -1:
+        return None
+    return pattern.search(chunk, max(chunk.rfind(b"<", 0, idx), 0))
+
+
+def _last_row(tags, last):
+    """
+    Index of the last of a sequence of row tags. Rows without an index
+    follow on from the one before
+    """
+    following = 0
+    for tag in reversed(tags):
+        match = _ROW_IDX.search(tag)
+        if match is not None:
+            return int(match.group(1)) + following
+        following += 1
+    return last + following
+
+
+class RowAppender:
+    """
+    Append rows to the end of a worksheet in an existing file.
+
+    Rows are written as they are appended so only the file being read and
+    the new rows are held on disk. The file is replaced when the appender
+    is closed unless `out` is given.
+
+    Cells with styles can be created using the `worksheet` property, which
+    is a write-only worksheet that uses the styles of the file::
+
+        with RowAppender("log.xlsx") as appender:
+            cell = WriteOnlyCell(appender.worksheet, value=42)
+            cell.font = Font(bold=True)
+            appender.append(["answer", cell])
+    """
+
+    def __init__(self, filename, sheetname=None, out=None):
+        if out is None and not isinstance(filename, (str, os.PathLike)):
+            raise ValueError("out must be given when appending to a file object")
+        self.filename = filename
+        self.out = out
+
+        reader = ExcelReader(filename, keep_vba=False, keep_links=False)
+        self._reader = reader
+        try:
+            reader.read_manifest()
+            reader.read_workbook()
+            wb = reader.wb
+            apply_stylesheet(reader.archive, wb)
+            self._path, title = self._find_sheet(sheetname)
+            self._scan()
+        except Exception:
+            reader.archive.close()
+            raise
+
+        self._styles = self._count_styles(wb)
+        self._ws = WriteOnlyWorksheet(wb, title)
+        self._rows = SpooledTemporaryFile(max_size=CHUNK_SIZE)
+        self._writer = RowWriter(self._ws, self._write)
+        self._min_col = None
+        self._max_col = 0
+        self._first_row = self.max_row + 1
+        self.closed = False
+
+
+    def _find_sheet(self, sheetname):
+        parser = self._reader.parser
+        sheets = list(parser.find_sheets())
+        if sheetname is None:
+            sheet, rel = sheets[parser.wb._active_sheet_index]
+        else:
+            for sheet, rel in sheets:
+                if sheet.name == sheetname:
+                    break
+            else:
+                raise KeyError("Worksheet {0} does not exist.".format(sheetname))
+        if "chartsheet" in rel.Type:
+            raise ValueError("{0} is not a worksheet".format(sheet.name))
+        return rel.target, sheet.name
+
+
+    def _scan(self):
+        """
+        Find the dimensions of the worksheet and the last row of sheetData
+        """
+        self._dimension = None
+        self._prefix = None
+        last = 0
+        with self._reader.archive.open(self._path) as src:
+            for chunk in _chunks(src):
+                if self._prefix is None:
+                    # dimension comes before sheetData
+                    match = _search(_DIMENSION, chunk, b"dimension")
+                    if match is not None:
+                        self._dimension = match.group(2).decode()
+                    if b"sheetData" in chunk:
+                        self._prefix = b""
+                end = _search(_SHEET_DATA_END, chunk, b"sheetData")
+                if end is not None:
+                    chunk = chunk[:end.start()]
+                last = _last_row(_ROW.findall(chunk), last)
+                if end is not None:
+                    self._prefix = end.group(1) or end.group(2) or b""
+                    break
+            else:
+                raise ValueError("{0} has no sheetData".format(self._path))
+        self.max_row = last
+
+
+    @staticmethod
+    def _count_styles(wb):
+        return (len(wb._cell_styles), len(wb._named_styles), len(wb._number_formats))
+
+
+    @property
+    def worksheet(self):
+        """
+        Write-only worksheet to be used as the parent of cells
+        """
+        return self._ws
+
+
+    def _write(self, data):
+        if self._prefix:
+            data = data.replace(b"<row ", b'<row xmlns="%s" ' % SHEET_MAIN_NS.encode())
+        self._rows.write(data)
+
+
+    def _track(self, cells):
+        for cell in cells:
+            if cell.comment is not None or cell.hyperlink is not None:
+                raise ValueError("Comments and hyperlinks cannot be appended")
+            column = cell.column
+            if self._min_col is None or column < self._min_col:
+                self._min_col = column
+            if column > self._max_col:
+                self._max_col = column
+            yield cell
+
+
+    def append(self, row):
+        """
+        Add a row after the last row of the worksheet
+
+        :param row: iterable containing values or write-only cells
+        """
+        if self.closed:
+            raise ValueError("Rows cannot be appended once the appender is closed")
+        row_idx = self.max_row + 1
+        cells = self._ws._values_to_row(row, row_idx)
+        buf = self._writer._buf
+        mark = len(buf)
+        try:
+            self._writer.write_row(self._track(cells), row_idx)
+        except Exception:
+            # leave out the partial row
+            del buf[mark:]
+            raise
+        self.max_row = row_idx
+
+
+    def _dimensions(self):
+        """
+        Reference covering the existing cells and the new ones
+        """
+        if self._dimension is None or self._min_col is None:
+            return self._dimension
+        bounds = [self._min_col, self._first_row, self._max_col, self.max_row]
+        if self._first_row > 1:
+            old = range_boundaries(self._dimension)
+            if None not in old:
+                bounds = [min(bounds[0], old[0]), min(bounds[1], old[1]),
+                          max(bounds[2], old[2]), bounds[3]]
+        min_col, min_row, max_col, max_row = bounds
+        return "{0}{1}:{2}{3}".format(get_column_letter(min_col), min_row,
+                                      get_column_letter(max_col), max_row)
+
+
+    def _write_sheet(self, source, archive):
+        info = source.getinfo(self._path)
+        zinfo = ZipInfo(self._path, date_time=info.date_time)
+        zinfo.compress_type = ZIP_DEFLATED
+        zinfo.external_attr = info.external_attr
+        added = self._rows.tell()
+        self._rows.seek(0)
+        dimension = self._dimensions()
+
+        with source.open(self._path) as src, \
+             archive.open(zinfo, "w", force_zip64=info.file_size + added > ZIP64_LIMIT // 2) as out:
+            chunks = _chunks(src)
+            for chunk in chunks:
+                if dimension != self._dimension:
+                    match = _search(_DIMENSION, chunk, b"dimension")
+                    if match is not None:
+                        chunk = chunk[:match.start(2)] + dimension.encode() + chunk[match.end(2):]
+                        dimension = self._dimension
+                end = _search(_SHEET_DATA_END, chunk, b"sheetData")
+                if end is None:
+                    out.write(chunk)
+                    continue
+
+                out.write(chunk[:end.start()])
+                prefix = self._prefix and self._prefix + b":"
+                if end.group(0).startswith(b"</"):
+                    tail = chunk[end.start():]
+                else:
+                    out.write(b"<%ssheetData>" % prefix)
+                    tail = b"</%ssheetData>" % prefix + chunk[end.end():]
+                while True:
+                    data = self._rows.read(CHUNK_SIZE)
+                    if not data:
+                        break
+                    out.write(data)
+                out.write(tail)
+                break
+            for chunk in chunks:
+                out.write(chunk)
+
+
+    def close(self):
+        """
+        Write the new rows and replace the file or write it to `out`
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self._writer.flush()
+        source = self._reader.archive
+        wb = self._reader.wb
+
+        styles = None
+        if self._count_styles(wb) != self._styles:
+            if ARC_STYLE not in source.NameToInfo:
+                raise ValueError("Styles cannot be added to a workbook without a stylesheet")
+            styles = build_stylesheet(wb).to_xml()
+
+        out = self.out
+        tmp = None
+        if out is None:
+            folder = os.path.dirname(os.path.abspath(self.filename))
+            tmp = out = NamedTemporaryFile(dir=folder, suffix=".xlsx", delete=False)
+
+        try:
+            with ZipFile(out, "w", ZIP_DEFLATED, allowZip64=True) as archive:
+                for info in source.infolist():
+                    name = info.filename
+                    if name == self._path:
+                        self._write_sheet(source, archive)
+                    elif name == ARC_STYLE and styles is not None:
+                        zinfo = ZipInfo(name, date_time=info.date_time)
+                        zinfo.compress_type = ZIP_DEFLATED
+                        zinfo.external_attr = info.external_attr
+                        archive.writestr(zinfo, styles)
+                    else:
+                        copy_raw(source, archive, name)
+        except Exception:
+            if tmp is not None:
+                tmp.close()
+                os.remove(tmp.name)
+            raise
+        finally:
+            source.close()
+            self._rows.close()
+
+        if tmp is not None:
+            tmp.close()
+            copymode(self.filename, tmp.name)
+            os.replace(tmp.name, self.filename)
+
+
+    def discard(self):
+        """
+        Close without writing anything
+        """
+        if not self.closed:
+            self.closed = True
+            self._reader.archive.close()
+            self._rows.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def append_rows(filename, rows, sheetname=None, out=None):
+    """
+    Append rows to a worksheet of an existing file and return the index of
+    the last row
+
+    :param filename: the path of the file or a file-like object
+    :param rows: iterable of rows, each an iterable of values or cells
+    :param sheetname: name of the worksheet, by default the active one
+    :param out: where to write the result, by default the file is replaced
+    """
+    with RowAppender(filename, sheetname, out) as appender:
+        for row in rows:
+            appender.append(row)
+    return appender.max_row
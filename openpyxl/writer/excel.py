@@ -3,9 +3,14 @@
 """Write a .xlsx file."""
 
 # Python stdlib imports
+from concurrent.futures import Future
+import os
 import re
+from shutil import copyfileobj
+from queue import Queue, Empty
 from tempfile import TemporaryFile
-from zipfile import ZipFile, ZIP_DEFLATED
+from threading import Event, Thread
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP64_LIMIT
 
 # package imports
 from openpyxl.compat import deprecated
@@ -24,11 +29,14 @@ from openpyxl.xml.constants import (
     PACKAGE_DRAWINGS,
     PACKAGE_CHARTS,
     PACKAGE_IMAGES,
-    PACKAGE_XL
+    PACKAGE_XL,
+    SHARED_STRINGS,
     )
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.workbook._snapshot import snapshot_workbook
 from openpyxl.xml.functions import tostring, fromstring, Element
-from openpyxl.packaging.manifest import Manifest
+from openpyxl.packaging.archive import read_raw, write_raw
+from openpyxl.packaging.manifest import Manifest, Override
 from openpyxl.packaging.relationship import (
     get_rels_path,
     RelationshipList,
@@ -36,11 +44,16 @@ from openpyxl.packaging.relationship import (
 )
 from openpyxl.comments.comment_sheet import CommentSheet
 from openpyxl.packaging.extended import ExtendedProperties
-from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.styles.stylesheet import build_stylesheet
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.worksheet._writer import WorksheetWriter
 from openpyxl.workbook._writer import WorkbookWriter
+from .strings import write_string_table, SharedStringFile
+from ._zip import ParallelZipFile
 from .theme import theme_xml
 
+CHUNK_SIZE = 64 * 1024
+
 
 class ExcelWriter(object):
     """Write a workbook object to an Excel file."""
@@ -64,7 +77,7 @@ class ExcelWriter(object):
         archive = self._archive
 
         props = ExtendedProperties()
-        archive.writestr(ARC_APP, tostring(props.to_tree()))
+        archive.writestr(ARC_APP, props.to_xml())
 
         archive.writestr(ARC_CORE, tostring(self.workbook.properties.to_tree()))
         if self.workbook.loaded_theme:
@@ -77,12 +90,12 @@ class ExcelWriter(object):
         self._write_images()
         self._write_charts()
 
-        #self._archive.writestr(ARC_SHARED_STRINGS,
-                              #write_string_table(self.workbook.shared_strings))
+        if self.workbook.use_shared_strings:
+            self._write_shared_strings()
         self._write_external_links()
 
-        stylesheet = write_stylesheet(self.workbook)
-        archive.writestr(ARC_STYLE, tostring(stylesheet))
+        stylesheet = build_stylesheet(self.workbook)
+        archive.writestr(ARC_STYLE, stylesheet.to_xml())
 
         writer = WorkbookWriter(self.workbook)
         archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
@@ -104,16 +117,31 @@ class ExcelWriter(object):
         )
                              )
 
-        if self.workbook.vba_archive:
-            for name in set(self.workbook.vba_archive.namelist()) - self.vba_modified:
+        vba_archive = self.workbook.vba_archive
+        if vba_archive:
+            for name in set(vba_archive.namelist()) - self.vba_modified:
                 if ARC_VBA.match(name):
-                    self._archive.writestr(name, self.workbook.vba_archive.read(name))
+                    write_raw(self._archive, name, read_raw(vba_archive, name))
+
+
+    def _write_shared_strings(self):
+        strings = self.workbook.shared_strings
+        if isinstance(strings, SharedStringFile):
+            strings._write(self._archive)
+        else:
+            self._archive.writestr(ARC_SHARED_STRINGS, write_string_table(strings))
+        self.manifest.Override.append(Override("/" + ARC_SHARED_STRINGS, SHARED_STRINGS))
 
 
     def _write_images(self):
         # delegate to object
         for img in self._images:
-            self._archive.writestr(img.path[1:], img._data())
+            raw = img._raw()
+            if raw is not None:
+                # copy images that have not been replaced without recompressing
+                write_raw(self._archive, img.path[1:], raw)
+            else:
+                self._archive.writestr(img.path[1:], img._data())
 
 
     def _write_charts(self):
@@ -169,7 +197,7 @@ class ExcelWriter(object):
         cs = CommentSheet.from_comments(ws._comments)
         self._comments.append(cs)
         cs._id = len(self._comments)
-        self._archive.writestr(cs.path[1:], tostring(cs.to_tree()))
+        self._archive.writestr(cs.path[1:], cs.to_xml())
         self.manifest.append(cs)
 
         if ws.legacy_drawing is None or self.workbook.vba_archive is None:
@@ -195,12 +223,25 @@ class ExcelWriter(object):
             if not ws.closed:
                 ws.close()
             writer = ws._writer
+            if hasattr(writer.out, "read"):
+                src = writer.out
+                size = src.seek(0, os.SEEK_END)
+                src.seek(0)
+                with self._archive.open(ws.path[1:], "w", force_zip64=size > ZIP64_LIMIT) as out:
+                    copyfileobj(src, out)
+                src.close()
+            else:
+                self._archive.write(writer.out, ws.path[1:])
         else:
-            writer = WorksheetWriter(ws)
-            writer.write()
+            # the size is not known in advance, allow for large worksheets
+            with self._archive.open(ws.path[1:], "w", force_zip64=True) as out:
+                writer = WorksheetWriter(ws, out=out)
+                try:
+                    writer.write()
+                finally:
+                    writer.close()
 
         ws._rels = writer._rels
-        self._archive.write(writer.out, ws.path[1:])
         self.manifest.append(ws)
         writer.cleanup()
 
@@ -209,6 +250,10 @@ class ExcelWriter(object):
 
         pivot_caches = set()
 
+        if self.workbook.use_shared_strings and not self.workbook.write_only:
+            # strings are added as the worksheets are written
+            self.workbook.shared_strings = IndexedList()
+
         for idx, ws in enumerate(self.workbook.worksheets, 1):
 
             ws._id = idx
@@ -272,11 +317,88 @@ class ExcelWriter(object):
 
     def save(self):
         """Write data into the archive."""
-        self.write_data()
-        self._archive.close()
+        try:
+            self.write_data()
+        finally:
+            self._archive.close()
+
+
+class _Stream:
+    """
+    Write-only file that passes data on in chunks
+    """
+
+    def __init__(self, write, chunk_size=CHUNK_SIZE):
+        self._write = write
+        self.chunk_size = chunk_size
+        self._buf = bytearray()
+
+
+    def write(self, data):
+        self._buf += data
+        if len(self._buf) >= self.chunk_size:
+            self.flush()
+        return len(data)
+
+
+    def flush(self):
+        if self._buf:
+            self._write(bytes(self._buf))
+            self._buf = bytearray()
+
 
+class _Stopped(Exception):
+    pass
 
-def save_workbook(workbook, filename):
+
+def stream_workbook(workbook, chunk_size=CHUNK_SIZE, **options):
+    """
+    Save the workbook in another thread and yield the file in chunks of
+    bytes as they are written. Options are passed to `save_workbook`.
+
+    At most a few chunks are held at a time. The workbook must not be
+    changed until all chunks have been read or the iterator is closed.
+    """
+    chunks = Queue(maxsize=4)
+    stopped = Event()
+    finished = object()
+
+    def write(chunk):
+        if stopped.is_set():
+            raise _Stopped()
+        chunks.put(chunk)
+
+    def save():
+        result = finished
+        try:
+            save_workbook(workbook, _Stream(write, chunk_size), **options)
+        except BaseException as e:
+            result = e
+        chunks.put(result)
+
+    thread = Thread(target=save, name="openpyxl-save", daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is finished:
+                break
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        # let the thread finish if the chunks are no longer wanted
+        stopped.set()
+        while thread.is_alive():
+            try:
+                chunks.get(timeout=0.1)
+            except Empty:
+                pass
+        thread.join()
+
+
+def save_workbook(workbook, filename, compression=ZIP_DEFLATED,
+                  compresslevel=None, workers=None):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -285,15 +407,61 @@ def save_workbook(workbook, filename):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param compression: ZIP_DEFLATED or ZIP_STORED to save without compression
+    :type compression: int
+
+    :param compresslevel: zlib compression level from 0 to 9
+    :type compresslevel: int
+
+    :param workers: number of threads used to compress parts in parallel. The default is to compress them one after another
+    :type workers: int
+
     :rtype: bool
 
     """
-    archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
+    if hasattr(filename, "write") and not hasattr(filename, "flush"):
+        filename = _Stream(filename.write)
+    if compression == ZIP_DEFLATED and workers is not None and workers > 1:
+        archive = ParallelZipFile(filename, compresslevel=compresslevel, workers=workers)
+    elif compresslevel is not None:
+        archive = ZipFile(filename, 'w', compression, allowZip64=True,
+                          compresslevel=compresslevel)
+    else:
+        archive = ZipFile(filename, 'w', compression, allowZip64=True)
     writer = ExcelWriter(workbook, archive)
     writer.save()
     return True
 
 
+def save_in_background(workbook, filename, **options):
+    """
+    Save a copy of the workbook in another thread. Options are passed to
+    `save_workbook`.
+
+    The copy is made before returning so the workbook can be changed
+    straight away. Write-only workbooks are saved as they are.
+
+    :rtype: :class:`concurrent.futures.Future` for the result of `save_workbook`
+    """
+    if not workbook.write_only:
+        workbook = snapshot_workbook(workbook)
+    future = Future()
+
+    def save():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = save_workbook(workbook, filename, **options)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    # not a daemon so that the file is finished before the interpreter exits
+    Thread(target=save, name="openpyxl-save").start()
+    return future
+
+
 @deprecated("Use a NamedTemporaryFile")
 def save_virtual_workbook(workbook):
     """Return an in-memory workbook, suitable for a Django response."""
@@ -0,0 +1,88 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""Write the shared string table"""
+
+from collections import OrderedDict
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+
+from openpyxl.xml.constants import ARC_SHARED_STRINGS, SHEET_MAIN_NS
+from openpyxl.worksheet._row_writer import _escape
+
+
+def _string_item(value):
+    """
+    Return a string as an <si> element
+    """
+    text = _escape(value)
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    text = text.encode("utf-8", "xmlcharrefreplace")
+    if value != value.strip():
+        return b'<si><t xml:space="preserve">' + text + b'</t></si>'
+    return b"<si><t>" + text + b"</t></si>"
+
+
+def _header(count):
+    return b'<sst xmlns="%s" uniqueCount="%d">' % (SHEET_MAIN_NS.encode(), count)
+
+
+def write_string_table(string_table):
+    """Write the string table xml."""
+    items = [_header(len(string_table))]
+    items.extend(_string_item(value) for value in string_table)
+    items.append(b"</sst>")
+    return b"".join(items)
+
+
+class SharedStringFile:
+    """
+    Shared string table for write-only workbooks that is kept in a
+    temporary file.
+
+    Only the most recently used strings are remembered so that memory use
+    is bounded. A string that has been forgotten is added again if it is
+    used, so the table may contain duplicates.
+    """
+
+    def __init__(self, cache_size=100000):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._file = TemporaryFile()
+        self._count = 0
+
+
+    def __len__(self):
+        return self._count
+
+
+    def add(self, value):
+        cache = self._cache
+        try:
+            idx = cache[value]
+            cache.move_to_end(value)
+            return idx
+        except KeyError:
+            pass
+        idx = self._count
+        self._file.write(_string_item(value))
+        self._count += 1
+        cache[value] = idx
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return idx
+
+
+    def _write(self, archive):
+        """
+        Copy the table to the archive and remove the temporary file
+        """
+        src = self._file
+        size = src.tell()
+        src.seek(0)
+        with archive.open(ARC_SHARED_STRINGS, "w", force_zip64=size > 2**30) as out:
+            out.write(_header(self._count))
+            copyfileobj(src, out)
+            out.write(b"</sst>")
+        src.close()
+        self._cache.clear()
@@ -0,0 +1,207 @@
+# Copyright (c) 2010-2022 openpyxl
+
+import datetime
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.comments import Comment
+from openpyxl.styles import Font
+from openpyxl.xml.constants import ARC_STYLE
+
+
+@pytest.fixture
+def RowAppender():
+    from ..append import RowAppender
+    return RowAppender
+
+
+@pytest.fixture
+def workbook():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for idx in range(1, 4):
+        ws.append([idx, "value"])
+    wb.create_sheet("Other")["A1"] = "other"
+    out = BytesIO()
+    wb.save(out)
+    return out
+
+
+def _values(src, title):
+    wb = load_workbook(src)
+    ws = wb[title]
+    return ws, [[c.value for c in row] for row in ws.iter_rows()]
+
+
+def _replace(src, name, xml):
+    out = BytesIO()
+    with ZipFile(src) as source, ZipFile(out, "w") as archive:
+        for info in source.infolist():
+            data = source.read(info.filename)
+            if info.filename == name:
+                data = xml
+            archive.writestr(info, data)
+    return out
+
+
+@pytest.mark.parametrize("tags, last",
+                         [
+                             ([], 3),
+                             ([b'<row r="5"', b'<row'], 6),
+                             ([b'<row', b'<row'], 5),
+                             ([b"<x:row spans='1:2' r='9'"], 9),
+                         ]
+                         )
+def test_last_row(tags, last):
+    from ..append import _last_row
+    assert _last_row(tags, 3) == last
+
+
+def test_chunks():
+    from ..append import _chunks
+    xml = b"<a><b>text</b><c /></a>"
+    chunks = list(_chunks(BytesIO(xml), size=4))
+    assert b"".join(chunks) == xml
+    assert all(chunk.count(b"<") == chunk.count(b">") for chunk in chunks)
+
+
+class TestRowAppender:
+
+
+    def test_ctor(self, RowAppender, workbook):
+        appender = RowAppender(workbook, out=BytesIO())
+        assert appender.max_row == 3
+        assert appender._dimension == "A1:B3"
+        assert appender._path == "xl/worksheets/sheet1.xml"
+        assert appender.worksheet.title == "Data"
+        appender.discard()
+
+
+    def test_append(self, RowAppender, workbook):
+        out = BytesIO()
+        with RowAppender(workbook, "Data", out=out) as appender:
+            appender.append([4, "new", datetime.date(2022, 1, 1)])
+            appender.append([])
+            appender.append(["=A1*2"])
+        assert appender.max_row == 6
+
+        ws, values = _values(out, "Data")
+        assert values == [
+            [1, "value", None],
+            [2, "value", None],
+            [3, "value", None],
+            [4, "new", datetime.datetime(2022, 1, 1)],
+            [None, None, None],
+            ["=A1*2", None, None],
+        ]
+        assert ws["C4"].number_format == "yyyy-mm-dd"
+        _, values = _values(out, "Other")
+        assert values == [["other"]]
+
+        with ZipFile(out) as archive:
+            xml = archive.read("xl/worksheets/sheet1.xml")
+        assert b'<dimension ref="A1:C6"' in xml
+
+
+    def test_other_parts_copied(self, RowAppender, workbook):
+        out = BytesIO()
+        with RowAppender(workbook, out=out) as appender:
+            appender.append([4])
+
+        with ZipFile(workbook) as source, ZipFile(out) as archive:
+            assert archive.namelist() == source.namelist()
+            info = archive.getinfo(ARC_STYLE)
+            assert info.CRC == source.getinfo(ARC_STYLE).CRC
+            assert info.compress_size == source.getinfo(ARC_STYLE).compress_size
+
+
+    def test_new_style(self, RowAppender, workbook):
+        out = BytesIO()
+        with RowAppender(workbook, out=out) as appender:
+            cell = WriteOnlyCell(appender.worksheet, value="bold")
+            cell.font = Font(bold=True)
+            appender.append([None, cell])
+
+        ws, values = _values(out, "Data")
+        assert values[-1] == [None, "bold"]
+        assert ws["B4"].font.b is True
+
+
+    def test_comment(self, RowAppender, workbook):
+        out = BytesIO()
+        with RowAppender(workbook, out=out) as appender:
+            cell = WriteOnlyCell(appender.worksheet, value="note")
+            cell.comment = Comment("text", "author")
+            with pytest.raises(ValueError):
+                appender.append([1, cell])
+            appender.append([2])
+        assert appender.max_row == 4
+        _, values = _values(out, "Data")
+        assert values[3:] == [[2, None]]
+
+
+    def test_empty_sheet_data(self, RowAppender, workbook):
+        xml = b"""<?xml version="1.0"?>
+        <x:worksheet xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <x:dimension ref="A1" />
+          <x:sheetData />
+        </x:worksheet>"""
+        src = _replace(workbook, "xl/worksheets/sheet1.xml", xml)
+        out = BytesIO()
+        with RowAppender(src, out=out) as appender:
+            appender.append([None, "first"])
+
+        _, values = _values(out, "Data")
+        assert values == [[None, "first"]]
+        with ZipFile(out) as archive:
+            xml = archive.read("xl/worksheets/sheet1.xml")
+        assert b'<x:dimension ref="B1:B1" />' in xml
+
+
+    def test_rows_without_index(self, RowAppender, workbook):
+        xml = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <sheetData><row r="2"><c><v>1</v></c></row><row><c><v>2</v></c></row></sheetData>
+        </worksheet>"""
+        src = _replace(workbook, "xl/worksheets/sheet1.xml", xml)
+        with RowAppender(src, out=BytesIO()) as appender:
+            assert appender.max_row == 3
+            assert appender._dimension is None
+
+
+    def test_chartsheet(self, RowAppender, workbook):
+        wb = Workbook()
+        wb.create_chartsheet("Chart")
+        src = BytesIO()
+        wb.save(src)
+        with pytest.raises(ValueError):
+            RowAppender(src, "Chart", out=BytesIO())
+
+
+    def test_missing_sheet(self, RowAppender, workbook):
+        with pytest.raises(KeyError):
+            RowAppender(workbook, "Missing", out=BytesIO())
+
+
+    def test_file_object_needs_out(self, RowAppender, workbook):
+        with pytest.raises(ValueError):
+            RowAppender(workbook)
+
+
+def test_append_rows(tmpdir):
+    from ..append import append_rows
+
+    tmpdir.chdir()
+    wb = Workbook()
+    wb.active.append(["header"])
+    wb.save("log.xlsx")
+
+    assert append_rows("log.xlsx", [[1], [2]]) == 3
+    assert append_rows("log.xlsx", [[3]]) == 4
+    _, values = _values("log.xlsx", "Sheet")
+    assert values == [["header"], [1], [2], [3]]
+    assert tmpdir.listdir() == [tmpdir.join("log.xlsx")]
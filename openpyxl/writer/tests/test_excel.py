@@ -4,7 +4,7 @@
 from io import BytesIO
 import os
 from string import ascii_letters
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 import pytest
 
@@ -39,6 +39,53 @@ def test_worksheet(ExcelWriter, archive):
     assert ws.path in writer.manifest.filenames
 
 
+def test_worksheet_no_temporary_file(ExcelWriter, archive, monkeypatch):
+    from openpyxl.worksheet import _writer
+    monkeypatch.setattr(_writer, "create_temporary_file", None)
+    wb = Workbook()
+    ws = wb.active
+    ws.append([1, "a"])
+    writer = ExcelWriter(wb, archive)
+    writer._write_worksheets()
+
+    xml = archive.read(ws.path[1:])
+    assert b'<v>1</v>' in xml
+
+
+def test_worksheet_zip64(ExcelWriter, archive, monkeypatch):
+    calls = []
+    open_entry = archive.open
+
+    def record(name, mode="r", **kw):
+        calls.append((name, kw.get("force_zip64")))
+        return open_entry(name, mode, **kw)
+
+    monkeypatch.setattr(archive, "open", record)
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "a" * 100
+    writer = ExcelWriter(wb, archive)
+    writer._write_worksheets()
+
+    assert calls == [(ws.path[1:], True)]
+
+
+@pytest.mark.parametrize("buffer_size", [None, 0, 10])
+def test_write_only_buffer(ExcelWriter, archive, buffer_size):
+    wb = Workbook(write_only=True)
+    wb.buffer_size = buffer_size
+    ws = wb.create_sheet()
+    for i in range(10):
+        ws.append([i, "a"])
+    out = ws._writer.out
+    writer = ExcelWriter(wb, archive)
+    writer._write_worksheets()
+
+    assert (buffer_size is None) == isinstance(out, str)
+    xml = archive.read(ws.path[1:])
+    assert b'<v>9</v>' in xml
+
+
 def test_tables(ExcelWriter, archive):
     wb = Workbook()
     ws = wb.active
@@ -161,6 +208,11 @@ def test_merge_vba(ExcelWriter, archive, datadir):
         'xl/ctrlProps/ctrlProp8.xml',
         'xl/ctrlProps/ctrlProp2.xml',
     ])
+    # copied as they are stored
+    for name in archive.namelist():
+        src = wb.vba_archive.getinfo(name)
+        info = archive.getinfo(name)
+        assert (info.CRC, info.compress_size) == (src.CRC, src.compress_size)
 
 
 def test_duplicate_chart(ExcelWriter, archive):
@@ -189,3 +241,114 @@ def test_write_virtual_workbook():
     saved_wb = save_virtual_workbook(old_wb)
     new_wb = load_workbook(BytesIO(saved_wb))
     assert new_wb
+
+
+def test_write_unseekable():
+    chunks = []
+
+    class Sink:
+
+        def write(self, data):
+            chunks.append(data)
+
+    wb = Workbook()
+    wb.active["A1"] = 1
+    wb.save(Sink())
+    wb = load_workbook(BytesIO(b"".join(chunks)))
+    assert wb.active["A1"].value == 1
+
+
+class TestStream:
+
+
+    @pytest.mark.parametrize("write_only", [False, True])
+    def test_chunks(self, write_only):
+        wb = Workbook(write_only=write_only)
+        ws = wb.create_sheet() if write_only else wb.active
+        for idx in range(1000):
+            ws.append([idx, ascii_letters[idx % 52] * 50])
+        chunks = list(wb.save_stream(chunk_size=1024))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 1024 for chunk in chunks[:-1])
+        wb = load_workbook(BytesIO(b"".join(chunks)))
+        assert wb.worksheets[-1]["A1000"].value == 999
+
+
+    def test_close(self):
+        from ..excel import stream_workbook
+        wb = Workbook()
+        for idx in range(1000):
+            wb.active.append([idx] * 10)
+        chunks = stream_workbook(wb, chunk_size=1024)
+        next(chunks)
+        chunks.close()
+        # the workbook can still be saved
+        assert load_workbook(BytesIO(b"".join(wb.save_stream())))
+
+
+    def test_error(self):
+        from datetime import datetime, timezone
+        wb = Workbook()
+        wb.active["A1"] = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        with pytest.raises(TypeError):
+            list(wb.save_stream())
+
+
+class TestBackground:
+
+
+    def test_save(self):
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = 1
+        out = BytesIO()
+        future = wb.save_in_background(out)
+        ws["A1"] = 2
+        ws["A2"] = 3
+        assert future.result() is True
+        wb = load_workbook(out)
+        assert wb.active["A1"].value == 1
+        assert wb.active.max_row == 1
+
+
+    def test_error(self):
+        from datetime import datetime, timezone
+        wb = Workbook()
+        wb.active["A1"] = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        future = wb.save_in_background(BytesIO())
+        assert isinstance(future.exception(), TypeError)
+
+
+    def test_write_only(self):
+        wb = Workbook(write_only=True)
+        wb.create_sheet().append([1])
+        out = BytesIO()
+        assert wb.save_in_background(out).result() is True
+        assert load_workbook(out).active["A1"].value == 1
+
+
+@pytest.mark.pil_required
+def test_copy_images(datadir):
+    from openpyxl.drawing.image import Image
+    datadir.chdir()
+    wb = Workbook()
+    ws = wb.active
+    ws.add_image(Image("plain.png"))
+    ws.add_image(Image("plain.png"), "C1")
+    src = BytesIO()
+    wb.save(src, compression=ZIP_STORED)
+
+    wb = load_workbook(src)
+    ws = wb.active
+    ws._images[1].ref = "plain.png"
+    out = BytesIO()
+    wb.save(out)
+
+    with ZipFile(out) as archive:
+        assert archive.testzip() is None
+        copied = archive.getinfo("xl/media/image1.png")
+        replaced = archive.getinfo("xl/media/image2.png")
+    assert copied.compress_type == ZIP_STORED
+    assert replaced.compress_type == ZIP_DEFLATED
+    assert copied.CRC == replaced.CRC
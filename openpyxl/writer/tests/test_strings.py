@@ -0,0 +1,86 @@
+# Copyright (c) 2010-2022 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.reader.strings import read_string_table
+from openpyxl.tests.helper import compare_xml
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.xml.constants import ARC_SHARED_STRINGS
+
+
+def test_write_string_table(datadir):
+    from ..strings import write_string_table
+
+    datadir.chdir()
+    table = IndexedList(['This is cell A1 in Sheet 1', 'This is cell G5'])
+    content = write_string_table(table)
+    with open('sharedStrings.xml') as expected:
+        diff = compare_xml(content, expected.read())
+        assert diff is None, diff
+
+
+def test_round_trip():
+    from ..strings import write_string_table
+
+    table = IndexedList([" space ", "a&b<c>", "line\r\nbreak", "\xe9 中"])
+    content = write_string_table(table)
+    assert read_string_table(BytesIO(content)) == list(table)
+
+
+class TestSharedStringFile:
+
+
+    def test_add(self):
+        from ..strings import SharedStringFile
+
+        strings = SharedStringFile(cache_size=2)
+        assert [strings.add(s) for s in "abab"] == [0, 1, 0, 1]
+        assert strings.add("c") == 2
+        assert strings.add("a") == 3 # forgotten
+        assert strings.add("c") == 2
+        assert len(strings) == 4
+
+
+    def test_write(self):
+        from ..strings import SharedStringFile
+
+        strings = SharedStringFile()
+        for value in ["a", " b ", "a"]:
+            strings.add(value)
+        out = BytesIO()
+        with ZipFile(out, "w") as archive:
+            strings._write(archive)
+        with ZipFile(out) as archive:
+            with archive.open(ARC_SHARED_STRINGS) as src:
+                assert read_string_table(src) == ["a", " b "]
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+@pytest.mark.parametrize("fast_rows", [False, True])
+def test_save(write_only, fast_rows):
+    from ..strings import SharedStringFile
+
+    wb = Workbook(write_only=write_only)
+    wb.use_shared_strings = True
+    wb.fast_rows = fast_rows
+    if write_only:
+        wb.shared_strings = SharedStringFile(cache_size=1)
+        ws = wb.create_sheet()
+    else:
+        ws = wb.active
+    rows = [["a", 1, "b", " c "], ["a", None, "", "=A1"]]
+    for row in rows:
+        ws.append(row)
+
+    out = BytesIO()
+    wb.save(out)
+
+    with ZipFile(out) as archive:
+        assert ARC_SHARED_STRINGS in archive.namelist()
+    wb = load_workbook(out)
+    values = [[cell.value for cell in row] for row in wb.active.iter_rows()]
+    assert values == [["a", 1, "b", " c "], ["a", None, None, "=A1"]]
@@ -0,0 +1,93 @@
+# Copyright (c) 2010-2022 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+
+
+@pytest.fixture
+def ParallelZipFile():
+    from .._zip import ParallelZipFile
+    return ParallelZipFile
+
+
+class TestParallelZipFile:
+
+
+    def test_writestr(self, ParallelZipFile):
+        big = b"row" * 100000
+        out = BytesIO()
+        with ParallelZipFile(out, workers=2) as archive:
+            archive.writestr("small.xml", "<small />")
+            for idx in range(5):
+                archive.writestr(f"big{idx}.xml", big)
+
+        with ZipFile(out) as archive:
+            assert archive.testzip() is None
+            assert archive.read("small.xml") == b"<small />"
+            assert archive.read("big4.xml") == big
+            info = archive.getinfo("big0.xml")
+            assert info.compress_type == ZIP_DEFLATED
+            assert info.compress_size < info.file_size
+
+
+    def test_open(self, ParallelZipFile):
+        out = BytesIO()
+        with ParallelZipFile(out, compresslevel=1, workers=2) as archive:
+            with archive.open("sheet.xml", "w") as dest:
+                for idx in range(10000):
+                    dest.write(b"<row>%d</row>" % idx)
+
+        with ZipFile(out) as archive:
+            assert archive.read("sheet.xml").endswith(b"<row>9999</row>")
+
+
+    def test_unseekable(self, ParallelZipFile):
+        from .._zip import MIN_SIZE
+
+        class Stream:
+
+            def __init__(self):
+                self.data = BytesIO()
+
+            def write(self, data):
+                return self.data.write(data)
+
+            def flush(self):
+                pass
+
+        out = Stream()
+        with ParallelZipFile(out, workers=2) as archive:
+            archive.writestr("big.xml", b"x" * MIN_SIZE)
+            archive.writestr("small.xml", b"x")
+
+        with ZipFile(out.data) as archive:
+            assert archive.testzip() is None
+
+
+@pytest.mark.parametrize("options",
+                         [
+                             {},
+                             {'compresslevel':1},
+                             {'compression':ZIP_STORED},
+                             {'workers':2},
+                             {'workers':2, 'compresslevel':9},
+                         ]
+                         )
+def test_save(options):
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(5000):
+        ws.append([idx, "value"])
+    wb.create_sheet()
+    out = BytesIO()
+    wb.save(out, **options)
+
+    with ZipFile(out) as archive:
+        info = archive.getinfo("xl/worksheets/sheet1.xml")
+        assert info.compress_type == options.get('compression', ZIP_DEFLATED)
+    wb = load_workbook(out)
+    assert wb.active["A5000"].value == 4999
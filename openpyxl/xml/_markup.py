@@ -0,0 +1,150 @@
+# Copyright (c) 2010-2022 openpyxl
+
+"""
+Write XML as text without building a tree of elements first
+
+The output is the same as `tostring()` would give for the equivalent tree
+except that all namespaces are declared on the outermost element.
+"""
+
+import re
+
+from openpyxl import LXML
+from openpyxl.xml.constants import XML_NS
+from openpyxl.xml.functions import PREFIXES
+
+_ILLEGAL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_ATTR_SPECIAL = re.compile('[&<>"\r\n\t\x00-\x08\x0b\x0c\x0e-\x1f]')
+_TEXT_SPECIAL = re.compile('[&<>\r\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class Markup:
+    """
+    Collect XML as text an element at a time.
+
+    Start tags are left open until it is known whether the element is empty.
+    """
+
+    def __init__(self, lxml=LXML):
+        self._parts = []
+        self._open = False
+        self._namespaces = {}
+        self._names = {}
+        if lxml:
+            self._end_empty = "/>"
+            self._tab = "&#9;"
+            self._text_cr = "&#13;"
+        else:
+            self._end_empty = " />"
+            self._tab = "&#09;"
+            self._text_cr = "\r"
+        self._lxml = lxml
+
+
+    def _check(self, value):
+        # lxml refuses strings that cannot be written as XML
+        if self._lxml and _ILLEGAL.search(value) is not None:
+            raise ValueError("All strings must be XML compatible: Unicode or ASCII, "
+                             "no NULL bytes or control characters")
+
+
+    def _escape_attr(self, value):
+        if _ATTR_SPECIAL.search(value) is None:
+            return value
+        self._check(value)
+        value = value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        value = value.replace('"', "&quot;").replace("\n", "&#10;").replace("\r", "&#13;")
+        return value.replace("\t", self._tab)
+
+
+    def _escape_text(self, value):
+        if _TEXT_SPECIAL.search(value) is None:
+            return value
+        self._check(value)
+        value = value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        return value.replace("\r", self._text_cr)
+
+
+    def _qname(self, tag):
+        """
+        Prefixed name for a tag or attribute in Clark notation
+        """
+        name = self._names.get(tag)
+        if name is None:
+            name = tag
+            if tag[:1] == "{":
+                uri, local = tag[1:].split("}", 1)
+                prefix = self._namespaces.get(uri)
+                if prefix is None:
+                    prefix = PREFIXES.get(uri)
+                    if prefix is None or prefix in self._namespaces.values():
+                        prefix = "ns%d" % len(self._namespaces)
+                    self._namespaces[uri] = prefix
+                name = "%s:%s" % (prefix, local)
+            self._names[tag] = name
+        return name
+
+
+    def start(self, tag, attrs):
+        """
+        Open an element and return the name needed to close it
+        """
+        names = self._names
+        name = names.get(tag) or self._qname(tag)
+        markup = "<" + name
+        for key, value in attrs.items():
+            if _ATTR_SPECIAL.search(value) is not None:
+                value = self._escape_attr(value)
+            markup += ' %s="%s"' % (names.get(key) or self._qname(key), value)
+        if self._open:
+            markup = ">" + markup
+        self._parts.append(markup)
+        self._open = True
+        return name
+
+
+    def text(self, value):
+        if not value:
+            return
+        if self._open:
+            self._parts.append(">")
+            self._open = False
+        self._parts.append(self._escape_text(value))
+
+
+    def end(self, name):
+        if self._open:
+            self._parts.append(self._end_empty)
+            self._open = False
+        else:
+            self._parts.append("</%s>" % name)
+
+
+    def element(self, node):
+        """
+        Add an element and its children
+        """
+        if callable(node.tag):
+            # comments and processing instructions
+            return
+        name = self.start(node.tag, node.attrib)
+        self.text(node.text)
+        for child in node:
+            self.element(child)
+            self.text(child.tail)
+        self.end(name)
+
+
+    def getvalue(self):
+        """
+        The XML as UTF-8 encoded bytes
+        """
+        parts = self._parts
+        if not parts:
+            return b""
+        declarations = ['xmlns:%s="%s"' % (prefix, self._escape_attr(uri))
+                        for uri, prefix in sorted(self._namespaces.items(), key=lambda n: n[1])
+                        if uri != XML_NS]
+        if declarations:
+            parts = [parts[0], " " + " ".join(declarations)] + parts[1:]
+        return "".join(parts).encode("utf-8")
@@ -41,6 +41,12 @@ from xml.etree.ElementTree import iterparse
 if DEFUSEDXML is True:
     from defusedxml.ElementTree import iterparse
 
+if LXML is True:
+    from lxml.etree import iterparse as lxml_iterparse
+    # do not resolve entities or access the network
+    lxml_iterparse = partial(lxml_iterparse, resolve_entities=False,
+                             no_network=True)
+
 from openpyxl.xml.constants import (
     CHART_NS,
     DRAWING_NS,
@@ -55,17 +61,23 @@ from openpyxl.xml.constants import (
     XML_NS
 )
 
-register_namespace(DCTERMS_PREFIX, DCTERMS_NS)
-register_namespace('dcmitype', 'http://purl.org/dc/dcmitype/')
-register_namespace('cp', COREPROPS_NS)
-register_namespace('c', CHART_NS)
-register_namespace('a', DRAWING_NS)
-register_namespace('s', SHEET_MAIN_NS)
-register_namespace('r', REL_NS)
-register_namespace('vt', VTYPES_NS)
-register_namespace('xdr', SHEET_DRAWING_NS)
-register_namespace('cdr', CHART_DRAWING_NS)
-register_namespace('xml', XML_NS)
+# prefixes used when serialising
+PREFIXES = {
+    DCTERMS_NS: DCTERMS_PREFIX,
+    'http://purl.org/dc/dcmitype/': 'dcmitype',
+    COREPROPS_NS: 'cp',
+    CHART_NS: 'c',
+    DRAWING_NS: 'a',
+    SHEET_MAIN_NS: 's',
+    REL_NS: 'r',
+    VTYPES_NS: 'vt',
+    SHEET_DRAWING_NS: 'xdr',
+    CHART_DRAWING_NS: 'cdr',
+    XML_NS: 'xml',
+}
+
+for uri, prefix in PREFIXES.items():
+    register_namespace(prefix, uri)
 
 
 tostring = partial(tostring, encoding="utf-8")
@@ -79,6 +91,20 @@ def localname(node):
     return m.group('localname')
 
 
+def iterparse_tags(source, tags, events=("end",)):
+    """
+    Incrementally parse source returning only the elements in tags.
+
+    With lxml the filtering is done by the parser so that other elements
+    never reach Python. Otherwise events are filtered as they are returned.
+    """
+    if LXML is True:
+        return lxml_iterparse(source, events=events, tag=tuple(tags))
+    tags = frozenset(tags)
+    return ((event, element) for event, element in iterparse(source, events=events)
+            if element.tag in tags)
+
+
 def whitespace(node):
     if node.text != node.text.strip():
         node.set("{%s}space" % XML_NS, "preserve")
@@ -70,3 +70,29 @@ def test_iterparse(xml_input):
     f = BytesIO(xml_input)
     with pytest.raises(ValueError):
         fromstring(f)
+
+
+@pytest.mark.parametrize("events, expected",
+                         [
+                             (("end",), ["b", "d"]),
+                             (("start",), ["b", "d"]),
+                         ]
+                         )
+def test_iterparse_tags(events, expected):
+    from ..functions import iterparse_tags
+    src = BytesIO(b"<a><b><c/></b><c/><d/></a>")
+    tags = [el.tag for _, el in iterparse_tags(src, {"b", "d"}, events)]
+    assert tags == expected
+
+
+@pytest.mark.lxml_required
+def test_iterparse_tags_entities():
+    from ..functions import iterparse_tags
+    src = BytesIO(b"""<?xml version="1.0" encoding="UTF-8"?>
+          <!DOCTYPE foo [
+          <!ENTITY a "1234567890" >
+          <!ENTITY xxe SYSTEM "file:///dev/random" >
+          ]>
+          <foo>&a;&xxe;</foo>""")
+    for _, el in iterparse_tags(src, {"foo"}):
+        assert el.text is None
@@ -0,0 +1,70 @@
+# Copyright (c) 2010-2022 openpyxl
+
+from functools import partial
+
+import pytest
+
+from openpyxl.tests.helper import compare_xml
+from openpyxl.xml.functions import Element, SubElement, tostring
+
+
+@pytest.fixture(params=[True, False], ids=["lxml", "et"])
+def Markup(request):
+    from .. import _markup
+    return partial(_markup.Markup, lxml=request.param)
+
+
+class TestMarkup:
+
+
+    def test_empty(self, Markup):
+        out = Markup()
+        out.end(out.start("root", {}))
+        assert out.getvalue() in (b"<root/>", b"<root />")
+
+
+    def test_escape(self, Markup):
+        out = Markup()
+        name = out.start("root", {"a": '<"&">\n'})
+        out.text("1 < 2 & 3")
+        out.end(name)
+        xml = out.getvalue()
+        assert b'a="&lt;&quot;&amp;&quot;&gt;&#10;"' in xml
+        assert b">1 &lt; 2 &amp; 3</root>" in xml
+
+
+    def test_illegal(self):
+        from .._markup import Markup
+        out = Markup(lxml=True)
+        out.start("root", {})
+        with pytest.raises(ValueError):
+            out.text("\x01")
+
+
+    def test_namespaces(self, Markup):
+        out = Markup()
+        root = out.start("{http://example.com}root", {})
+        child = out.start("child", {"{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id": "rId1"})
+        out.end(child)
+        out.end(root)
+        xml = out.getvalue()
+        expected = """
+        <ns0:root xmlns:ns0="http://example.com"
+          xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+          <child r:id="rId1" />
+        </ns0:root>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert xml.startswith(b'<ns0:root xmlns:ns0="http://example.com" xmlns:r=')
+
+
+    def test_element(self, Markup):
+        root = Element("root", {"a": "1"})
+        root.text = "text"
+        child = SubElement(root, "child")
+        child.tail = "tail"
+        out = Markup()
+        out.element(root)
+        diff = compare_xml(out.getvalue(), tostring(root))
+        assert diff is None, diff